@@ -10,12 +10,19 @@ from .logic_device import (
     INPUT_DEVICE_KIND,
     PROBE_DEVICE_KIND,
     PORT_DEVICE_KIND,
+    VDD,
+    GND,
+    Input,
+    Probe,
+    Port,
 )
 from .transistor import (
     Transistor,
     TransistorKind,
     NMOS_TRANSISTOR_KIND,
     PMOS_TRANSISTOR_KIND,
+    NMOS,
+    PMOS,
 )
 
 __all__ = [
@@ -36,8 +43,15 @@ __all__ = [
     "INPUT_DEVICE_KIND",
     "PROBE_DEVICE_KIND",
     "PORT_DEVICE_KIND",
+    "VDD",
+    "GND",
+    "Input",
+    "Probe",
+    "Port",
     "Transistor",
     "TransistorKind",
     "NMOS_TRANSISTOR_KIND",
     "PMOS_TRANSISTOR_KIND",
+    "NMOS",
+    "PMOS",
 ]
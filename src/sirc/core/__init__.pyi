@@ -1,6 +1,67 @@
-from .logic_device import GND_DEVICE_KIND as GND_DEVICE_KIND, INPUT_DEVICE_KIND as INPUT_DEVICE_KIND, LogicDevice as LogicDevice, LogicDeviceKind as LogicDeviceKind, PORT_DEVICE_KIND as PORT_DEVICE_KIND, PROBE_DEVICE_KIND as PROBE_DEVICE_KIND, VDD_DEVICE_KIND as VDD_DEVICE_KIND
-from .logic_value import LogicValue as LogicValue, ONE as ONE, RESOLVE_TABLE as RESOLVE_TABLE, X as X, Z as Z, ZERO as ZERO
-from .node import BASE_NODE_KIND as BASE_NODE_KIND, GATE_NODE_KIND as GATE_NODE_KIND, Node as Node, NodeKind as NodeKind
-from .transistor import NMOS_TRANSISTOR_KIND as NMOS_TRANSISTOR_KIND, PMOS_TRANSISTOR_KIND as PMOS_TRANSISTOR_KIND, Transistor as Transistor, TransistorKind as TransistorKind
+from .logic_device import (
+    GND as GND,
+    GND_DEVICE_KIND as GND_DEVICE_KIND,
+    INPUT_DEVICE_KIND as INPUT_DEVICE_KIND,
+    Input as Input,
+    LogicDevice as LogicDevice,
+    LogicDeviceKind as LogicDeviceKind,
+    PORT_DEVICE_KIND as PORT_DEVICE_KIND,
+    PROBE_DEVICE_KIND as PROBE_DEVICE_KIND,
+    Port as Port,
+    Probe as Probe,
+    VDD as VDD,
+    VDD_DEVICE_KIND as VDD_DEVICE_KIND,
+)
+from .logic_value import (
+    LogicValue as LogicValue,
+    ONE as ONE,
+    RESOLVE_TABLE as RESOLVE_TABLE,
+    X as X,
+    Z as Z,
+    ZERO as ZERO,
+)
+from .node import (
+    BASE_NODE_KIND as BASE_NODE_KIND,
+    GATE_NODE_KIND as GATE_NODE_KIND,
+    Node as Node,
+    NodeKind as NodeKind,
+)
+from .transistor import (
+    NMOS as NMOS,
+    NMOS_TRANSISTOR_KIND as NMOS_TRANSISTOR_KIND,
+    PMOS as PMOS,
+    PMOS_TRANSISTOR_KIND as PMOS_TRANSISTOR_KIND,
+    Transistor as Transistor,
+    TransistorKind as TransistorKind,
+)
 
-__all__ = ['LogicValue', 'ZERO', 'ONE', 'X', 'Z', 'RESOLVE_TABLE', 'Node', 'NodeKind', 'BASE_NODE_KIND', 'GATE_NODE_KIND', 'LogicDevice', 'LogicDeviceKind', 'GND_DEVICE_KIND', 'VDD_DEVICE_KIND', 'INPUT_DEVICE_KIND', 'PROBE_DEVICE_KIND', 'PORT_DEVICE_KIND', 'Transistor', 'TransistorKind', 'NMOS_TRANSISTOR_KIND', 'PMOS_TRANSISTOR_KIND']
+__all__ = [
+    "LogicValue",
+    "ZERO",
+    "ONE",
+    "X",
+    "Z",
+    "RESOLVE_TABLE",
+    "Node",
+    "NodeKind",
+    "BASE_NODE_KIND",
+    "GATE_NODE_KIND",
+    "LogicDevice",
+    "LogicDeviceKind",
+    "GND_DEVICE_KIND",
+    "VDD_DEVICE_KIND",
+    "INPUT_DEVICE_KIND",
+    "PROBE_DEVICE_KIND",
+    "PORT_DEVICE_KIND",
+    "VDD",
+    "GND",
+    "Input",
+    "Probe",
+    "Port",
+    "Transistor",
+    "TransistorKind",
+    "NMOS_TRANSISTOR_KIND",
+    "PMOS_TRANSISTOR_KIND",
+    "NMOS",
+    "PMOS",
+]
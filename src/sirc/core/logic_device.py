@@ -55,6 +55,11 @@ Meaning:
         device.kind -> LogicDeviceKind
         device.node -> Node
 
+    Kind-specific handles (VDD, GND, Input, Probe, Port) add no state:
+
+        input.set_value(value) -> writes node_default_values[node_id]
+        probe.sample()         -> reads node_resolved_values[node_id]
+
 Module contract
 ---------------
 
@@ -74,6 +79,7 @@ Ownership contract:
 from __future__ import annotations
 from enum import IntEnum
 from typing import Final, TYPE_CHECKING
+from .logic_value import LogicValue
 from .node import Node
 
 if TYPE_CHECKING:
@@ -109,7 +115,7 @@ class LogicDevice:
     for creation, mutation, resolution, and propagation.
     """
 
-    __slots__ = ("_state", "id_")
+    __slots__ = ("_state", "id_", "__weakref__")
 
     def __init__(self, state: DeviceSimulatorState, device_id: int) -> None:
         """Create a LogicDevice handle bound to simulator state."""
@@ -134,3 +140,51 @@ class LogicDevice:
     def __repr__(self) -> str:
         """Return a debug representation of this LogicDevice."""
         return f"<LogicDevice id={self.id_} kind={self.kind!r} node={self.node!r}>"
+
+
+class VDD(LogicDevice):
+    """LogicDevice handle for a constant ONE driver."""
+
+    __slots__ = ()
+
+
+class GND(LogicDevice):
+    """LogicDevice handle for a constant ZERO driver."""
+
+    __slots__ = ()
+
+
+class Input(LogicDevice):
+    """LogicDevice handle for an externally mutable driver."""
+
+    __slots__ = ()
+
+    def set_value(self, value: int) -> None:
+        """
+        Set the raw driver value of the terminal Node.
+
+        The terminal Node is queued as pending so the next tick only revisits
+        the node-group it belongs to.
+        """
+        state = self._state
+        node_id = state.device_nodes[self.id_]
+        state.node_default_values[node_id] = value
+        state.pending_nodes.append(node_id)
+
+
+class Probe(LogicDevice):
+    """LogicDevice handle for an observation terminal."""
+
+    __slots__ = ()
+
+    def sample(self) -> LogicValue:
+        """Return the resolved LogicValue of the terminal Node."""
+        state = self._state
+        node_id = state.device_nodes[self.id_]
+        return LogicValue(state.node_resolved_values[node_id])
+
+
+class Port(LogicDevice):
+    """LogicDevice handle for a circuit/module boundary terminal."""
+
+    __slots__ = ()
@@ -1,4 +1,5 @@
 from ..simulator import DeviceSimulatorState as DeviceSimulatorState
+from .logic_value import LogicValue as LogicValue
 from .node import Node as Node
 from enum import IntEnum
 from typing import Final
@@ -23,3 +24,14 @@ class LogicDevice:
     def kind(self) -> LogicDeviceKind: ...
     @property
     def node(self) -> Node: ...
+
+class VDD(LogicDevice): ...
+class GND(LogicDevice): ...
+
+class Input(LogicDevice):
+    def set_value(self, value: int) -> None: ...
+
+class Probe(LogicDevice):
+    def sample(self) -> LogicValue: ...
+
+class Port(LogicDevice): ...
@@ -95,7 +95,7 @@ class Node:
     Runtime node data is stored in DeviceSimulatorState arrays.
     """
 
-    __slots__ = ("_state", "id_")
+    __slots__ = ("_state", "id_", "__weakref__")
 
     def __init__(self, state: DeviceSimulatorState, node_id: int) -> None:
         """Create a Node handle."""
@@ -46,7 +46,7 @@ class Transistor:
     evaluation, and node-group propagation.
     """
 
-    __slots__ = ("_state", "id_")
+    __slots__ = ("_state", "id_", "__weakref__")
 
     def __init__(self, state: DeviceSimulatorState, transistor_id: int) -> None:
         """Create a Transistor handle bound to simulator state."""
@@ -79,7 +79,7 @@ class Transistor:
     @property
     def conducting(self) -> bool:
         """Return Transistor conduction state as determined by the Simulator."""
-        return self._state.transistor_conducting[self.id_]
+        return bool(self._state.transistor_conducting[self.id_])
 
     # --------------------------------------------------------------------------
     # Debug Representation
@@ -92,3 +92,15 @@ class Transistor:
             f"gate={self.gate!r} source={self.source!r} "
             f"drain={self.drain!r} conducting={self.conducting!r}>"
         )
+
+
+class NMOS(Transistor):
+    """Transistor handle for an NMOS switch. Conducts when its gate is ONE."""
+
+    __slots__ = ()
+
+
+class PMOS(Transistor):
+    """Transistor handle for a PMOS switch. Conducts when its gate is ZERO."""
+
+    __slots__ = ()
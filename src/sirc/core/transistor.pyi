@@ -23,3 +23,6 @@ class Transistor:
     def drain(self) -> Node: ...
     @property
     def conducting(self) -> bool: ...
+
+class NMOS(Transistor): ...
+class PMOS(Transistor): ...
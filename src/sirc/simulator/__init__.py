@@ -1,6 +1,38 @@
 """SIRC Simulator Module."""
 
-from .device_dep import DeviceSimulatorState
+from .device_dep import (
+    DeviceSimulatorState,
+    IdentificationFactory,
+    NodeFactory,
+    LogicDeviceFactory,
+    TransistorFactory,
+    HandleTable,
+    HandleRange,
+    DeviceRange,
+    TransistorRange,
+)
 from .device_sim import DeviceSimulator
+from .bit_parallel import BitParallelSimulator
+from .sharded import ShardedRunner
+from .convergence import Oscillation, OscillationError
+from .tick_stats import LatencyHistogram, TickStats, TickTimings
 
-__all__ = ["DeviceSimulatorState", "DeviceSimulator"]
+__all__ = [
+    "DeviceSimulatorState",
+    "IdentificationFactory",
+    "NodeFactory",
+    "LogicDeviceFactory",
+    "TransistorFactory",
+    "HandleTable",
+    "HandleRange",
+    "DeviceRange",
+    "TransistorRange",
+    "DeviceSimulator",
+    "BitParallelSimulator",
+    "ShardedRunner",
+    "Oscillation",
+    "OscillationError",
+    "LatencyHistogram",
+    "TickStats",
+    "TickTimings",
+]
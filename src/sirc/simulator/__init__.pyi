@@ -1,4 +1,43 @@
-from .device_dep import DeviceSimulatorState as DeviceSimulatorState
+from .device_dep import (
+    DeviceSimulatorState as DeviceSimulatorState,
+    IdentificationFactory as IdentificationFactory,
+    LogicDeviceFactory as LogicDeviceFactory,
+    NodeFactory as NodeFactory,
+    TransistorFactory as TransistorFactory,
+    HandleTable as HandleTable,
+    HandleRange as HandleRange,
+    DeviceRange as DeviceRange,
+    TransistorRange as TransistorRange,
+)
 from .device_sim import DeviceSimulator as DeviceSimulator
+from .bit_parallel import BitParallelSimulator as BitParallelSimulator
+from .sharded import ShardedRunner as ShardedRunner
+from .convergence import (
+    Oscillation as Oscillation,
+    OscillationError as OscillationError,
+)
+from .tick_stats import (
+    LatencyHistogram as LatencyHistogram,
+    TickStats as TickStats,
+    TickTimings as TickTimings,
+)
 
-__all__ = ['DeviceSimulatorState', 'DeviceSimulator']
+__all__ = [
+    "DeviceSimulatorState",
+    "IdentificationFactory",
+    "NodeFactory",
+    "LogicDeviceFactory",
+    "TransistorFactory",
+    "HandleTable",
+    "HandleRange",
+    "DeviceRange",
+    "TransistorRange",
+    "DeviceSimulator",
+    "BitParallelSimulator",
+    "ShardedRunner",
+    "Oscillation",
+    "OscillationError",
+    "LatencyHistogram",
+    "TickStats",
+    "TickTimings",
+]
@@ -0,0 +1,374 @@
+"""
+SIRC Bit-Parallel Simulator Module.
+
+Provides the BitParallelSimulator class, which evaluates one compiled
+DeviceSimulator topology for K independent stimulus vectors per tick.
+
+Lane encoding
+-------------
+
+Every net carries three Python-int bitplanes, one per LogicValue bit:
+
+    zero plane: bit k set when lane k sees a ZERO driver
+    one plane:  bit k set when lane k sees a ONE driver
+    x plane:    bit k set when lane k sees an X driver
+
+A lane with no bit set is Z. Driver accumulation is a bitwise OR of planes,
+resolution applies RESOLVE_TABLE lane-wise (ZERO with ONE becomes X), and
+each transistor's conduction is a lane mask taken from the one plane (NMOS)
+or the zero plane (PMOS) of its gate net.
+
+Evaluation
+----------
+
+Each tick follows the sweep engine lane for lane: OR driver planes across
+conducting channels to a fixed point, resolve, recompute conduction masks,
+and repeat until no mask changes. Conduction masks persist between ticks,
+so every lane settles exactly as a DeviceSimulator(propagation="sweep")
+driven with that lane's stimulus.
+
+A tick that does not settle is stopped by a CycleDetector over the
+conduction masks, with the max_iterations and on_oscillation settings of
+the DeviceSimulator. In "x" mode the oscillating nets become X only in
+the lanes that changed during the detected cycle (or the last iteration).
+They stay pinned at X while the rest of the netlist settles once more, so
+the transistors they gate turn off in those lanes and their fanout sees
+the X.
+"""
+
+from __future__ import annotations
+from typing import Iterable
+from ..core.logic_value import LogicValue, ZERO, ONE, X
+from ..core.logic_device import Input, Probe, INPUT_DEVICE_KIND
+from ..core.transistor import NMOS_TRANSISTOR_KIND
+from .convergence import CycleDetector, Oscillation, OscillationError
+from .device_sim import DeviceSimulator
+
+
+class BitParallelSimulator:
+    """
+    Lane-parallel evaluator over a compiled DeviceSimulator topology.
+
+    The DeviceSimulator supplies nets, channels and gate fanout from
+    build_topology; only per-lane planes and conduction masks live here.
+    Inputs start at Z in every lane until set_input assigns them, and the
+    scalar simulator's own Input values are ignored.
+    """
+
+    __slots__ = (
+        "_state",
+        "_lanes",
+        "_mask",
+        "_base_planes",
+        "_input_planes",
+        "_net_inputs",
+        "_drive_planes",
+        "_resolved_planes",
+        "_conducting",
+        "_detector",
+        "_on_oscillation",
+        "_last_oscillation",
+    )
+
+    def __init__(self, sim: DeviceSimulator, lanes: int = 64) -> None:
+        """
+        Bind to a compiled DeviceSimulator and allocate lane planes.
+
+        lanes is the number of stimulus vectors K evaluated per tick.
+        """
+        state = sim.state
+
+        if lanes < 1:
+            raise ValueError(f"lanes must be positive: {lanes!r}")
+
+        if len(state.node_nets) != len(state.node_kinds):
+            raise ValueError("build_topology() must run before bit-parallel use")
+
+        self._state = state
+        self._lanes = lanes
+        self._mask = (1 << lanes) - 1
+        self._input_planes: dict[int, tuple[int, int, int]] = {}
+        self._net_inputs: dict[int, list[int]] = {}
+        self._build_base_planes()
+        self._drive_planes = [list(planes) for planes in self._base_planes]
+        self._resolved_planes = [[0, 0, 0] for _ in state.net_nodes]
+        self._conducting = [0] * len(state.transistor_kinds)
+        self._detector = CycleDetector(sim.max_iterations)
+        self._on_oscillation = sim.on_oscillation
+        self._last_oscillation: Oscillation | None = None
+
+    @property
+    def lanes(self) -> int:
+        """Number of stimulus vectors evaluated per tick."""
+        return self._lanes
+
+    @property
+    def last_oscillation(self) -> Oscillation | None:
+        """Result of the latest tick that did not settle, if any."""
+        return self._last_oscillation
+
+    # --------------------------------------------------------------------------
+    # Stimulus and Observation
+    # --------------------------------------------------------------------------
+
+    def set_input_planes(self, device: Input, zero: int, one: int, x: int) -> None:
+        """Drive an Input with raw lane planes; bit k of each plane is lane k."""
+        state = self._state
+        node_id = state.device_nodes[device.id_]
+        net = state.node_nets[node_id]
+        mask = self._mask
+        self._input_planes[node_id] = (zero & mask, one & mask, x & mask)
+
+        if node_id not in self._net_inputs.setdefault(net, []):
+            self._net_inputs[net].append(node_id)
+
+        drive = self._drive_planes[net]
+        drive[:] = self._base_planes[net]
+
+        for input_node in self._net_inputs[net]:
+            input_zero, input_one, input_x = self._input_planes[input_node]
+            drive[0] |= input_zero
+            drive[1] |= input_one
+            drive[2] |= input_x
+
+    def set_input(self, device: Input, values: Iterable[int]) -> None:
+        """Drive an Input with one raw LogicValue per lane."""
+        zero = one = x = 0
+        count = 0
+
+        for lane, value in enumerate(values):
+            bit = 1 << lane
+
+            if value & ZERO:
+                zero |= bit
+            if value & ONE:
+                one |= bit
+            if value & X:
+                x |= bit
+
+            count = lane + 1
+
+        if count != self._lanes:
+            raise ValueError(f"Expected {self._lanes} lane values, got {count}")
+
+        self.set_input_planes(device, zero, one, x)
+
+    def sample_planes(self, probe: Probe) -> tuple[int, int, int]:
+        """Return the resolved (zero, one, x) lane planes of a Probe."""
+        state = self._state
+        net = state.node_nets[state.device_nodes[probe.id_]]
+        zero, one, x = self._resolved_planes[net]
+        return (zero, one, x)
+
+    def sample(self, probe: Probe) -> list[LogicValue]:
+        """Return the resolved LogicValue of a Probe in every lane."""
+        zero, one, x = self.sample_planes(probe)
+        values: list[LogicValue] = []
+
+        for lane in range(self._lanes):
+            bit = 1 << lane
+
+            if x & bit:
+                values.append(LogicValue.X)
+            elif one & bit:
+                values.append(LogicValue.ONE)
+            elif zero & bit:
+                values.append(LogicValue.ZERO)
+            else:
+                values.append(LogicValue.Z)
+
+        return values
+
+    # --------------------------------------------------------------------------
+    # Simulation Logic
+    # --------------------------------------------------------------------------
+
+    def _build_base_planes(self) -> None:
+        """Broadcast every non-Input driver default across all lanes."""
+        state = self._state
+        mask = self._mask
+        input_nodes = {
+            node_id
+            for kind, node_id in zip(state.device_kinds, state.device_nodes)
+            if kind == INPUT_DEVICE_KIND
+        }
+        base_planes: list[tuple[int, int, int]] = []
+
+        for nodes in state.net_nodes:
+            values = 0
+
+            for node_id in nodes:
+                if node_id not in input_nodes:
+                    values |= state.node_default_values[node_id]
+
+            base_planes.append(
+                (
+                    mask if values & ZERO else 0,
+                    mask if values & ONE else 0,
+                    mask if values & X else 0,
+                )
+            )
+
+        self._base_planes = base_planes
+
+    def _propagate_planes(self) -> list[list[int]]:
+        """OR driver planes across conducting channels to a fixed point."""
+        state = self._state
+        channel_offsets = state.net_channel_offsets
+        channel_transistors = state.net_channel_transistors
+        channel_peers = state.net_channel_peers
+        conducting = self._conducting
+        planes = [list(drive) for drive in self._drive_planes]
+        worklist = [net for net, (zero, one, x) in enumerate(planes) if zero | one | x]
+
+        while worklist:
+            net = worklist.pop()
+            zero, one, x = planes[net]
+
+            for index in range(channel_offsets[net], channel_offsets[net + 1]):
+                lanes = conducting[channel_transistors[index]]
+
+                if not lanes:
+                    continue
+
+                peer = planes[channel_peers[index]]
+                add_zero = zero & lanes & ~peer[0]
+                add_one = one & lanes & ~peer[1]
+                add_x = x & lanes & ~peer[2]
+
+                if add_zero | add_one | add_x:
+                    peer[0] |= add_zero
+                    peer[1] |= add_one
+                    peer[2] |= add_x
+                    worklist.append(channel_peers[index])
+
+        return planes
+
+    def _resolve_planes(self, planes: list[list[int]]) -> tuple[list[int], int]:
+        """
+        Apply RESOLVE_TABLE lane-wise to the propagated driver planes.
+        Return the nets whose resolved planes changed and the lanes in
+        which any of them changed.
+        """
+        resolved_planes = self._resolved_planes
+        changed: list[int] = []
+        changed_lanes = 0
+
+        for net, (zero, one, x) in enumerate(planes):
+            resolved = resolved_planes[net]
+            resolved_zero = zero & ~one & ~x
+            resolved_one = one & ~zero & ~x
+            resolved_x = x | (zero & one)
+
+            if (
+                resolved[0] != resolved_zero
+                or resolved[1] != resolved_one
+                or resolved[2] != resolved_x
+            ):
+                changed_lanes |= (
+                    (resolved[0] ^ resolved_zero)
+                    | (resolved[1] ^ resolved_one)
+                    | (resolved[2] ^ resolved_x)
+                )
+                resolved[0] = resolved_zero
+                resolved[1] = resolved_one
+                resolved[2] = resolved_x
+                changed.append(net)
+
+        return changed, changed_lanes
+
+    def _update_conduction(self, changed_nets: list[int]) -> bool:
+        """
+        Recompute conduction masks of transistors gated by changed nets.
+        Return True if any mask changed.
+        """
+        state = self._state
+        kinds = state.transistor_kinds
+        fanout_offsets = state.net_fanout_offsets
+        fanout = state.net_fanout
+        resolved_planes = self._resolved_planes
+        conducting = self._conducting
+        changed = False
+
+        for net in changed_nets:
+            zero, one, _ = resolved_planes[net]
+
+            for index in range(fanout_offsets[net], fanout_offsets[net + 1]):
+                transistor_id = fanout[index]
+                lanes = one if kinds[transistor_id] == NMOS_TRANSISTOR_KIND else zero
+
+                if lanes != conducting[transistor_id]:
+                    conducting[transistor_id] = lanes
+                    changed = True
+
+        return changed
+
+    def tick(self) -> None:
+        """
+        Settle every lane to its fixed point. Raise OscillationError, or
+        mark the oscillating lanes X, when the tick does not settle.
+        """
+        detector = self._detector
+        detector.reset()
+        # Lanes changed per iteration, to find the lanes of a cycle.
+        lane_history: list[int] = []
+
+        while True:
+            changed_nets, changed_lanes = self._resolve_planes(self._propagate_planes())
+
+            if not self._update_conduction(changed_nets):
+                break
+
+            lane_history.append(changed_lanes)
+
+            if detector.step(hash(tuple(self._conducting)), changed_nets):
+                self._oscillated(lane_history)
+                break
+
+    def _oscillated(self, lane_history: list[int]) -> None:
+        """
+        Report a tick the CycleDetector stopped: record last_oscillation,
+        then raise OscillationError or mark the oscillating nets X in the
+        lanes that changed during the cycle and settle their fanout.
+        """
+        detector = self._detector
+        nets = sorted(detector.nets)
+        net_nodes = self._state.net_nodes
+        oscillation = Oscillation(
+            detector.iterations,
+            detector.period,
+            nets,
+            sorted(node_id for net in nets for node_id in net_nodes[net]),
+        )
+        self._last_oscillation = oscillation
+
+        if self._on_oscillation == "raise":
+            raise OscillationError(oscillation)
+
+        lanes = 0
+
+        for changed_lanes in lane_history[-max(detector.period, 1) :]:
+            lanes |= changed_lanes
+
+        self._pin_x(nets, lanes)
+        changed_nets = nets
+        # Settle around the pinned nets; the detector only guards against a
+        # second oscillation, which is left as it stops.
+        detector.reset()
+
+        while self._update_conduction(changed_nets):
+            changed_nets, _ = self._resolve_planes(self._propagate_planes())
+            self._pin_x(nets, lanes)
+
+            if detector.step(hash(tuple(self._conducting)), changed_nets):
+                break
+
+    def _pin_x(self, nets: list[int], lanes: int) -> None:
+        """Force the resolved planes of nets to X in lanes."""
+        resolved_planes = self._resolved_planes
+
+        for net in nets:
+            resolved = resolved_planes[net]
+            resolved[0] &= ~lanes
+            resolved[1] &= ~lanes
+            resolved[2] |= lanes
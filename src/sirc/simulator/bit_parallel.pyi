@@ -0,0 +1,31 @@
+from ..core.logic_device import (
+    INPUT_DEVICE_KIND as INPUT_DEVICE_KIND,
+    Input as Input,
+    Probe as Probe,
+)
+from ..core.logic_value import (
+    LogicValue as LogicValue,
+    ONE as ONE,
+    X as X,
+    ZERO as ZERO,
+)
+from ..core.transistor import NMOS_TRANSISTOR_KIND as NMOS_TRANSISTOR_KIND
+from .convergence import (
+    CycleDetector as CycleDetector,
+    Oscillation as Oscillation,
+    OscillationError as OscillationError,
+)
+from .device_sim import DeviceSimulator as DeviceSimulator
+from typing import Iterable
+
+class BitParallelSimulator:
+    def __init__(self, sim: DeviceSimulator, lanes: int = 64) -> None: ...
+    @property
+    def lanes(self) -> int: ...
+    @property
+    def last_oscillation(self) -> Oscillation | None: ...
+    def set_input_planes(self, device: Input, zero: int, one: int, x: int) -> None: ...
+    def set_input(self, device: Input, values: Iterable[int]) -> None: ...
+    def sample_planes(self, probe: Probe) -> tuple[int, int, int]: ...
+    def sample(self, probe: Probe) -> list[LogicValue]: ...
+    def tick(self) -> None: ...
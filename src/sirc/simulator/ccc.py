@@ -0,0 +1,1041 @@
+"""
+SIRC Channel-Connected Component Module.
+
+Partitions a compiled netlist into channel-connected components (CCCs) and
+evaluates it one CCC at a time, selected with
+DeviceSimulator(propagation="ccc").
+
+Partition
+---------
+
+A CCC is a maximal set of nets joined by transistor source-drain channels,
+cut at the supply rails: nets holding a VDD or GND terminal reach every
+cell and would otherwise fuse the whole design into one component. Each
+CCC records
+
+    output nets:  its nets; only its own channels can join them to others
+    input nets:   the distinct gate nets of its transistors
+    rails:        the distinct supply nets its channels reach
+    transistors:  every transistor whose channel lies in it
+
+Every non-rail net and every transistor belongs to exactly one CCC. A net
+without channels is a CCC of its own, and a transistor whose channel only
+touches rails forms a CCC without output nets.
+
+Evaluation
+----------
+
+An output net can only change when its CCC is re-evaluated, and a CCC only
+needs that when an input net, the driver of an output net, or a rail it
+reaches changes. CCCEngine keeps a worklist of such CCCs. Evaluating one
+recomputes its transistors' conduction from the input nets and unions its
+conducting channels over local vertices (output nets, then rails), so the
+work is bounded by the CCC and not the design.
+
+Rails resolve like any other net. A rail group is a set of rails joined
+through some CCC's conducting group, and it resolves the OR of the rail
+defaults and of every group attached to it in any CCC. Per-rail driver
+counts keep that OR current as CCCs are re-evaluated, so a short in one
+cell is seen wherever the rail reaches, exactly as in the event and sweep
+engines.
+
+Levelization
+------------
+
+CCC u feeds CCC v when an output net of u gates a transistor of v.
+build_cccs levelizes that graph: strongly connected regions (latches,
+ring oscillators) collapse to one level, and every other CCC sits one
+level above the deepest CCC feeding it. CCCEngine drains its worklist
+lowest level first, so a feed-forward design settles in a single ordered
+pass with each CCC evaluated at most once, and re-evaluation until stable
+is confined to the feedback regions flagged in ccc_feedback.
+
+Memoization
+-----------
+
+A CCC's conduction pattern, its output values and its rail terms only
+depend on its structure, its input gate values and its output nets'
+defaults. build_cccs interns a structural signature per CCC (output and
+rail counts plus each transistor's kind, gate input and channel ends in
+local vertices), so identical cells across the netlist share one id.
+CCCEngine keeps an LRU cache keyed by (signature, gate values, defaults),
+and repeated cell evaluations become dictionary hits. Outputs that join a
+rail are stored as the rail's local position and read at apply time, so
+entries stay valid whatever the rails resolve to.
+
+Threads
+-------
+
+CCCs on one level never feed each other unless they share a feedback
+region, and they own disjoint output nets and transistors. With threads >
+1, CCCEngine pops every queued CCC of the lowest level as one batch and
+splits large batches across a ThreadPoolExecutor: each worker solves its
+slice reading only input nets and the cache, and writes its CCCs' own
+entries of transistor_conducting and node_resolved_values. Rail terms,
+cache updates, net values and scheduling are applied on the calling
+thread once every slice has finished, in slice order, so workers never
+race those writes and results match the sequential engine. The speedup needs
+a free-threaded build (python3.13t); under the GIL the workers serialize.
+"""
+
+from __future__ import annotations
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from heapq import heappop, heappush
+from typing import Final, Iterable, Iterator, Sequence, TypeAlias
+from ..core.logic_value import RESOLVE_TABLE
+from ..core.logic_device import GND_DEVICE_KIND, VDD_DEVICE_KIND
+from .convergence import CycleDetector
+from .device_dep import DeviceSimulatorState
+
+# Raw device kinds whose terminal net is a supply rail.
+RAIL_DEVICE_KINDS: Final[tuple[int, ...]] = (GND_DEVICE_KIND, VDD_DEVICE_KIND)
+
+# Default number of solved (signature, inputs) entries CCCEngine keeps.
+DEFAULT_CACHE_SIZE: Final[int] = 65536
+
+# CCCs with more transistors are solved directly: their keys are as costly
+# to build as a solve and are unlikely to repeat.
+CACHE_MAX_TRANSISTORS: Final[int] = 64
+
+# Fewest CCCs in one level batch worth splitting across worker threads.
+PARALLEL_MIN_BATCH: Final[int] = 256
+
+# (rail local positions, driver mask) per group of a CCC that reaches rails.
+_Terms: TypeAlias = tuple[tuple[tuple[int, ...], int], ...]
+
+# (signature, input gate values, output net defaults).
+_Key: TypeAlias = tuple[int, tuple[int, ...], tuple[int, ...]]
+
+# (conduction per transistor, value or ~rail position per output, terms).
+_Solution: TypeAlias = tuple[bytes, tuple[int, ...], _Terms]
+
+# (cid, cache key or None, solution, cache hit, changed (net, value) pairs,
+# transistors toggled).
+_Outcome: TypeAlias = tuple[
+    int, _Key | None, _Solution, bool, list[tuple[int, int]], int
+]
+
+
+def _csr(rows: Sequence[Sequence[int]]) -> tuple[array[int], array[int]]:
+    """Pack per-row id lists into CSR (offsets, values) arrays."""
+    offsets = array("Q", [0]) * (len(rows) + 1)
+    values = array("I")
+
+    for row, items in enumerate(rows):
+        values.extend(items)
+        offsets[row + 1] = len(values)
+
+    return offsets, values
+
+
+def _levelize(state: DeviceSimulatorState) -> None:
+    """
+    Order the CCCs by gate-to-output dependency.
+
+    CCC u feeds CCC v when an output net of u gates a transistor of v.
+    Tarjan's algorithm finds the strongly connected regions of that graph,
+    then levels are propagated through the regions in topological order:
+    each region sits one level above the deepest region feeding it, and
+    every CCC of a region shares its level. Fills ccc_levels and
+    ccc_feedback.
+    """
+    ccc_count = len(state.ccc_transistor_offsets) - 1
+    output_offsets = state.ccc_output_offsets
+    output_nets = state.ccc_output_nets
+    fanout_offsets = state.net_ccc_fanout_offsets
+    fanout = state.net_ccc_fanout
+
+    def successors(cid: int) -> Iterator[int]:
+        for index in range(output_offsets[cid], output_offsets[cid + 1]):
+            net = output_nets[index]
+            yield from fanout[fanout_offsets[net] : fanout_offsets[net + 1]]
+
+    order = array("i", [-1]) * ccc_count
+    low = array("I", [0]) * ccc_count
+    on_stack = bytearray(ccc_count)
+    region_of = array("I", [0]) * ccc_count
+    regions: list[list[int]] = []
+    stack: list[int] = []
+    counter = 0
+
+    for root in range(ccc_count):
+        if order[root] >= 0:
+            continue
+
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        work = [(root, successors(root))]
+
+        while work:
+            cid, pending = work[-1]
+
+            for successor in pending:
+                if order[successor] < 0:
+                    order[successor] = low[successor] = counter
+                    counter += 1
+                    stack.append(successor)
+                    on_stack[successor] = 1
+                    work.append((successor, successors(successor)))
+                    break
+
+                if on_stack[successor]:
+                    low[cid] = min(low[cid], order[successor])
+            else:
+                work.pop()
+
+                if work:
+                    caller = work[-1][0]
+                    low[caller] = min(low[caller], low[cid])
+
+                if low[cid] == order[cid]:
+                    region: list[int] = []
+
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        region_of[member] = len(regions)
+                        region.append(member)
+
+                        if member == cid:
+                            break
+
+                    regions.append(region)
+
+    # Tarjan emits a region only after every region it reaches, so walking
+    # the list backwards visits feeding regions first.
+    region_levels = [0] * len(regions)
+    feedback = bytearray(ccc_count)
+
+    for region_id in range(len(regions) - 1, -1, -1):
+        level = region_levels[region_id] + 1
+        region = regions[region_id]
+
+        for cid in region:
+            for successor in successors(cid):
+                target = region_of[successor]
+
+                if target != region_id:
+                    region_levels[target] = max(region_levels[target], level)
+                elif len(region) == 1:
+                    feedback[cid] = 1
+
+        if len(region) > 1:
+            for cid in region:
+                feedback[cid] = 1
+
+    state.ccc_levels = array("I", [region_levels[region] for region in region_of])
+    state.ccc_feedback = feedback
+
+
+def build_cccs(state: DeviceSimulatorState) -> None:
+    """
+    Partition the nets and transistors of a compiled state into CCCs.
+
+    Fills net_ccc, transistor_ccc, the transistor_ccc_gate/source/drain
+    local indices, the ccc_* CSR columns, the interned ccc_signatures and
+    the CCC fanout and rail attachment indices. The nets must already be
+    built.
+    """
+    net_count = len(state.net_nodes)
+    node_nets = state.node_nets
+    source_nets = state.transistor_source_nets
+    drain_nets = state.transistor_drain_nets
+    transistor_count = len(source_nets)
+    rail = bytearray(net_count)
+
+    for kind, node_id in zip(state.device_kinds, state.device_nodes):
+        if kind in RAIL_DEVICE_KINDS:
+            rail[node_nets[node_id]] = 1
+
+    parent = list(range(net_count))
+
+    for a, b in zip(source_nets, drain_nets):
+        if a == b or rail[a] or rail[b]:
+            continue
+
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+
+        while parent[b] != b:
+            parent[b] = parent[parent[b]]
+            b = parent[b]
+
+        if a != b:
+            parent[max(a, b)] = min(a, b)
+
+    net_ccc = array("i", [-1]) * net_count
+    ccc_outputs: list[list[int]] = []
+
+    for net in range(net_count):
+        if rail[net]:
+            continue
+
+        root = net
+
+        while parent[root] != root:
+            root = parent[root]
+
+        # Roots are the smallest net of their set, so they are met first.
+        if root == net:
+            net_ccc[net] = len(ccc_outputs)
+            ccc_outputs.append([net])
+        else:
+            net_ccc[net] = net_ccc[root]
+            ccc_outputs[net_ccc[root]].append(net)
+
+    transistor_ccc = array("I", [0]) * transistor_count
+    ccc_transistors: list[list[int]] = [[] for _ in ccc_outputs]
+
+    for transistor_id, (a, b) in enumerate(zip(source_nets, drain_nets)):
+        if not rail[a]:
+            cid = net_ccc[a]
+        elif not rail[b]:
+            cid = net_ccc[b]
+        else:
+            cid = len(ccc_outputs)
+            ccc_outputs.append([])
+            ccc_transistors.append([])
+
+        transistor_ccc[transistor_id] = cid
+        ccc_transistors[cid].append(transistor_id)
+
+    # Local vertex of every net within the CCC being scanned: output nets
+    # take 0..k-1 and rails follow in first-seen order. seen_by tags
+    # entries with the CCC that wrote them, so nothing is cleared per CCC.
+    gate_nets = state.transistor_gate_nets
+    local = array("I", [0]) * net_count
+    seen_by = array("i", [-1]) * net_count
+    input_seen_by = array("i", [-1]) * net_count
+    local_input = array("I", [0]) * net_count
+    local_gate = array("I", [0]) * transistor_count
+    local_source = array("I", [0]) * transistor_count
+    local_drain = array("I", [0]) * transistor_count
+    kinds = state.transistor_kinds
+    signature_ids: dict[tuple[int, ...], int] = {}
+    signatures = array("I", [0]) * len(ccc_outputs)
+    ccc_inputs: list[list[int]] = []
+    ccc_rails: list[list[int]] = []
+    net_fanout: list[list[int]] = [[] for _ in range(net_count)]
+    rail_attached: list[list[int]] = [[] for _ in range(net_count)]
+
+    for cid, (outputs, transistors) in enumerate(zip(ccc_outputs, ccc_transistors)):
+        for position, net in enumerate(outputs):
+            local[net] = position
+            seen_by[net] = cid
+
+        inputs: list[int] = []
+        rails: list[int] = []
+        signature = [len(outputs)]
+
+        for transistor_id in transistors:
+            gate = gate_nets[transistor_id]
+
+            if input_seen_by[gate] != cid:
+                input_seen_by[gate] = cid
+                local_input[gate] = len(inputs)
+                inputs.append(gate)
+                net_fanout[gate].append(cid)
+
+            for net in (source_nets[transistor_id], drain_nets[transistor_id]):
+                if seen_by[net] != cid:
+                    seen_by[net] = cid
+                    local[net] = len(outputs) + len(rails)
+                    rails.append(net)
+                    rail_attached[net].append(cid)
+
+            local_gate[transistor_id] = local_input[gate]
+            local_source[transistor_id] = local[source_nets[transistor_id]]
+            local_drain[transistor_id] = local[drain_nets[transistor_id]]
+            signature += (
+                kinds[transistor_id],
+                local_gate[transistor_id],
+                local_source[transistor_id],
+                local_drain[transistor_id],
+            )
+
+        signature.append(len(rails))
+        signatures[cid] = signature_ids.setdefault(tuple(signature), len(signature_ids))
+        ccc_inputs.append(inputs)
+        ccc_rails.append(rails)
+
+    state.net_ccc = net_ccc
+    state.transistor_ccc = transistor_ccc
+    state.transistor_ccc_gate = local_gate
+    state.transistor_ccc_source = local_source
+    state.transistor_ccc_drain = local_drain
+    state.ccc_output_offsets, state.ccc_output_nets = _csr(ccc_outputs)
+    state.ccc_input_offsets, state.ccc_input_nets = _csr(ccc_inputs)
+    state.ccc_rail_offsets, state.ccc_rail_nets = _csr(ccc_rails)
+    state.ccc_transistor_offsets, state.ccc_transistors = _csr(ccc_transistors)
+    state.ccc_signatures = signatures
+    state.net_ccc_fanout_offsets, state.net_ccc_fanout = _csr(net_fanout)
+    state.rail_ccc_offsets, state.rail_cccs = _csr(rail_attached)
+    _levelize(state)
+
+
+class CCCEngine:
+    """
+    Worklist evaluator over the CCC partition of a compiled state.
+
+    Owns the per-CCC rail terms and per-rail driver counts that let rails
+    resolve across CCCs, and the LRU cache of solved CCCs. Construct it
+    after build_topology; the first tick evaluates every CCC once.
+
+    cache_hits and cache_misses count cache lookups since construction,
+    iterations the worklist drains, transistors_toggled the conduction
+    changes and nodes_changed the Node value changes written.
+    With threads > 1 the engine owns a worker pool; close() stops it.
+    """
+
+    __slots__ = (
+        "_state",
+        "_gate_values",
+        "_queue",
+        "_queued",
+        "_terms",
+        "_rail_drivers",
+        "_links",
+        "_dirty_rails",
+        "_cache",
+        "_cache_size",
+        "_threads",
+        "_pool",
+        "_tracking",
+        "_state_hash",
+        "_changed",
+        "_journal",
+        "cache_hits",
+        "cache_misses",
+        "iterations",
+        "transistors_toggled",
+        "nodes_changed",
+    )
+
+    def __init__(
+        self,
+        state: DeviceSimulatorState,
+        conducting_gate_values: Sequence[int],
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        threads: int = 1,
+    ) -> None:
+        """
+        Start from an unresolved state with every CCC queued. Partition
+        the state first if build_cccs has not run on it.
+
+        cache_size bounds the solved-CCC cache; 0 disables it. threads is
+        the number of workers sharing large same-level batches; 1 keeps
+        every evaluation on the calling thread.
+        """
+        if cache_size < 0:
+            raise ValueError(f"cache_size must be >= 0, got {cache_size}")
+
+        if threads < 1:
+            raise ValueError(f"threads must be positive: {threads!r}")
+
+        if len(state.net_ccc) != len(state.net_nodes):
+            build_cccs(state)
+
+        ccc_count = len(state.ccc_transistor_offsets) - 1
+        self._state = state
+        self._gate_values = tuple(conducting_gate_values)
+        # Pending CCCs as level << 32 | cid, popped lowest level first.
+        levels = state.ccc_levels
+        self._queue = sorted(levels[cid] << 32 | cid for cid in range(ccc_count))
+        self._queued = bytearray(b"\x01") * ccc_count
+        # Per CCC, the rail terms of its last solution.
+        self._terms: list[_Terms] = [()] * ccc_count
+        # Per rail, [zero, one, x] counts over single-rail groups.
+        self._rail_drivers: dict[int, list[int]] = {}
+        # Per CCC, its groups joining several rails.
+        self._links: dict[int, list[tuple[tuple[int, ...], int]]] = {}
+        self._dirty_rails = {net for net, cid in enumerate(state.net_ccc) if cid < 0}
+        self._cache: OrderedDict[_Key, _Solution] | None = (
+            OrderedDict() if cache_size else None
+        )
+        self._cache_size = cache_size
+        self._threads = threads
+        self._pool = (
+            ThreadPoolExecutor(threads, thread_name_prefix="ccc")
+            if threads > 1
+            else None
+        )
+        # Net value hash and changed nets since the first worklist wrap of a
+        # tick; see _wrapped.
+        self._tracking = False
+        self._state_hash = 0
+        self._changed: list[int] = []
+        # Net -> value before its first write this tick, when collecting.
+        self._journal: dict[int, int] | None = None
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.iterations = 0
+        self.transistors_toggled = 0
+        self.nodes_changed = 0
+
+    def _schedule(self, cid: int) -> None:
+        """Queue a CCC for evaluation unless it is already queued."""
+        if not self._queued[cid]:
+            self._queued[cid] = 1
+            heappush(self._queue, self._state.ccc_levels[cid] << 32 | cid)
+
+    def _schedule_fanout(self, net: int) -> None:
+        """Queue every CCC gated by a net."""
+        state = self._state
+        fanout = state.net_ccc_fanout
+        schedule = self._schedule
+
+        for index in range(
+            state.net_ccc_fanout_offsets[net], state.net_ccc_fanout_offsets[net + 1]
+        ):
+            schedule(fanout[index])
+
+    def _write_net(self, net: int, resolved_value: int) -> None:
+        """Write a net and its Nodes; queue its fanout if the value changed."""
+        state = self._state
+
+        previous = state.net_resolved_values[net]
+
+        if previous == resolved_value:
+            return
+
+        if self._tracking:
+            self._state_hash ^= hash((net, previous)) ^ hash((net, resolved_value))
+            self._changed.append(net)
+
+        if self._journal is not None:
+            self._journal.setdefault(net, previous)
+
+        state.net_resolved_values[net] = resolved_value
+        resolved_values = state.node_resolved_values
+        nodes = state.net_nodes[net]
+
+        for node_id in nodes:
+            resolved_values[node_id] = resolved_value
+
+        self.nodes_changed += len(nodes)
+        self._schedule_fanout(net)
+
+    def _retire_terms(self, cid: int) -> None:
+        """Remove a CCC's rail terms from the rail driver counts."""
+        rail_nets = self._state.ccc_rail_nets
+        rail_start = self._state.ccc_rail_offsets[cid]
+
+        for positions, mask in self._terms[cid]:
+            rails = [rail_nets[rail_start + position] for position in positions]
+            self._dirty_rails.update(rails)
+
+            if len(rails) == 1:
+                drivers = self._rail_drivers[rails[0]]
+                drivers[0] -= mask & 0b001
+                drivers[1] -= mask >> 1 & 0b1
+                drivers[2] -= mask >> 2
+
+        self._links.pop(cid, None)
+
+    def _enlist_terms(self, cid: int, terms: _Terms) -> None:
+        """Add a CCC's rail terms to the rail driver counts."""
+        rail_nets = self._state.ccc_rail_nets
+        rail_start = self._state.ccc_rail_offsets[cid]
+        links: list[tuple[tuple[int, ...], int]] = []
+
+        for positions, mask in terms:
+            rails = tuple(rail_nets[rail_start + position] for position in positions)
+            self._dirty_rails.update(rails)
+
+            if len(rails) > 1:
+                links.append((rails, mask))
+                continue
+
+            drivers = self._rail_drivers.setdefault(rails[0], [0, 0, 0])
+            drivers[0] += mask & 0b001
+            drivers[1] += mask >> 1 & 0b1
+            drivers[2] += mask >> 2
+
+        if links:
+            self._links[cid] = links
+
+        self._terms[cid] = terms
+
+    def _solve(
+        self, cid: int, gate_values: Sequence[int], default_values: Sequence[int]
+    ) -> _Solution:
+        """
+        Solve one CCC from its input gate values and output net defaults.
+
+        The result only depends on the CCC's structure and those values, so
+        it holds for every CCC with the same signature.
+        """
+        state = self._state
+        kinds = state.transistor_kinds
+        local_gate = state.transistor_ccc_gate
+        local_source = state.transistor_ccc_source
+        local_drain = state.transistor_ccc_drain
+        transistors = state.ccc_transistors
+        conducting_gate_values = self._gate_values
+        output_count = len(default_values)
+        rail_count = state.ccc_rail_offsets[cid + 1] - state.ccc_rail_offsets[cid]
+        parent = list(range(output_count + rail_count))
+        conduction = bytearray()
+
+        for index in range(
+            state.ccc_transistor_offsets[cid], state.ccc_transistor_offsets[cid + 1]
+        ):
+            transistor_id = transistors[index]
+            status = (
+                gate_values[local_gate[transistor_id]]
+                == conducting_gate_values[kinds[transistor_id]]
+            )
+            conduction.append(status)
+
+            if not status:
+                continue
+
+            a = local_source[transistor_id]
+            b = local_drain[transistor_id]
+
+            while parent[a] != a:
+                parent[a] = parent[parent[a]]
+                a = parent[a]
+
+            while parent[b] != b:
+                parent[b] = parent[parent[b]]
+                b = parent[b]
+
+            if a != b:
+                parent[max(a, b)] = min(a, b)
+
+        roots = [0] * len(parent)
+        masks = [0b000] * len(parent)
+
+        for vertex in range(len(parent)):
+            root = vertex
+
+            while parent[root] != root:
+                root = parent[root]
+
+            roots[vertex] = root
+
+            if vertex < output_count:
+                masks[root] |= default_values[vertex]
+
+        rail_groups: dict[int, list[int]] = {}
+
+        for position in range(rail_count):
+            rail_groups.setdefault(roots[output_count + position], []).append(position)
+
+        terms = tuple(
+            (tuple(positions), masks[root])
+            for root, positions in rail_groups.items()
+            if len(positions) > 1 or masks[root]
+        )
+        # Outputs on a rail group read the group's first rail, encoded ~position.
+        outputs = tuple(
+            ~rail_groups[root][0] if root in rail_groups else RESOLVE_TABLE[masks[root]]
+            for root in roots[:output_count]
+        )
+        return bytes(conduction), outputs, terms
+
+    def _gather(
+        self, cid: int
+    ) -> tuple[Sequence[int], tuple[int, ...], tuple[int, ...]]:
+        """Return a CCC's output nets, input gate values and output defaults."""
+        state = self._state
+        output_nets = state.ccc_output_nets[
+            state.ccc_output_offsets[cid] : state.ccc_output_offsets[cid + 1]
+        ]
+        gate_values = tuple(
+            map(
+                state.net_resolved_values.__getitem__,
+                state.ccc_input_nets[
+                    state.ccc_input_offsets[cid] : state.ccc_input_offsets[cid + 1]
+                ],
+            )
+        )
+        default_values = tuple(map(state.net_default_values.__getitem__, output_nets))
+        return output_nets, gate_values, default_values
+
+    def _evaluate(self, cid: int) -> None:
+        """Re-evaluate conduction, rail terms and output values of one CCC."""
+        state = self._state
+        net_resolved_values = state.net_resolved_values
+        output_nets, gate_values, default_values = self._gather(cid)
+        cache = self._cache
+        transistor_start = state.ccc_transistor_offsets[cid]
+        transistor_stop = state.ccc_transistor_offsets[cid + 1]
+
+        if cache is None or transistor_stop - transistor_start > CACHE_MAX_TRANSISTORS:
+            solution = self._solve(cid, gate_values, default_values)
+        else:
+            key = (state.ccc_signatures[cid], gate_values, default_values)
+            cached = cache.get(key)
+
+            if cached is None:
+                self.cache_misses += 1
+                solution = self._solve(cid, gate_values, default_values)
+                cache[key] = solution
+
+                if len(cache) > self._cache_size:
+                    cache.popitem(last=False)
+            else:
+                self.cache_hits += 1
+                cache.move_to_end(key)
+                solution = cached
+
+        conduction, outputs, terms = solution
+        transistors = state.ccc_transistors
+        conducting = state.transistor_conducting
+
+        for index, status in enumerate(conduction, transistor_start):
+            transistor_id = transistors[index]
+
+            if conducting[transistor_id] != status:
+                conducting[transistor_id] = status
+                self.transistors_toggled += 1
+
+        if terms != self._terms[cid]:
+            self._retire_terms(cid)
+            self._enlist_terms(cid, terms)
+
+        rail_nets = state.ccc_rail_nets
+        rail_start = state.ccc_rail_offsets[cid]
+        write_net = self._write_net
+
+        for net, resolved_value in zip(output_nets, outputs):
+            if resolved_value < 0:
+                resolved_value = net_resolved_values[
+                    rail_nets[rail_start + ~resolved_value]
+                ]
+
+            write_net(net, resolved_value)
+
+    def _evaluate_slice(self, cids: Sequence[int]) -> list[_Outcome]:
+        """
+        Solve a slice of a same-level batch on a worker thread.
+
+        Reads input nets, rails and the cache without modifying them, and
+        writes only the slice's own transistor_conducting entries and output
+        Nodes. Net values, rail terms and the cache are left to
+        _apply_outcomes.
+        """
+        state = self._state
+        net_resolved_values = state.net_resolved_values
+        node_resolved_values = state.node_resolved_values
+        net_nodes = state.net_nodes
+        transistor_offsets = state.ccc_transistor_offsets
+        transistors = state.ccc_transistors
+        conducting = state.transistor_conducting
+        rail_nets = state.ccc_rail_nets
+        rail_offsets = state.ccc_rail_offsets
+        signatures = state.ccc_signatures
+        cache = self._cache
+        gather = self._gather
+        solve = self._solve
+        outcomes: list[_Outcome] = []
+
+        for cid in cids:
+            output_nets, gate_values, default_values = gather(cid)
+            transistor_start = transistor_offsets[cid]
+            key: _Key | None = None
+            solution: _Solution | None = None
+
+            if (
+                cache is not None
+                and transistor_offsets[cid + 1] - transistor_start
+                <= CACHE_MAX_TRANSISTORS
+            ):
+                key = (signatures[cid], gate_values, default_values)
+                solution = cache.get(key)
+
+            hit = solution is not None
+
+            if solution is None:
+                solution = solve(cid, gate_values, default_values)
+
+            conduction, outputs, _ = solution
+            toggled = 0
+
+            for index, status in enumerate(conduction, transistor_start):
+                transistor_id = transistors[index]
+
+                if conducting[transistor_id] != status:
+                    conducting[transistor_id] = status
+                    toggled += 1
+
+            rail_start = rail_offsets[cid]
+            changes: list[tuple[int, int]] = []
+
+            for net, resolved_value in zip(output_nets, outputs):
+                if resolved_value < 0:
+                    resolved_value = net_resolved_values[
+                        rail_nets[rail_start + ~resolved_value]
+                    ]
+
+                if net_resolved_values[net] != resolved_value:
+                    for node_id in net_nodes[net]:
+                        node_resolved_values[node_id] = resolved_value
+
+                    changes.append((net, resolved_value))
+
+            outcomes.append((cid, key, solution, hit, changes, toggled))
+
+        return outcomes
+
+    def _apply_outcomes(self, outcomes: Iterable[_Outcome]) -> None:
+        """Apply worker results: cache, rail terms, net values and fanout."""
+        net_resolved_values = self._state.net_resolved_values
+        net_nodes = self._state.net_nodes
+        cache = self._cache
+        schedule_fanout = self._schedule_fanout
+        journal = self._journal
+
+        for cid, key, solution, hit, changes, toggled in outcomes:
+            self.transistors_toggled += toggled
+
+            if key is not None and cache is not None:
+                if hit:
+                    self.cache_hits += 1
+
+                    # Misses stored earlier in the batch may have evicted it.
+                    if key in cache:
+                        cache.move_to_end(key)
+                else:
+                    self.cache_misses += 1
+                    cache[key] = solution
+
+                    if len(cache) > self._cache_size:
+                        cache.popitem(last=False)
+
+            terms = solution[2]
+
+            if terms != self._terms[cid]:
+                self._retire_terms(cid)
+                self._enlist_terms(cid, terms)
+
+            for net, resolved_value in changes:
+                if self._tracking:
+                    self._state_hash ^= hash((net, net_resolved_values[net])) ^ hash(
+                        (net, resolved_value)
+                    )
+                    self._changed.append(net)
+
+                if journal is not None:
+                    journal.setdefault(net, net_resolved_values[net])
+
+                net_resolved_values[net] = resolved_value
+                self.nodes_changed += len(net_nodes[net])
+                schedule_fanout(net)
+
+    def _evaluate_level(self, batch: list[int]) -> None:
+        """Evaluate one level's batch, split across the pool when large."""
+        pool = self._pool
+
+        if pool is None or len(batch) < PARALLEL_MIN_BATCH:
+            for cid in batch:
+                self._evaluate(cid)
+            return
+
+        step = -(-len(batch) // self._threads)
+        slices = [batch[start : start + step] for start in range(0, len(batch), step)]
+
+        # Wait for every slice before applying any: workers read net values
+        # and the cache, which _apply_outcomes writes.
+        results = list(pool.map(self._evaluate_slice, slices))
+
+        for outcomes in results:
+            self._apply_outcomes(outcomes)
+
+    def _settle_rails(self) -> None:
+        """
+        Resolve every dirty rail's group and queue the CCCs attached to or
+        gated by rails whose value changed.
+        """
+        state = self._state
+        net_default_values = state.net_default_values
+        net_resolved_values = state.net_resolved_values
+        rail_drivers = self._rail_drivers
+        dirty = self._dirty_rails
+        self._dirty_rails = set()
+        links: dict[int, list[tuple[tuple[int, ...], int]]] = {}
+
+        for terms in self._links.values():
+            for term in terms:
+                for rail in term[0]:
+                    links.setdefault(rail, []).append(term)
+
+        settled: set[int] = set()
+        changed: list[int] = []
+
+        for start in dirty:
+            if start in settled:
+                continue
+
+            settled.add(start)
+            stack = [start]
+            group: list[int] = []
+            mask = 0b000
+
+            while stack:
+                rail = stack.pop()
+                group.append(rail)
+                mask |= net_default_values[rail]
+                drivers = rail_drivers.get(rail)
+
+                if drivers:
+                    mask |= (drivers[0] > 0) | (drivers[1] > 0) << 1
+                    mask |= (drivers[2] > 0) << 2
+
+                for rails, link_mask in links.get(rail, ()):
+                    mask |= link_mask
+
+                    for other in rails:
+                        if other not in settled:
+                            settled.add(other)
+                            stack.append(other)
+
+            resolved_value = RESOLVE_TABLE[mask]
+
+            for rail in group:
+                if net_resolved_values[rail] != resolved_value:
+                    changed.append(rail)
+
+                self._write_net(rail, resolved_value)
+
+        attached = state.rail_cccs
+        attached_offsets = state.rail_ccc_offsets
+
+        for rail in changed:
+            for index in range(attached_offsets[rail], attached_offsets[rail + 1]):
+                self._schedule(attached[index])
+
+    def _wrapped(self, detector: CycleDetector) -> bool:
+        """
+        Step detector where the drain returns to a CCC at or before the last
+        one evaluated, and return True after stopping the tick.
+
+        An acyclic tick never wraps, so the net value hash is only kept from
+        the first wrap on. The state also covers the pending CCCs, their
+        stale rail terms and the dirty rails. Stopping drops the worklist:
+        the tick's remaining CCCs are not evaluated.
+        """
+        if not self._tracking:
+            self._tracking = True
+            self._state_hash = 0
+            self._changed = []
+
+        pending = sorted(self._queue)
+        terms = self._terms
+        state_hash = hash(
+            (
+                self._state_hash,
+                tuple(pending),
+                tuple(terms[key & 0xFFFFFFFF] for key in pending),
+                frozenset(self._dirty_rails),
+            )
+        )
+        stop = detector.step(state_hash, self._changed)
+        self._changed = []
+
+        if stop:
+            for key in pending:
+                self._queued[key & 0xFFFFFFFF] = 0
+
+            self._queue.clear()
+            self._dirty_rails.clear()
+            self._tracking = False
+
+        return stop
+
+    def tick(
+        self,
+        refreshed_nets: Iterable[int],
+        detector: CycleDetector | None = None,
+        journal: dict[int, int] | None = None,
+    ) -> None:
+        """
+        Settle the state after the defaults of refreshed_nets changed.
+
+        Queues the CCC owning each refreshed net (or marks the rail dirty)
+        and alternates worklist evaluation with rail resolution until both
+        are quiet. The worklist drains in level order, so every CCC runs
+        after the CCCs feeding it: an acyclic design evaluates each CCC at
+        most once per pass, and only feedback regions revisit CCCs. With a
+        worker pool, each level is evaluated as one batch.
+
+        detector, if given, is stepped each time the drain wraps back to an
+        earlier CCC; the tick returns early once it stops. journal, if
+        given, gains net -> previous value for every net written.
+        """
+        net_ccc = self._state.net_ccc
+        queue = self._queue
+        queued = self._queued
+        evaluate = self._evaluate
+        evaluate_level = self._evaluate_level
+        self._tracking = False
+        self._journal = journal
+        # Key of the last CCC evaluated (level << 32 | cid).
+        last = -1
+
+        for net in refreshed_nets:
+            cid = net_ccc[net]
+
+            if cid < 0:
+                self._dirty_rails.add(net)
+            else:
+                self._schedule(cid)
+
+        while True:
+            if self._dirty_rails:
+                self._settle_rails()
+
+            if not queue:
+                break
+
+            self.iterations += 1
+
+            if self._pool is None:
+                while queue:
+                    if (
+                        queue[0] <= last
+                        and detector is not None
+                        and self._wrapped(detector)
+                    ):
+                        return
+
+                    last = heappop(queue)
+                    cid = last & 0xFFFFFFFF
+                    queued[cid] = 0
+                    evaluate(cid)
+
+                continue
+
+            # Same-level CCCs only feed each other within a feedback region,
+            # and any such change queues the reader again for the next batch.
+            while queue:
+                if (
+                    queue[0] <= last
+                    and detector is not None
+                    and self._wrapped(detector)
+                ):
+                    return
+
+                level = queue[0] >> 32
+                last = level << 32 | 0xFFFFFFFF
+                batch: list[int] = []
+
+                while queue and queue[0] >> 32 == level:
+                    cid = heappop(queue) & 0xFFFFFFFF
+                    queued[cid] = 0
+                    batch.append(cid)
+
+                evaluate_level(batch)
+
+    def close(self) -> None:
+        """Stop the worker pool, if any; later ticks run on one thread."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
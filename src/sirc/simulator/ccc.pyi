@@ -0,0 +1,36 @@
+from ..core.logic_device import (
+    GND_DEVICE_KIND as GND_DEVICE_KIND,
+    VDD_DEVICE_KIND as VDD_DEVICE_KIND,
+)
+from ..core.logic_value import RESOLVE_TABLE as RESOLVE_TABLE
+from .convergence import CycleDetector as CycleDetector
+from .device_dep import DeviceSimulatorState as DeviceSimulatorState
+from typing import Final, Iterable, Sequence
+
+RAIL_DEVICE_KINDS: Final[tuple[int, ...]]
+DEFAULT_CACHE_SIZE: Final[int]
+CACHE_MAX_TRANSISTORS: Final[int]
+PARALLEL_MIN_BATCH: Final[int]
+
+def build_cccs(state: DeviceSimulatorState) -> None: ...
+
+class CCCEngine:
+    cache_hits: int
+    cache_misses: int
+    iterations: int
+    transistors_toggled: int
+    nodes_changed: int
+    def __init__(
+        self,
+        state: DeviceSimulatorState,
+        conducting_gate_values: Sequence[int],
+        cache_size: int = ...,
+        threads: int = ...,
+    ) -> None: ...
+    def tick(
+        self,
+        refreshed_nets: Iterable[int],
+        detector: CycleDetector | None = ...,
+        journal: dict[int, int] | None = ...,
+    ) -> None: ...
+    def close(self) -> None: ...
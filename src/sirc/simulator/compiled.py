@@ -0,0 +1,158 @@
+"""
+SIRC Compiled Netlist Module.
+
+Versioned binary container for the dense arrays of a compiled
+DeviceSimulatorState, written by DeviceSimulator.save_compiled and mapped
+back by DeviceSimulator.load_compiled.
+
+File layout
+-----------
+
+All integers are little-endian.
+
+    header:  magic (8s) | version (u32) | column count (u32)
+    table:   one entry per column:
+             name (32s, NUL padded) | typecode (1s) | pad (7x) |
+             byte offset (u64) | item count (u64)
+    data:    each column's raw array bytes, 8-byte aligned
+
+Loading memory-maps the file copy-on-write: every column is a typed
+memoryview cast of the mapping, so startup does not parse or copy the
+arrays, clean pages are shared between processes, and simulation writes
+(driver defaults, resolved values) stay private to the writing process.
+"""
+
+from __future__ import annotations
+import mmap
+import os
+import struct
+import sys
+from array import array
+from os import PathLike
+from typing import Final, Mapping, Sequence
+
+COMPILED_MAGIC: Final[bytes] = b"SIRCNET\0"
+COMPILED_VERSION: Final[int] = 1
+
+# Column name and array typecode of every array in a version 1 file.
+COMPILED_FIELDS: Final[tuple[tuple[str, str], ...]] = (
+    ("node_kinds", "B"),
+    ("node_default_values", "B"),
+    ("device_kinds", "B"),
+    ("device_nodes", "I"),
+    ("transistor_kinds", "B"),
+    ("transistor_gates", "I"),
+    ("transistor_sources", "I"),
+    ("transistor_drains", "I"),
+    ("wire_edge_a", "I"),
+    ("wire_edge_b", "I"),
+    ("static_offsets", "Q"),
+    ("static_indices", "I"),
+    ("node_nets", "I"),
+    ("net_default_values", "B"),
+    ("net_node_offsets", "Q"),
+    ("net_node_ids", "I"),
+    ("transistor_gate_nets", "I"),
+    ("transistor_source_nets", "I"),
+    ("transistor_drain_nets", "I"),
+    ("net_fanout_offsets", "Q"),
+    ("net_fanout", "I"),
+    ("net_channel_offsets", "Q"),
+    ("net_channel_transistors", "I"),
+    ("net_channel_peers", "I"),
+)
+
+_HEADER: Final[struct.Struct] = struct.Struct("<8sII")
+_ENTRY: Final[struct.Struct] = struct.Struct("<32s1s7xQQ")
+
+# Typecodes a column may have.
+_TYPECODES: Final[frozenset[str]] = frozenset(code for _, code in COMPILED_FIELDS)
+
+
+def write_compiled(
+    path: str | PathLike[str], columns: Mapping[str, Sequence[int]]
+) -> None:
+    """Write every COMPILED_FIELDS column to path in the current version."""
+    packed = [
+        (name, typecode, array(typecode, columns[name]))
+        for name, typecode in COMPILED_FIELDS
+    ]
+
+    if sys.byteorder != "little":
+        for _, _, column in packed:
+            column.byteswap()
+
+    offset = _HEADER.size + _ENTRY.size * len(packed)
+    table = bytearray(_HEADER.pack(COMPILED_MAGIC, COMPILED_VERSION, len(packed)))
+    positions: list[int] = []
+
+    for name, typecode, column in packed:
+        offset = -(-offset // 8) * 8
+        positions.append(offset)
+        table += _ENTRY.pack(name.encode(), typecode.encode(), offset, len(column))
+        offset += len(column) * column.itemsize
+
+    with open(path, "wb") as file:
+        file.write(table)
+
+        for position, (_, _, column) in zip(positions, packed):
+            file.write(bytes(position - file.tell()))
+            column.tofile(file)
+
+
+def read_compiled(path: str | PathLike[str]) -> dict[str, memoryview]:
+    """
+    Map path copy-on-write and return one typed memoryview per column.
+    Raise ValueError for foreign, truncated or corrupt files and
+    unsupported versions.
+    """
+    with open(path, "rb") as file:
+        # mmap rejects empty files, so check the size first.
+        if os.fstat(file.fileno()).st_size < _HEADER.size:
+            raise ValueError(f"{path!s} is not a compiled SIRC netlist")
+
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    size = len(mapping)
+    magic, version, count = _HEADER.unpack_from(mapping, 0)
+
+    if magic != COMPILED_MAGIC:
+        raise ValueError(f"{path!s} is not a compiled SIRC netlist")
+
+    if version != COMPILED_VERSION:
+        raise ValueError(f"Unsupported compiled netlist version: {version}")
+
+    if sys.byteorder != "little":
+        raise ValueError("Compiled netlists can only be mapped on little-endian hosts")
+
+    if _HEADER.size + count * _ENTRY.size > size:
+        raise ValueError(f"{path!s} is truncated: its column table is incomplete")
+
+    buffer = memoryview(mapping)
+    columns: dict[str, memoryview] = {}
+
+    for index in range(count):
+        raw_name, raw_typecode, offset, length = _ENTRY.unpack_from(
+            mapping, _HEADER.size + index * _ENTRY.size
+        )
+        name = raw_name.rstrip(b"\0").decode(errors="replace")
+        typecode = raw_typecode.decode(errors="replace")
+
+        if typecode not in _TYPECODES:
+            raise ValueError(
+                f"{path!s} is corrupt: column {name!r} has typecode {typecode!r}"
+            )
+
+        end = offset + length * array(typecode).itemsize
+
+        if end > size:
+            raise ValueError(f"{path!s} is truncated: column {name!r} is incomplete")
+
+        columns[name] = buffer[offset:end].cast(typecode)
+
+    missing = [name for name, _ in COMPILED_FIELDS if name not in columns]
+
+    if missing:
+        raise ValueError(f"Compiled netlist is missing columns: {missing}")
+
+    return columns
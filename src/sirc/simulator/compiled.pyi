@@ -0,0 +1,11 @@
+from os import PathLike
+from typing import Final, Mapping, Sequence
+
+COMPILED_MAGIC: Final[bytes]
+COMPILED_VERSION: Final[int]
+COMPILED_FIELDS: Final[tuple[tuple[str, str], ...]]
+
+def write_compiled(
+    path: str | PathLike[str], columns: Mapping[str, Sequence[int]]
+) -> None: ...
+def read_compiled(path: str | PathLike[str]) -> dict[str, memoryview]: ...
@@ -0,0 +1,171 @@
+"""
+SIRC Convergence Module.
+
+Bounds the fixed-point iteration of DeviceSimulator ticks and detects
+oscillation, so a ring oscillator or unstable feedback loop stops a tick
+instead of hanging it.
+
+Detection
+---------
+
+Every engine feeds a CycleDetector one hash of its state per fixed-point
+iteration: the conduction vector for the sweep engines, an XOR of
+per-transistor keys updated on each toggle for the event engine, and the
+net values and pending worklist for the ccc engine, whose iterations are
+the times its worklist drain wraps back to an earlier CCC. A tick is
+deterministic in that state, so a repeated state means the tick is
+periodic and will never settle.
+
+Brent's algorithm finds the period with O(1) memory. The detector then
+follows the tick for one more period, collecting the nets that change,
+and confirms the cycle when the state hash recurs; a hash collision fails
+that check and detection starts over. A finite netlist always settles or
+cycles, so detection alone ends every tick. max_iterations additionally
+caps a tick outright; hitting it reports the nets changed in the last
+iteration, with period 0.
+"""
+
+from __future__ import annotations
+from typing import Final, Iterable
+
+# What DeviceSimulator does when a tick does not settle: raise
+# OscillationError, or mark the oscillating nets X and return.
+OSCILLATION_ACTIONS: Final[tuple[str, ...]] = ("raise", "x")
+
+
+class Oscillation:
+    """
+    Structured result of a tick that did not settle.
+
+    iterations:  fixed-point iterations the tick ran
+    period:      iterations per cycle; 0 when max_iterations stopped the
+                 tick before a cycle was confirmed
+    nets:        sorted ids of the nets that changed during one cycle (or
+                 the last iteration)
+    nodes:       sorted ids of the Nodes on those nets
+    """
+
+    __slots__ = ("iterations", "period", "nets", "nodes")
+
+    def __init__(
+        self, iterations: int, period: int, nets: list[int], nodes: list[int]
+    ) -> None:
+        """Store the result fields."""
+        self.iterations = iterations
+        self.period = period
+        self.nets = nets
+        self.nodes = nodes
+
+    def __repr__(self) -> str:
+        return (
+            f"Oscillation(iterations={self.iterations}, period={self.period}, "
+            f"nets={self.nets}, nodes={self.nodes})"
+        )
+
+
+class OscillationError(RuntimeError):
+    """Raised by DeviceSimulator.tick when a tick does not settle."""
+
+    def __init__(self, oscillation: Oscillation) -> None:
+        """Keep the Oscillation as .oscillation."""
+        if oscillation.period:
+            cause = f"oscillates with period {oscillation.period}"
+        else:
+            cause = f"did not settle within {oscillation.iterations} iterations"
+
+        super().__init__(f"Tick {cause} on nets {oscillation.nets}")
+        self.oscillation = oscillation
+
+    def __reduce__(self) -> tuple[type[OscillationError], tuple[Oscillation]]:
+        # Rebuild from the Oscillation, e.g. when raised in a worker process.
+        return (type(self), (self.oscillation,))
+
+
+class CycleDetector:
+    """
+    Per-tick iteration bound and state-cycle detector.
+
+    Call reset at the start of a tick, then step once per fixed-point
+    iteration; stop iterating when step returns True and read iterations,
+    period and nets.
+    """
+
+    __slots__ = (
+        "max_iterations",
+        "iterations",
+        "period",
+        "nets",
+        "_saved",
+        "_power",
+        "_distance",
+        "_target",
+    )
+
+    def __init__(self, max_iterations: int | None = None) -> None:
+        """max_iterations caps the iterations of one tick; None leaves it open."""
+        if max_iterations is not None and max_iterations < 1:
+            raise ValueError(f"max_iterations must be positive: {max_iterations!r}")
+
+        self.max_iterations = max_iterations
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the previous tick."""
+        self.iterations = 0
+        self.period = 0
+        self.nets: set[int] = set()
+        self._saved: int | None = None
+        self._power = 1
+        self._distance = 0
+        self._target = 0
+
+    @property
+    def stopped(self) -> bool:
+        """True once step has asked the tick to stop."""
+        return self._target < 0
+
+    def step(self, state_hash: int, changed_nets: Iterable[int]) -> bool:
+        """
+        Record one iteration ending in state_hash after changed_nets
+        changed. Return True when the tick must stop.
+        """
+        self.iterations += 1
+
+        if self._target:
+            # Following a suspected cycle for one period.
+            self.nets.update(changed_nets)
+
+            if self.iterations == self._target:
+                if state_hash == self._saved:
+                    self._target = -1
+                    return True
+
+                # Hash collision: start over from this state.
+                self.period = 0
+                self.nets = set()
+                self._target = 0
+                self._saved = state_hash
+                self._power = 1
+                self._distance = 0
+        elif self._saved is None:
+            self._saved = state_hash
+        else:
+            self._distance += 1
+
+            if state_hash == self._saved:
+                self.period = self._distance
+                self._target = self.iterations + self.period
+            elif self._distance == self._power:
+                self._saved = state_hash
+                self._power *= 2
+                self._distance = 0
+
+        if self.max_iterations is not None and self.iterations >= self.max_iterations:
+            if not self._target:
+                self.nets.update(changed_nets)
+
+            self.period = 0
+            self._target = -1
+            return True
+
+        return False
@@ -0,0 +1,28 @@
+from typing import Final, Iterable
+
+OSCILLATION_ACTIONS: Final[tuple[str, ...]]
+
+class Oscillation:
+    iterations: int
+    period: int
+    nets: list[int]
+    nodes: list[int]
+    def __init__(
+        self, iterations: int, period: int, nets: list[int], nodes: list[int]
+    ) -> None: ...
+
+class OscillationError(RuntimeError):
+    oscillation: Oscillation
+    def __init__(self, oscillation: Oscillation) -> None: ...
+    def __reduce__(self) -> tuple[type[OscillationError], tuple[Oscillation]]: ...
+
+class CycleDetector:
+    max_iterations: int | None
+    iterations: int
+    period: int
+    nets: set[int]
+    def __init__(self, max_iterations: int | None = ...) -> None: ...
+    def reset(self) -> None: ...
+    @property
+    def stopped(self) -> bool: ...
+    def step(self, state_hash: int, changed_nets: Iterable[int]) -> bool: ...
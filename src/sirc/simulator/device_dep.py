@@ -1,9 +1,40 @@
 """SIRC Device Simulator Dependency Module."""
 
 from __future__ import annotations
-from ..core.node import Node
-from ..core.logic_device import LogicDevice
-from ..core.transistor import Transistor
+from array import array
+from typing import Any, Callable, Final, Generic, Iterator, Sequence, TypeVar, overload
+from weakref import KeyedRef
+from ..core.logic_value import Z, ZERO, ONE
+from ..core.node import Node, BASE_NODE_KIND, GATE_NODE_KIND
+from ..core.logic_device import (
+    LogicDevice,
+    VDD,
+    GND,
+    Input,
+    Probe,
+    Port,
+    GND_DEVICE_KIND,
+    VDD_DEVICE_KIND,
+    INPUT_DEVICE_KIND,
+    PROBE_DEVICE_KIND,
+    PORT_DEVICE_KIND,
+)
+from ..core.transistor import (
+    Transistor,
+    NMOS,
+    PMOS,
+    NMOS_TRANSISTOR_KIND,
+    PMOS_TRANSISTOR_KIND,
+)
+
+_DeviceT = TypeVar("_DeviceT", bound=LogicDevice)
+_TransistorT = TypeVar("_TransistorT", bound=Transistor)
+_HandleT = TypeVar("_HandleT", bound=Node | LogicDevice | Transistor)
+
+# Handle class of every raw kind, indexed by that kind.
+NODE_CLASSES: Final[tuple[type[Node], ...]] = (Node, Node)
+DEVICE_CLASSES: Final[tuple[type[LogicDevice], ...]] = (GND, VDD, Input, Probe, Port)
+TRANSISTOR_CLASSES: Final[tuple[type[Transistor], ...]] = (NMOS, PMOS)
 
 
 # pylint: disable=too-few-public-methods, too-many-instance-attributes
@@ -14,10 +45,16 @@ class DeviceSimulatorState:
     Centralised mutable state owned by DeviceSimulator. This structure stores
     both simulation entities and graph representations used during evaluation.
 
+    Dense columns are typed arrays: array("B") for raw kinds and logic
+    values, array("I") for ids, array("Q") for CSR offsets and bytearray for
+    flags. They index like lists, hold one machine value per element instead
+    of a boxed int pointer, and expose the buffer protocol. Per-net member
+    lists and the event-engine component scratch stay Python lists.
+
     Properties
     ----------
     nodes:
-        Dense list of Node handles.
+        Lazy HandleTable of Node handles, sized by node_kinds.
         Invariant: nodes[i].id_ == i.
         Nodes do not own runtime state; they read from node_* arrays.
 
@@ -34,7 +71,7 @@ class DeviceSimulatorState:
         Written by the simulator during evaluation and exposed through Node.
 
     devices:
-        Dense list of LogicDevice handles.
+        Lazy HandleTable of LogicDevice handles, sized by device_kinds.
         Invariant: devices[i].id_ == i.
         Devices do not own runtime state; they read from device_* arrays.
 
@@ -47,7 +84,7 @@ class DeviceSimulatorState:
         Invariant: device_nodes[device_id] -> node_id.
 
     transistors:
-        Dense list of Transistor handles.
+        Lazy HandleTable of Transistor handles, sized by transistor_kinds.
         Invariant: transistors[i].id_ == i.
         Transistors do not own runtime state; they read from transistor_* arrays.
 
@@ -68,16 +105,19 @@ class DeviceSimulatorState:
         Invariant: transistor_drains[transistor_id] -> drain node_id.
 
     transistor_conducting:
-        Dense array storing current simulator-computed conduction state.
-        Invariant: transistor_conducting[transistor_id] is True when the
-        source-drain channel is currently connected.
+        Dense bytearray storing current simulator-computed conduction state.
+        Invariant: transistor_conducting[transistor_id] is 1 when the
+        source-drain channel is currently connected, else 0.
 
     wire_edges:
         AoS static undirected edge list for user-defined Node connections.
         Each edge is stored canonically as (min_node_id, max_node_id).
+        Only the storage selected by DeviceSimulator(edge_storage=...) is
+        populated; the others stay empty.
 
     wire_edge_index:
-        Mapping from canonical AoS edge tuple to index in wire_edges.
+        Mapping from canonical edge tuple to index in wire_edges (AoS) or
+        wire_edge_a / wire_edge_b (SoA).
         Provides O(1) lookup, deduplication, and swap-remove deletion.
 
     wire_edge_a:
@@ -87,7 +127,7 @@ class DeviceSimulatorState:
     wire_edge_b:
         SoA static wire edge endpoint array.
         Stores the second canonical node ID for each wire edge.
-        Invariant: (wire_edge_a[i], wire_edge_b[i]) matches wire_edges[i].
+        Invariant: (wire_edge_a[i], wire_edge_b[i]) is a canonical edge.
 
     wire_edge_keys:
         Packed-SoA static wire edge array.
@@ -96,6 +136,175 @@ class DeviceSimulatorState:
     wire_edge_key_index:
         Mapping from packed canonical edge key to index in wire_edge_keys.
         Provides O(1) lookup, deduplication, and swap-remove deletion.
+
+    static_offsets:
+        CSR offsets of the static wire adjacency, one entry per Node plus one.
+        Built by build_topology from the wire edge storage.
+
+    static_indices:
+        CSR neighbor Node ids of the static wire adjacency. Neighbors of node
+        n are static_indices[static_offsets[n]:static_offsets[n + 1]].
+
+    node_nets:
+        Dense array mapping each Node to its net id.
+        A net is a set of Nodes joined by static wire edges; build_topology
+        collapses each such set once with a union-find over the wire edges.
+
+    net_nodes:
+        Per-net list of member Node ids.
+
+    net_default_values:
+        Per-net OR of the default values of its Nodes (driver-presence mask).
+        Refreshed at the start of a tick for nets holding pending Nodes.
+
+    net_resolved_values:
+        Per-net raw resolved value, mirrored into node_resolved_values.
+        Reset by build_topology to -1, which no LogicValue or conduction rule
+        matches, so the first resolution writes and reports every net. The
+        marker makes this the one signed (array("b")) logic-value column.
+
+    transistor_gate_nets:
+        Dense array mapping each Transistor to the net of its gate Node.
+
+    transistor_source_nets:
+        Dense array mapping each Transistor to the net of its source Node.
+
+    transistor_drain_nets:
+        Dense array mapping each Transistor to the net of its drain Node.
+
+    net_channel_offsets:
+        CSR offsets of the channel index, one entry per net plus one.
+
+    net_channel_transistors:
+        CSR transistor ids of the channel index. Transistors whose channel
+        leaves net n are listed in
+        net_channel_transistors[net_channel_offsets[n]:net_channel_offsets[n + 1]].
+        The sweep DFS follows those whose transistor_conducting entry is set.
+
+    net_channel_peers:
+        Parallel to net_channel_transistors: the net on the other side of
+        each listed channel.
+
+    net_fanout_offsets:
+        CSR offsets of the gate-fanout index, one entry per net plus one.
+
+    net_fanout:
+        CSR transistor ids of the gate-fanout index. Transistors gated by net
+        n are net_fanout[net_fanout_offsets[n]:net_fanout_offsets[n + 1]].
+        Used to re-evaluate only the transistors whose gate value changed.
+
+    net_ccc:
+        Dense array mapping each net to its channel-connected component
+        (CCC), or -1 for supply rails (nets holding a VDD or GND terminal).
+        A CCC is a maximal set of non-rail nets joined by transistor
+        channels; see sirc.simulator.ccc.
+
+    transistor_ccc:
+        Dense array mapping each Transistor to the CCC its channel lies in.
+
+    transistor_ccc_gate:
+        Position of each Transistor's gate net among its CCC's input nets.
+
+    transistor_ccc_source:
+        Local vertex of each Transistor's source net within its CCC: output
+        nets are numbered first, then the CCC's rails.
+
+    transistor_ccc_drain:
+        Local vertex of each Transistor's drain net within its CCC.
+
+    ccc_output_offsets:
+        CSR offsets of the CCC output index, one entry per CCC plus one.
+
+    ccc_output_nets:
+        CSR net ids driven by each CCC: the nets of CCC c are
+        ccc_output_nets[ccc_output_offsets[c]:ccc_output_offsets[c + 1]].
+
+    ccc_input_offsets:
+        CSR offsets of the CCC input index, one entry per CCC plus one.
+
+    ccc_input_nets:
+        CSR distinct gate nets of each CCC's transistors.
+
+    ccc_rail_offsets:
+        CSR offsets of the CCC rail index, one entry per CCC plus one.
+
+    ccc_rail_nets:
+        CSR distinct rail nets reached by each CCC's channels.
+
+    ccc_transistor_offsets:
+        CSR offsets of the CCC transistor index, one entry per CCC plus one.
+
+    ccc_transistors:
+        CSR transistor ids of each CCC.
+
+    ccc_levels:
+        Dense array of CCC levels. A CCC whose output gates another sits
+        below it, except inside a strongly connected feedback region,
+        whose CCCs share one level.
+
+    ccc_feedback:
+        Dense bytearray flagging CCCs that are part of a feedback region:
+        a strongly connected set of CCCs, or one CCC gating itself.
+
+    ccc_signatures:
+        Dense array of interned structural signatures, one per CCC. CCCs
+        with equal signatures are the same cell and solve identically for
+        equal input gate values and output defaults.
+
+    net_ccc_fanout_offsets:
+        CSR offsets of the CCC fanout index, one entry per net plus one.
+
+    net_ccc_fanout:
+        CSR ids of the CCCs gated by each net, each listed once.
+
+    rail_ccc_offsets:
+        CSR offsets of the rail attachment index, one entry per net plus
+        one; only rail nets have entries.
+
+    rail_cccs:
+        CSR ids of the CCCs whose channels reach each rail.
+
+    components:
+        Net-groups connected by conducting channels.
+        Built by the sweep propagation mode on the python backend.
+
+    component_id:
+        Dense array mapping each net to its index in components.
+        Built by the sweep propagation mode on the python backend.
+
+    net_channels:
+        Per-net list of conducting transistor ids whose channel leaves the
+        net. Channels with both terminals on one net are not recorded.
+
+    channel_slots:
+        Per-transistor pair of indices into net_channels: entry 2*t for the
+        source-side net and 2*t+1 for the drain-side net. Enables O(1)
+        swap-remove when a channel turns off.
+
+    net_component:
+        Per-net index into component_nets. Empty until the first
+        event-driven tick after build_topology.
+
+    net_position:
+        Per-net index of the net inside its component_nets entry.
+        Enables O(1) swap-remove when a component is re-split.
+
+    component_nets:
+        Per-component list of nets joined by conducting channels.
+        Entries listed in component_free are empty and reusable.
+
+    component_drivers:
+        Per-component [zero, one, x] counts of nets driving each bit.
+        Counts, unlike OR masks, can be updated when groups leave.
+
+    component_values:
+        Per-component raw resolved value.
+
+    component_free:
+        Stack of component indices released by merges.
+
+    pending_nodes:
+        Node ids whose default value changed since the last tick.
     """
 
     __slots__ = (
@@ -118,34 +327,537 @@ class DeviceSimulatorState:
         "wire_edge_b",
         "wire_edge_keys",
         "wire_edge_key_index",
-        "static_neighbors",
-        "dynamic_neighbors",
+        "static_offsets",
+        "static_indices",
+        "node_nets",
+        "net_nodes",
+        "net_default_values",
+        "net_resolved_values",
+        "transistor_gate_nets",
+        "transistor_source_nets",
+        "transistor_drain_nets",
+        "net_channel_offsets",
+        "net_channel_transistors",
+        "net_channel_peers",
+        "net_fanout_offsets",
+        "net_fanout",
+        "net_ccc",
+        "transistor_ccc",
+        "transistor_ccc_gate",
+        "transistor_ccc_source",
+        "transistor_ccc_drain",
+        "ccc_output_offsets",
+        "ccc_output_nets",
+        "ccc_input_offsets",
+        "ccc_input_nets",
+        "ccc_rail_offsets",
+        "ccc_rail_nets",
+        "ccc_transistor_offsets",
+        "ccc_transistors",
+        "ccc_levels",
+        "ccc_feedback",
+        "ccc_signatures",
+        "net_ccc_fanout_offsets",
+        "net_ccc_fanout",
+        "rail_ccc_offsets",
+        "rail_cccs",
         "components",
         "component_id",
+        "net_channels",
+        "channel_slots",
+        "net_component",
+        "net_position",
+        "component_nets",
+        "component_drivers",
+        "component_values",
+        "component_free",
+        "pending_nodes",
     )
 
     def __init__(self) -> None:
         """Initialise the Device Simulator State."""
-        self.nodes: list[Node] = []
-        self.node_kinds: list[int] = []
-        self.node_default_values: list[int] = []
-        self.node_resolved_values: list[int] = []
-        self.devices: list[LogicDevice] = []
-        self.device_kinds: list[int] = []
-        self.device_nodes: list[int] = []
-        self.transistors: list[Transistor] = []
-        self.transistor_kinds: list[int] = []
-        self.transistor_gates: list[int] = []
-        self.transistor_sources: list[int] = []
-        self.transistor_drains: list[int] = []
-        self.transistor_conducting: list[bool] = []
+        self.nodes: HandleTable[Node] = HandleTable(self, "node_kinds", NODE_CLASSES)
+        self.node_kinds: array[int] = array("B")
+        self.node_default_values: array[int] = array("B")
+        self.node_resolved_values: array[int] = array("B")
+        self.devices: HandleTable[LogicDevice] = HandleTable(
+            self, "device_kinds", DEVICE_CLASSES
+        )
+        self.device_kinds: array[int] = array("B")
+        self.device_nodes: array[int] = array("I")
+        self.transistors: HandleTable[Transistor] = HandleTable(
+            self, "transistor_kinds", TRANSISTOR_CLASSES
+        )
+        self.transistor_kinds: array[int] = array("B")
+        self.transistor_gates: array[int] = array("I")
+        self.transistor_sources: array[int] = array("I")
+        self.transistor_drains: array[int] = array("I")
+        self.transistor_conducting: bytearray = bytearray()
         self.wire_edges: list[tuple[int, int]] = []
         self.wire_edge_index: dict[tuple[int, int], int] = {}
-        self.wire_edge_a: list[int] = []
-        self.wire_edge_b: list[int] = []
-        self.wire_edge_keys: list[int] = []
+        self.wire_edge_a: array[int] = array("I")
+        self.wire_edge_b: array[int] = array("I")
+        self.wire_edge_keys: array[int] = array("Q")
         self.wire_edge_key_index: dict[int, int] = {}
-        self.static_neighbors: list[list[int]] = []
-        self.dynamic_neighbors: list[list[int]] = []
+        self.static_offsets: array[int] = array("Q")
+        self.static_indices: array[int] = array("I")
+        self.node_nets: array[int] = array("I")
+        self.net_nodes: list[list[int]] = []
+        self.net_default_values: array[int] = array("B")
+        self.net_resolved_values: array[int] = array("b")
+        self.transistor_gate_nets: array[int] = array("I")
+        self.transistor_source_nets: array[int] = array("I")
+        self.transistor_drain_nets: array[int] = array("I")
+        self.net_channel_offsets: array[int] = array("Q")
+        self.net_channel_transistors: array[int] = array("I")
+        self.net_channel_peers: array[int] = array("I")
+        self.net_fanout_offsets: array[int] = array("Q")
+        self.net_fanout: array[int] = array("I")
+        self.net_ccc: array[int] = array("i")
+        self.transistor_ccc: array[int] = array("I")
+        self.transistor_ccc_gate: array[int] = array("I")
+        self.transistor_ccc_source: array[int] = array("I")
+        self.transistor_ccc_drain: array[int] = array("I")
+        self.ccc_output_offsets: array[int] = array("Q")
+        self.ccc_output_nets: array[int] = array("I")
+        self.ccc_input_offsets: array[int] = array("Q")
+        self.ccc_input_nets: array[int] = array("I")
+        self.ccc_rail_offsets: array[int] = array("Q")
+        self.ccc_rail_nets: array[int] = array("I")
+        self.ccc_transistor_offsets: array[int] = array("Q")
+        self.ccc_transistors: array[int] = array("I")
+        self.ccc_levels: array[int] = array("I")
+        self.ccc_feedback: bytearray = bytearray()
+        self.ccc_signatures: array[int] = array("I")
+        self.net_ccc_fanout_offsets: array[int] = array("Q")
+        self.net_ccc_fanout: array[int] = array("I")
+        self.rail_ccc_offsets: array[int] = array("Q")
+        self.rail_cccs: array[int] = array("I")
         self.components: list[list[int]] = []
         self.component_id: list[int] = []
+        self.net_channels: list[list[int]] = []
+        self.channel_slots: list[int] = []
+        self.net_component: list[int] = []
+        self.net_position: list[int] = []
+        self.component_nets: list[list[int]] = []
+        self.component_drivers: list[list[int]] = []
+        self.component_values: list[int] = []
+        self.component_free: list[int] = []
+        self.pending_nodes: list[int] = []
+
+
+class IdentificationFactory:
+    """
+    Identification Factory
+
+    Allocates dense, monotonic ids. Nodes, LogicDevices, and Transistors use
+    independent counters, each starting at zero.
+    """
+
+    __slots__ = ("_node_id", "_device_id", "_transistor_id")
+
+    def __init__(self) -> None:
+        """Initialise all id counters to zero."""
+        self._node_id = 0
+        self._device_id = 0
+        self._transistor_id = 0
+
+    def allocate_node_id(self) -> int:
+        """Allocate the next Node id."""
+        node_id = self._node_id
+        self._node_id = node_id + 1
+        return node_id
+
+    def allocate_device_id(self) -> int:
+        """Allocate the next LogicDevice id."""
+        device_id = self._device_id
+        self._device_id = device_id + 1
+        return device_id
+
+    def allocate_transistor_id(self) -> int:
+        """Allocate the next Transistor id."""
+        transistor_id = self._transistor_id
+        self._transistor_id = transistor_id + 1
+        return transistor_id
+
+    def allocate_node_ids(self, n: int) -> range:
+        """Allocate the next n Node ids; n must not be negative."""
+        if n < 0:
+            raise ValueError(f"n must be >= 0, got {n}")
+
+        start = self._node_id
+        self._node_id = start + n
+        return range(start, start + n)
+
+    def allocate_device_ids(self, n: int) -> range:
+        """Allocate the next n LogicDevice ids; n must not be negative."""
+        if n < 0:
+            raise ValueError(f"n must be >= 0, got {n}")
+
+        start = self._device_id
+        self._device_id = start + n
+        return range(start, start + n)
+
+    def allocate_transistor_ids(self, n: int) -> range:
+        """Allocate the next n Transistor ids; n must not be negative."""
+        if n < 0:
+            raise ValueError(f"n must be >= 0, got {n}")
+
+        start = self._transistor_id
+        self._transistor_id = start + n
+        return range(start, start + n)
+
+
+class NodeFactory:
+    """
+    Node Factory
+
+    Appends node records to DeviceSimulatorState dense arrays and returns the
+    matching Node handles. A fresh state is created when none is given.
+    """
+
+    __slots__ = ("_id_f", "state")
+
+    def __init__(
+        self,
+        id_factory: IdentificationFactory,
+        state: DeviceSimulatorState | None = None,
+    ) -> None:
+        """Bind the factory to an id allocator and simulator state."""
+        self._id_f = id_factory
+        self.state = DeviceSimulatorState() if state is None else state
+
+    def create_node_record(self, kind: int, default_value: int = Z) -> int:
+        """Append one node record and return its id without a handle."""
+        state = self.state
+        # Grow the view-exportable column first: BufferError leaves no record.
+        state.node_resolved_values.append(Z)
+        node_id = self._id_f.allocate_node_id()
+        state.node_kinds.append(kind)
+        state.node_default_values.append(default_value)
+        return node_id
+
+    def create_base_node(self, default_value: int = Z) -> Node:
+        """Create a BASE Node."""
+        return self.state.nodes[self.create_node_record(BASE_NODE_KIND, default_value)]
+
+    def create_gate_node(self) -> Node:
+        """Create a GATE Node."""
+        return self.state.nodes[self.create_node_record(GATE_NODE_KIND)]
+
+    def create_node_records(
+        self, kinds: Sequence[int], default_value: int = Z
+    ) -> range:
+        """Append len(kinds) node records in one pass and return their ids."""
+        state = self.state
+        state.node_resolved_values.extend([Z] * len(kinds))
+        node_ids = self._id_f.allocate_node_ids(len(kinds))
+        state.node_kinds.extend(kinds)
+        state.node_default_values.extend([default_value] * len(kinds))
+        return node_ids
+
+
+class LogicDeviceFactory:
+    """
+    Logic Device Factory
+
+    Appends device records and their terminal Nodes to the state shared with
+    the given NodeFactory.
+    """
+
+    __slots__ = ("_id_f", "_node_f")
+
+    def __init__(
+        self, id_factory: IdentificationFactory, node_factory: NodeFactory
+    ) -> None:
+        """Bind the factory to an id allocator and node factory."""
+        self._id_f = id_factory
+        self._node_f = node_factory
+
+    def _create_device(
+        self, device_class: type[_DeviceT], kind: int, default_value: int
+    ) -> _DeviceT:
+        """Append one device record and return its handle."""
+        node_id = self._node_f.create_node_record(BASE_NODE_KIND, default_value)
+        state = self._node_f.state
+        device = device_class(state, self._id_f.allocate_device_id())
+        state.device_kinds.append(kind)
+        state.device_nodes.append(node_id)
+        state.devices.register(device)
+        return device
+
+    def create_vdd(self) -> VDD:
+        """Create a VDD device."""
+        return self._create_device(VDD, VDD_DEVICE_KIND, ONE)
+
+    def create_gnd(self) -> GND:
+        """Create a GND device."""
+        return self._create_device(GND, GND_DEVICE_KIND, ZERO)
+
+    def create_input(self) -> Input:
+        """Create an Input device."""
+        return self._create_device(Input, INPUT_DEVICE_KIND, Z)
+
+    def create_probe(self) -> Probe:
+        """Create a Probe device."""
+        return self._create_device(Probe, PROBE_DEVICE_KIND, Z)
+
+    def create_port(self) -> Port:
+        """Create a Port device."""
+        return self._create_device(Port, PORT_DEVICE_KIND, Z)
+
+    def create_ports(self, n: int) -> DeviceRange[Port]:
+        """Create n Port devices with consecutive ids and terminal Nodes."""
+        node_ids = self._node_f.create_node_records([BASE_NODE_KIND] * n)
+        state = self._node_f.state
+        device_ids = self._id_f.allocate_device_ids(n)
+        state.device_kinds.extend([PORT_DEVICE_KIND] * n)
+        state.device_nodes.extend(node_ids)
+        return DeviceRange(state.devices, device_ids, node_ids)
+
+
+class TransistorFactory:
+    """
+    Transistor Factory
+
+    Appends transistor records and their gate, source, and drain Nodes (in
+    that order) to the state shared with the given NodeFactory.
+    """
+
+    __slots__ = ("_id_f", "_node_f")
+
+    def __init__(
+        self, id_factory: IdentificationFactory, node_factory: NodeFactory
+    ) -> None:
+        """Bind the factory to an id allocator and node factory."""
+        self._id_f = id_factory
+        self._node_f = node_factory
+
+    def _create_transistor(
+        self, transistor_class: type[_TransistorT], kind: int
+    ) -> _TransistorT:
+        """Append one transistor record and return its handle."""
+        node_f = self._node_f
+        state = node_f.state
+        # Grow both view-exportable columns before any record is appended:
+        # a BufferError from either one leaves no record behind.
+        state.transistor_conducting.append(False)
+
+        try:
+            gate_id = node_f.create_node_record(GATE_NODE_KIND)
+        except BufferError:
+            state.transistor_conducting.pop()
+            raise
+
+        source_id = node_f.create_node_record(BASE_NODE_KIND)
+        drain_id = node_f.create_node_record(BASE_NODE_KIND)
+        transistor = transistor_class(state, self._id_f.allocate_transistor_id())
+        state.transistor_kinds.append(kind)
+        state.transistor_gates.append(gate_id)
+        state.transistor_sources.append(source_id)
+        state.transistor_drains.append(drain_id)
+        state.transistors.register(transistor)
+        return transistor
+
+    def create_nmos(self) -> NMOS:
+        """Create an NMOS transistor."""
+        return self._create_transistor(NMOS, NMOS_TRANSISTOR_KIND)
+
+    def create_pmos(self) -> PMOS:
+        """Create a PMOS transistor."""
+        return self._create_transistor(PMOS, PMOS_TRANSISTOR_KIND)
+
+    def _create_transistors(self, kind: int, n: int) -> TransistorRange[Any]:
+        """Append n transistor records in one pass and return their id range."""
+        node_f = self._node_f
+        state = node_f.state
+        conducting = state.transistor_conducting
+        count = len(conducting)
+        # Grow both view-exportable columns before any record is appended,
+        # as in _create_transistor. A negative n appends nothing before
+        # allocate_transistor_ids rejects it.
+        conducting.extend(bytes(max(n, 0)))
+
+        try:
+            node_ids = node_f.create_node_records(
+                [GATE_NODE_KIND, BASE_NODE_KIND, BASE_NODE_KIND] * n
+            )
+        except BufferError:
+            del conducting[count:]
+            raise
+
+        transistor_ids = self._id_f.allocate_transistor_ids(n)
+        state.transistor_kinds.extend([kind] * n)
+        state.transistor_gates.extend(node_ids[0::3])
+        state.transistor_sources.extend(node_ids[1::3])
+        state.transistor_drains.extend(node_ids[2::3])
+        return TransistorRange(state.transistors, transistor_ids, node_ids)
+
+    def create_nmos_batch(self, n: int) -> TransistorRange[NMOS]:
+        """Create n NMOS transistors with consecutive ids."""
+        return self._create_transistors(NMOS_TRANSISTOR_KIND, n)
+
+    def create_pmos_batch(self, n: int) -> TransistorRange[PMOS]:
+        """Create n PMOS transistors with consecutive ids."""
+        return self._create_transistors(PMOS_TRANSISTOR_KIND, n)
+
+
+class HandleTable(Generic[_HandleT]):
+    """
+    Handle Table
+
+    Lazy, read-only sequence of entity handles over one dense kind array of
+    a DeviceSimulatorState. Its length is the kind array's length. A handle
+    is built from classes[kind] on first access and cached by weak
+    reference, so no handle exists until asked for and a handle the caller
+    still references is returned again unchanged. A reference removes its
+    own cache entry when its handle dies, so the cache only holds live
+    handles.
+    """
+
+    __slots__ = ("_state", "_kinds", "_classes", "_cache", "_evict")
+
+    def __init__(
+        self,
+        state: DeviceSimulatorState,
+        kinds: str,
+        classes: Sequence[Callable[[DeviceSimulatorState, int], _HandleT]],
+    ) -> None:
+        """Bind the table to the state kind array named kinds."""
+        self._state = state
+        self._kinds = kinds
+        self._classes = tuple(classes)
+        cache: dict[int, KeyedRef[int, _HandleT]] = {}
+        self._cache = cache
+
+        def evict(dead: KeyedRef[int, _HandleT]) -> None:
+            # A newer handle may already be cached under the same id.
+            if cache.get(dead.key) is dead:
+                del cache[dead.key]
+
+        self._evict = evict
+
+    def register(self, handle: _HandleT) -> None:
+        """Cache a handle just built by a factory for its id."""
+        self._cache[handle.id_] = KeyedRef(handle, self._evict, handle.id_)
+
+    def _handle(self, id_: int) -> _HandleT:
+        """Return the cached handle for id_, building it if needed."""
+        cached = self._cache.get(id_)
+        handle = None if cached is None else cached()
+
+        if handle is None:
+            kind = getattr(self._state, self._kinds)[id_]
+            handle = self._classes[kind](self._state, id_)
+            self._cache[id_] = KeyedRef(handle, self._evict, id_)
+
+        return handle
+
+    def __len__(self) -> int:
+        return len(getattr(self._state, self._kinds))
+
+    @overload
+    def __getitem__(self, index: int) -> _HandleT:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[_HandleT]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> _HandleT | list[_HandleT]:
+        if isinstance(index, slice):
+            return [self._handle(i) for i in range(len(self))[index]]
+
+        # Fast path: a live handle is only ever cached under its own id.
+        cached = self._cache.get(index)
+
+        if cached is not None:
+            handle = cached()
+
+            if handle is not None:
+                return handle
+
+        count = len(getattr(self._state, self._kinds))
+
+        if index < 0:
+            index += count
+
+        if not 0 <= index < count:
+            raise IndexError(f"Handle id out of range: {index!r}")
+
+        return self._handle(index)
+
+    def __iter__(self) -> Iterator[_HandleT]:
+        return (self._handle(i) for i in range(len(self)))
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self._kinds} len={len(self)}>"
+
+
+class HandleRange(Generic[_HandleT]):
+    """
+    Handle Range
+
+    Read-only view of consecutive entity ids returned by the batch creation
+    APIs. ids is the raw id range; indexing or iterating yields handles from
+    the backing state HandleTable only when asked for.
+    """
+
+    __slots__ = ("_handles", "ids")
+
+    def __init__(self, handles: HandleTable[Any], ids: range) -> None:
+        """Bind the view to a state handle table and an id range."""
+        self._handles = handles
+        self.ids = ids
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @overload
+    def __getitem__(self, index: int) -> _HandleT:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[_HandleT]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> _HandleT | list[_HandleT]:
+        if isinstance(index, slice):
+            return [self._handles[i] for i in self.ids[index]]
+        return self._handles[self.ids[index]]
+
+    def __iter__(self) -> Iterator[_HandleT]:
+        handles = self._handles
+        return (handles[i] for i in self.ids)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} ids={self.ids!r}>"
+
+
+class DeviceRange(HandleRange[_DeviceT]):
+    """Handle Range of LogicDevices; nodes lists their terminal Node ids."""
+
+    __slots__ = ("nodes",)
+
+    def __init__(self, handles: HandleTable[Any], ids: range, nodes: range) -> None:
+        """Bind the view and record the terminal Node id range."""
+        super().__init__(handles, ids)
+        self.nodes = nodes
+
+
+class TransistorRange(HandleRange[_TransistorT]):
+    """
+    Handle Range of Transistors.
+
+    gates, sources and drains are the terminal Node id ranges, aligned
+    with ids.
+    """
+
+    __slots__ = ("gates", "sources", "drains")
+
+    def __init__(self, handles: HandleTable[Any], ids: range, nodes: range) -> None:
+        """Bind the view and split the terminal Node ids by role."""
+        super().__init__(handles, ids)
+        self.gates = nodes[0::3]
+        self.sources = nodes[1::3]
+        self.drains = nodes[2::3]
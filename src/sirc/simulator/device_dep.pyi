@@ -1,29 +1,165 @@
-from ..core.logic_device import LogicDevice as LogicDevice
+from ..core.logic_device import (
+    GND as GND,
+    Input as Input,
+    LogicDevice as LogicDevice,
+    Port as Port,
+    Probe as Probe,
+    VDD as VDD,
+)
 from ..core.node import Node as Node
-from ..core.transistor import Transistor as Transistor
+from ..core.transistor import NMOS as NMOS, PMOS as PMOS, Transistor as Transistor
+from array import array
+from typing import Any, Callable, Final, Generic, Iterator, Sequence, TypeVar, overload
+
+_DeviceT = TypeVar("_DeviceT", bound=LogicDevice)
+_TransistorT = TypeVar("_TransistorT", bound=Transistor)
+_HandleT = TypeVar("_HandleT", bound=Node | LogicDevice | Transistor)
+
+NODE_CLASSES: Final[tuple[type[Node], ...]]
+DEVICE_CLASSES: Final[tuple[type[LogicDevice], ...]]
+TRANSISTOR_CLASSES: Final[tuple[type[Transistor], ...]]
 
 class DeviceSimulatorState:
-    nodes: list[Node]
-    node_kinds: list[int]
-    node_default_values: list[int]
-    node_resolved_values: list[int]
-    devices: list[LogicDevice]
-    device_kinds: list[int]
-    device_nodes: list[int]
-    transistors: list[Transistor]
-    transistor_kinds: list[int]
-    transistor_gates: list[int]
-    transistor_sources: list[int]
-    transistor_drains: list[int]
-    transistor_conducting: list[bool]
+    nodes: HandleTable[Node]
+    node_kinds: array[int]
+    node_default_values: array[int]
+    node_resolved_values: array[int]
+    devices: HandleTable[LogicDevice]
+    device_kinds: array[int]
+    device_nodes: array[int]
+    transistors: HandleTable[Transistor]
+    transistor_kinds: array[int]
+    transistor_gates: array[int]
+    transistor_sources: array[int]
+    transistor_drains: array[int]
+    transistor_conducting: bytearray
     wire_edges: list[tuple[int, int]]
     wire_edge_index: dict[tuple[int, int], int]
-    wire_edge_a: list[int]
-    wire_edge_b: list[int]
-    wire_edge_keys: list[int]
+    wire_edge_a: array[int]
+    wire_edge_b: array[int]
+    wire_edge_keys: array[int]
     wire_edge_key_index: dict[int, int]
-    static_neighbors: list[list[int]]
-    dynamic_neighbors: list[list[int]]
+    static_offsets: array[int]
+    static_indices: array[int]
+    node_nets: array[int]
+    net_nodes: list[list[int]]
+    net_default_values: array[int]
+    net_resolved_values: array[int]
+    transistor_gate_nets: array[int]
+    transistor_source_nets: array[int]
+    transistor_drain_nets: array[int]
+    net_channel_offsets: array[int]
+    net_channel_transistors: array[int]
+    net_channel_peers: array[int]
+    net_fanout_offsets: array[int]
+    net_fanout: array[int]
+    net_ccc: array[int]
+    transistor_ccc: array[int]
+    transistor_ccc_gate: array[int]
+    transistor_ccc_source: array[int]
+    transistor_ccc_drain: array[int]
+    ccc_output_offsets: array[int]
+    ccc_output_nets: array[int]
+    ccc_input_offsets: array[int]
+    ccc_input_nets: array[int]
+    ccc_rail_offsets: array[int]
+    ccc_rail_nets: array[int]
+    ccc_transistor_offsets: array[int]
+    ccc_transistors: array[int]
+    ccc_levels: array[int]
+    ccc_feedback: bytearray
+    ccc_signatures: array[int]
+    net_ccc_fanout_offsets: array[int]
+    net_ccc_fanout: array[int]
+    rail_ccc_offsets: array[int]
+    rail_cccs: array[int]
     components: list[list[int]]
     component_id: list[int]
+    net_channels: list[list[int]]
+    channel_slots: list[int]
+    net_component: list[int]
+    net_position: list[int]
+    component_nets: list[list[int]]
+    component_drivers: list[list[int]]
+    component_values: list[int]
+    component_free: list[int]
+    pending_nodes: list[int]
+    def __init__(self) -> None: ...
+
+class IdentificationFactory:
     def __init__(self) -> None: ...
+    def allocate_node_id(self) -> int: ...
+    def allocate_device_id(self) -> int: ...
+    def allocate_transistor_id(self) -> int: ...
+    def allocate_node_ids(self, n: int) -> range: ...
+    def allocate_device_ids(self, n: int) -> range: ...
+    def allocate_transistor_ids(self, n: int) -> range: ...
+
+class NodeFactory:
+    state: DeviceSimulatorState
+    def __init__(
+        self,
+        id_factory: IdentificationFactory,
+        state: DeviceSimulatorState | None = None,
+    ) -> None: ...
+    def create_node_record(self, kind: int, default_value: int = ...) -> int: ...
+    def create_base_node(self, default_value: int = ...) -> Node: ...
+    def create_gate_node(self) -> Node: ...
+    def create_node_records(
+        self, kinds: Sequence[int], default_value: int = ...
+    ) -> range: ...
+
+class LogicDeviceFactory:
+    def __init__(
+        self, id_factory: IdentificationFactory, node_factory: NodeFactory
+    ) -> None: ...
+    def create_vdd(self) -> VDD: ...
+    def create_gnd(self) -> GND: ...
+    def create_input(self) -> Input: ...
+    def create_probe(self) -> Probe: ...
+    def create_port(self) -> Port: ...
+    def create_ports(self, n: int) -> DeviceRange[Port]: ...
+
+class TransistorFactory:
+    def __init__(
+        self, id_factory: IdentificationFactory, node_factory: NodeFactory
+    ) -> None: ...
+    def create_nmos(self) -> NMOS: ...
+    def create_pmos(self) -> PMOS: ...
+    def create_nmos_batch(self, n: int) -> TransistorRange[NMOS]: ...
+    def create_pmos_batch(self, n: int) -> TransistorRange[PMOS]: ...
+
+class HandleTable(Generic[_HandleT]):
+    def __init__(
+        self,
+        state: DeviceSimulatorState,
+        kinds: str,
+        classes: Sequence[Callable[[DeviceSimulatorState, int], _HandleT]],
+    ) -> None: ...
+    def register(self, handle: _HandleT) -> None: ...
+    def __len__(self) -> int: ...
+    @overload
+    def __getitem__(self, index: int) -> _HandleT: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[_HandleT]: ...
+    def __iter__(self) -> Iterator[_HandleT]: ...
+
+class HandleRange(Generic[_HandleT]):
+    ids: range
+    def __init__(self, handles: HandleTable[Any], ids: range) -> None: ...
+    def __len__(self) -> int: ...
+    @overload
+    def __getitem__(self, index: int) -> _HandleT: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[_HandleT]: ...
+    def __iter__(self) -> Iterator[_HandleT]: ...
+
+class DeviceRange(HandleRange[_DeviceT]):
+    nodes: range
+    def __init__(self, handles: HandleTable[Any], ids: range, nodes: range) -> None: ...
+
+class TransistorRange(HandleRange[_TransistorT]):
+    gates: range
+    sources: range
+    drains: range
+    def __init__(self, handles: HandleTable[Any], ids: range, nodes: range) -> None: ...
@@ -5,21 +5,142 @@ Provides the DeviceSimulator class, responsible for evaluating a circuit
 composed of Nodes, LogicDevices, and Transistors. The simulator performs
 fixed-point iteration to resolve driver values, establish dynamic conduction
 paths, and propagate LogicValues across connected node-groups.
+
+Propagation modes
+-----------------
+
+event:
+    Default. Keeps a worklist of nodes whose resolved value changed,
+    re-evaluates only the transistors gated by those nodes, and re-resolves
+    only the affected groups. Connectivity is maintained incrementally over
+    nets: a channel turning on merges the smaller component
+    into the larger, a channel turning off re-splits locally, and per-driver
+    counts keep each component's resolved value current. A feed-forward chain
+    settles in O(N) total work.
+
+sweep:
+    Reference full-sweep fixed-point iteration. Every iteration re-evaluates
+    every transistor, rebuilds every node-group, and re-resolves every net.
+
+ccc:
+    Worklist over the channel-connected components (CCCs) that
+    build_topology partitions the nets into, cut at the supply rails. A
+    changed net only re-evaluates the CCCs it gates, in level order, so a
+    feed-forward design settles in one ordered pass and only feedback
+    regions iterate. Solved CCCs are memoized per cell signature and
+    inputs in an LRU cache; see sirc.simulator.ccc. With ccc_threads > 1,
+    large levels are split across a thread pool, which pays off on
+    free-threaded Python builds.
+
+All modes run over nets: build_topology collapses each statically wired
+node set into one net, so only transistor channels remain as graph edges.
+
+Every mode stops a tick that does not settle: a CycleDetector watches the
+fixed-point iterations for a repeated state and for the optional
+max_iterations bound, and the tick then raises OscillationError or, with
+on_oscillation="x", marks the oscillating nets X. See
+sirc.simulator.convergence.
+
+Change collection
+-----------------
+
+tick(changes="nodes") returns the ids of the Nodes whose resolved value
+the tick changed, and tick(changes="probes") the Probes on them, so
+waveform dumps and checks cost O(changes) rather than O(probes). Every
+engine records each net's value before its first write of the tick in a
+journal dict, and the nets whose final value differs are reported.
+
+Edge storages
+-------------
+
+aos:
+    Default. One canonical (a, b) tuple per wire edge, indexed by tuple.
+
+soa:
+    Parallel endpoint lists wire_edge_a / wire_edge_b, indexed by tuple.
+
+psoa:
+    One packed (a << 32) | b int per wire edge, indexed by key. Node ids
+    must fit in 32 bits.
+
+Backends
+--------
+
+python:
+    Default. Pure-Python loops.
+
+bytes:
+    Dependency-free whole-column sweep ticks from sirc.simulator.vectorized,
+    using bytes.translate tables, itemgetter gathers and bytes comparisons.
+    Applies to the sweep propagation mode only.
+
+numpy:
+    Whole-array sweep ticks from sirc.simulator.vectorized. Applies to the
+    sweep propagation mode only, and falls back to python when NumPy is not
+    importable.
 """
 
 from __future__ import annotations
-from ..core.logic_value import LogicValue
+from array import array
+from functools import partial
+from itertools import chain
+from time import perf_counter_ns
+from typing import Callable, Final, Iterable, Sequence, cast
+from os import PathLike
+from ..core.logic_value import Z, ZERO, ONE, X, RESOLVE_TABLE
 from ..core.node import Node
-from ..core.logic_device import LogicDevice, VDD, GND, Input, Probe, Port
-from ..core.transistor import Transistor, NMOS, PMOS
+from ..core.logic_device import VDD, GND, Input, Probe, Port, PROBE_DEVICE_KIND
+from ..core.transistor import NMOS, PMOS
+from .ccc import DEFAULT_CACHE_SIZE, CCCEngine, build_cccs
+from .convergence import (
+    OSCILLATION_ACTIONS,
+    CycleDetector,
+    Oscillation,
+    OscillationError,
+)
+from .tick_stats import (
+    LatencyHistogram,
+    PhaseTimer,
+    TickStats,
+    TickTimings,
+)
+from .compiled import COMPILED_FIELDS, read_compiled, write_compiled
+from .vectorized import HAS_NUMPY, tick_sweep_bytes, tick_sweep_numpy
 from .device_dep import (
     IdentificationFactory,
     NodeFactory,
     LogicDeviceFactory,
     TransistorFactory,
     DeviceSimulatorState,
+    DeviceRange,
+    TransistorRange,
 )
 
+# Gate value that turns a transistor on, indexed by raw transistor kind.
+CONDUCTING_GATE_VALUES: Final[tuple[int, ...]] = (ONE, ZERO)
+
+PROPAGATION_MODES: Final[tuple[str, ...]] = ("event", "sweep", "ccc")
+
+EDGE_STORAGES: Final[tuple[str, ...]] = ("aos", "soa", "psoa")
+
+BACKENDS: Final[tuple[str, ...]] = ("python", "bytes", "numpy")
+
+CHANGE_KINDS: Final[tuple[str, ...]] = ("nodes", "probes")
+
+
+def _id_list(ids: Iterable[int] | memoryview) -> list[int]:
+    """
+    Return a column of raw ids as Python ints. array, memoryview and NumPy
+    columns convert in C through tolist(); NumPy scalars would otherwise
+    overflow when packed into 64-bit keys.
+    """
+    tolist = getattr(ids, "tolist", None)
+
+    if tolist is not None:
+        return tolist()
+
+    return [int(node_id) for node_id in ids]
+
 
 class DeviceSimulator:
     """
@@ -31,86 +152,232 @@ class DeviceSimulator:
     Fixed-point iteration continues until the circuit reaches a stable state.
     """
 
-    __slots__ = ("_id_f", "_node_f", "_device_f", "_transistor_f", "_state")
+    __slots__ = (
+        "_id_f",
+        "_node_f",
+        "_device_f",
+        "_transistor_f",
+        "_state",
+        "_propagation",
+        "_edge_storage",
+        "_backend",
+        "_ccc_engine",
+        "_ccc_cache_size",
+        "_ccc_threads",
+        "_stats",
+        "_timings",
+        "_phase_timer",
+        "_detector",
+        "_on_oscillation",
+        "_last_oscillation",
+        "_journal",
+        "_changed_nodes",
+        "_net_probes",
+        "_frozen",
+    )
+
+    def __init__(
+        self,
+        propagation: str = "event",
+        edge_storage: str = "aos",
+        backend: str = "python",
+        ccc_cache_size: int = DEFAULT_CACHE_SIZE,
+        ccc_threads: int = 1,
+        max_iterations: int | None = None,
+        on_oscillation: str = "raise",
+    ) -> None:
+        """
+        Initialize factories and empty simulator state.
+
+        propagation selects the tick engine: "event", "sweep" or "ccc".
+        edge_storage selects the wire edge layout used by connect, disconnect
+        and build_topology: "aos", "soa" or "psoa".
+        backend selects the sweep implementation: "python", "bytes" or
+        "numpy"; the latter quietly becomes "python" when NumPy is not
+        importable.
+        ccc_cache_size bounds the solved-CCC cache of the "ccc" propagation
+        mode; 0 disables it. ccc_threads is the number of worker threads
+        it evaluates large same-level batches with; 1 disables the pool.
+        max_iterations caps the fixed-point iterations of one tick; None
+        relies on cycle detection alone. on_oscillation is "raise" to raise
+        OscillationError from a tick that does not settle, or "x" to mark
+        its oscillating nets X and return.
+        """
+        if propagation not in PROPAGATION_MODES:
+            raise ValueError(f"Unknown propagation mode: {propagation!r}")
+
+        if edge_storage not in EDGE_STORAGES:
+            raise ValueError(f"Unknown edge storage: {edge_storage!r}")
+
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend!r}")
+
+        if ccc_cache_size < 0:
+            raise ValueError(f"ccc_cache_size must be >= 0, got {ccc_cache_size}")
 
-    def __init__(self) -> None:
-        """Initialize factories and empty simulator state."""
+        if ccc_threads < 1:
+            raise ValueError(f"ccc_threads must be positive: {ccc_threads!r}")
+
+        if on_oscillation not in OSCILLATION_ACTIONS:
+            raise ValueError(f"Unknown oscillation action: {on_oscillation!r}")
+
+        self._state = DeviceSimulatorState()
         self._id_f = IdentificationFactory()
-        self._node_f = NodeFactory(self._id_f)
+        self._node_f = NodeFactory(self._id_f, self._state)
         self._device_f = LogicDeviceFactory(self._id_f, self._node_f)
         self._transistor_f = TransistorFactory(self._id_f, self._node_f)
-        self._state = DeviceSimulatorState()
+        self._propagation = propagation
+        self._edge_storage = edge_storage
+        self._backend = "python" if backend == "numpy" and not HAS_NUMPY else backend
+        self._ccc_engine: CCCEngine | None = None
+        self._ccc_cache_size = ccc_cache_size
+        self._ccc_threads = ccc_threads
+        self._stats = TickStats()
+        self._timings: TickTimings | None = None
+        self._phase_timer: PhaseTimer | None = None
+        self._detector = CycleDetector(max_iterations)
+        self._on_oscillation = on_oscillation
+        self._last_oscillation: Oscillation | None = None
+        # Net -> value before its first write, while a tick collects changes.
+        self._journal: dict[int, int] | None = None
+        self._changed_nodes = array("I")
+        self._net_probes: dict[int, list[Probe]] | None = None
+        self._frozen = False
+
+    @property
+    def state(self) -> DeviceSimulatorState:
+        """Simulator-owned state arrays, shared with lane-parallel engines."""
+        return self._state
+
+    @property
+    def propagation(self) -> str:
+        """Tick engine selected at construction: "event", "sweep" or "ccc"."""
+        return self._propagation
+
+    @property
+    def backend(self) -> str:
+        """Sweep implementation in use: "python", "bytes" or "numpy"."""
+        return self._backend
+
+    @property
+    def ccc_cache_size(self) -> int:
+        """Bound of the ccc engine's solved-CCC cache; 0 when disabled."""
+        return self._ccc_cache_size
+
+    @property
+    def ccc_threads(self) -> int:
+        """Worker threads of the ccc engine; 1 when it runs single-threaded."""
+        return self._ccc_threads
+
+    @property
+    def max_iterations(self) -> int | None:
+        """Fixed-point iteration cap of one tick; None when uncapped."""
+        return self._detector.max_iterations
+
+    @property
+    def on_oscillation(self) -> str:
+        """What a tick that does not settle does: "raise" or "x"."""
+        return self._on_oscillation
+
+    @property
+    def stats(self) -> TickStats:
+        """Snapshot of the tick counters recorded since the last reset."""
+        return self._stats.copy()
+
+    @property
+    def last_oscillation(self) -> Oscillation | None:
+        """Result of the latest tick that did not settle, if any."""
+        return self._last_oscillation
+
+    @property
+    def timings(self) -> TickTimings | None:
+        """Snapshot of the phase latency histograms; None unless enabled."""
+        return None if self._timings is None else self._timings.copy()
+
+    def enable_timing(self, enabled: bool = True) -> None:
+        """
+        Turn per-phase tick timing on or off.
+
+        While on, ticks record their dynamic topology, component build,
+        resolution and total nanoseconds in the histograms of timings.
+        Turning it off drops the histograms and the phase timer.
+        """
+        if not enabled:
+            self._timings = None
+            self._phase_timer = None
+        elif self._timings is None:
+            self._timings = TickTimings()
+            self._phase_timer = PhaseTimer(self._timings.phases)
+
+    def reset_stats(self) -> None:
+        """Zero the tick counters and drop recorded timings."""
+        self._stats.reset()
+
+        if self._timings is not None:
+            self._timings.reset()
+
+    def _ensure_mutable(self) -> None:
+        """Raise RuntimeError if the netlist was loaded from a compiled file."""
+        if self._frozen:
+            raise RuntimeError("Netlist loaded by load_compiled() is frozen")
 
     # --------------------------------------------------------------------------
-    # Device Creation and Registration
+    # Device Creation
     # --------------------------------------------------------------------------
 
-    def _register_device(self, device: LogicDevice) -> None:
-        """
-        Register a LogicDevice and its terminal Node. Must be called exactly
-        once per created device; registration order must match allocated IDs.
-        """
-        state = self._state
-        state.devices.append(device)
-        state.nodes.append(device.node)
-
     def create_vdd(self) -> VDD:
         """Create and register a new VDD device."""
-        vdd_device = self._device_f.create_vdd()
-        self._register_device(vdd_device)
-        return vdd_device
+        self._ensure_mutable()
+        return self._device_f.create_vdd()
 
     def create_gnd(self) -> GND:
         """Create and register a new GND device."""
-        gnd_device = self._device_f.create_gnd()
-        self._register_device(gnd_device)
-        return gnd_device
+        self._ensure_mutable()
+        return self._device_f.create_gnd()
 
     def create_input(self) -> Input:
         """Create and register a new Input device."""
-        input_device = self._device_f.create_input()
-        self._register_device(input_device)
-        return input_device
+        self._ensure_mutable()
+        return self._device_f.create_input()
 
     def create_probe(self) -> Probe:
         """Create and register a new Probe device."""
-        probe_device = self._device_f.create_probe()
-        self._register_device(probe_device)
-        return probe_device
+        self._ensure_mutable()
+        return self._device_f.create_probe()
 
     def create_port(self) -> Port:
         """Create and register a new Port device."""
-        port_device = self._device_f.create_port()
-        self._register_device(port_device)
-        return port_device
+        self._ensure_mutable()
+        return self._device_f.create_port()
+
+    def create_ports(self, n: int) -> DeviceRange[Port]:
+        """Create n Port devices; return their ids and terminal Node ids."""
+        self._ensure_mutable()
+        return self._device_f.create_ports(n)
 
     # --------------------------------------------------------------------------
-    # Transistor Creation and Registration
+    # Transistor Creation
     # --------------------------------------------------------------------------
 
-    def _register_transistor(self, transistor: Transistor) -> None:
-        """
-        Register a Transistor and its terminal Nodes. Must be called exactly
-        once per created transistor; registration order must match allocated IDs.
-        """
-        state = self._state
-        nodes = state.nodes
-        state.transistors.append(transistor)
-        nodes.append(transistor.gate)
-        nodes.append(transistor.source)
-        nodes.append(transistor.drain)
-
     def create_nmos(self) -> NMOS:
         """Create and register a new NMOS transistor."""
-        nmos = self._transistor_f.create_nmos()
-        self._register_transistor(nmos)
-        return nmos
+        self._ensure_mutable()
+        return self._transistor_f.create_nmos()
 
     def create_pmos(self) -> PMOS:
         """Create and register a new PMOS transistor."""
-        pmos = self._transistor_f.create_pmos()
-        self._register_transistor(pmos)
-        return pmos
+        self._ensure_mutable()
+        return self._transistor_f.create_pmos()
+
+    def create_nmos_batch(self, n: int) -> TransistorRange[NMOS]:
+        """Create n NMOS transistors; return their ids and terminal Node ids."""
+        self._ensure_mutable()
+        return self._transistor_f.create_nmos_batch(n)
+
+    def create_pmos_batch(self, n: int) -> TransistorRange[PMOS]:
+        """Create n PMOS transistors; return their ids and terminal Node ids."""
+        self._ensure_mutable()
+        return self._transistor_f.create_pmos_batch(n)
 
     # --------------------------------------------------------------------------
     # Logical Connection
@@ -162,9 +429,11 @@ class DeviceSimulator:
         """Remove a canonical undirected wire edge from the AoS edge list."""
         edge = self._canonical_edge(node_a, node_b)
 
-        if edge is None:
-            return
+        if edge is not None:
+            self._remove_edge_aos(edge)
 
+    def _remove_edge_aos(self, edge: tuple[int, int]) -> None:
+        """Swap-remove a canonical edge tuple from the AoS edge list."""
         state = self._state
         wire_edge_index = state.wire_edge_index
         index = wire_edge_index.pop(edge, None)
@@ -199,9 +468,11 @@ class DeviceSimulator:
         """Remove a canonical undirected wire edge from the SoA edge lists."""
         edge = self._canonical_edge(node_a, node_b)
 
-        if edge is None:
-            return
+        if edge is not None:
+            self._remove_edge_soa(edge)
 
+    def _remove_edge_soa(self, edge: tuple[int, int]) -> None:
+        """Swap-remove a canonical edge tuple from the SoA edge lists."""
         state = self._state
         wire_edge_index = state.wire_edge_index
         index = wire_edge_index.pop(edge, None)
@@ -236,9 +507,11 @@ class DeviceSimulator:
         """Remove a canonical undirected wire edge from the Packed SoA edge list."""
         key = self._canonical_key(node_a, node_b)
 
-        if key is None:
-            return
+        if key is not None:
+            self._remove_key_psoa(key)
 
+    def _remove_key_psoa(self, key: int) -> None:
+        """Swap-remove a packed canonical key from the Packed SoA edge list."""
         state = self._state
         wire_edge_key_index = state.wire_edge_key_index
         index = wire_edge_key_index.pop(key, None)
@@ -252,98 +525,442 @@ class DeviceSimulator:
 
     def connect(self, node_a: Node, node_b: Node) -> None:
         """Record an undirected wire connection between two Nodes."""
-        self._connect_aos(node_a, node_b)
+        self._ensure_mutable()
+        edge_storage = self._edge_storage
+
+        if edge_storage == "aos":
+            self._connect_aos(node_a, node_b)
+        elif edge_storage == "soa":
+            self._connect_soa(node_a, node_b)
+        else:
+            self._connect_psoa(node_a, node_b)
 
     def disconnect(self, node_a: Node, node_b: Node) -> None:
         """Remove an undirected wire connection between two Nodes."""
-        self._disconnect_aos(node_a, node_b)
+        self._ensure_mutable()
+        edge_storage = self._edge_storage
+
+        if edge_storage == "aos":
+            self._disconnect_aos(node_a, node_b)
+        elif edge_storage == "soa":
+            self._disconnect_soa(node_a, node_b)
+        else:
+            self._disconnect_psoa(node_a, node_b)
+
+    def _canonical_keys(
+        self, a_ids: Iterable[int] | memoryview, b_ids: Iterable[int] | memoryview
+    ) -> list[int]:
+        """
+        Canonicalize raw node-id columns into packed (a << 32) | b keys.
+
+        Self-loops are dropped and duplicates collapse to their first
+        occurrence, so the result matches repeated connect() calls.
+        """
+        a_list = _id_list(a_ids)
+        b_list = _id_list(b_ids)
+
+        if len(a_list) != len(b_list):
+            raise ValueError(
+                f"Node id columns differ in length: {len(a_list)} != {len(b_list)}"
+            )
+
+        if a_list:
+            node_count = len(self._state.node_kinds)
+            low = min(chain(a_list, b_list))
+            high = max(chain(a_list, b_list))
+
+            if low < 0 or high >= node_count:
+                raise ValueError(f"Node ids must lie in [0, {node_count})")
+
+        return list(
+            dict.fromkeys(
+                (a << 32) | b if a < b else (b << 32) | a
+                for a, b in zip(a_list, b_list)
+                if a != b
+            )
+        )
+
+    def connect_many(
+        self, a_ids: Iterable[int] | memoryview, b_ids: Iterable[int] | memoryview
+    ) -> None:
+        """
+        Record wire connections between raw Node id columns in one pass.
+
+        a_ids and b_ids may be any integer buffer (array, memoryview,
+        NumPy array) or iterable of equal length. Edges are canonicalized
+        and deduplicated in bulk, then appended to the selected edge storage.
+        """
+        self._ensure_mutable()
+        keys = self._canonical_keys(a_ids, b_ids)
+        state = self._state
+        edge_storage = self._edge_storage
+
+        if edge_storage == "psoa":
+            key_index = state.wire_edge_key_index
+            new_keys = [key for key in keys if key not in key_index]
+            start = len(state.wire_edge_keys)
+            state.wire_edge_keys.extend(new_keys)
+            key_index.update(zip(new_keys, range(start, start + len(new_keys))))
+            return
+
+        edge_index = state.wire_edge_index
+        edges = [(key >> 32, key & 0xFFFFFFFF) for key in keys]
+        new_edges = [edge for edge in edges if edge not in edge_index]
+
+        if edge_storage == "aos":
+            start = len(state.wire_edges)
+            state.wire_edges.extend(new_edges)
+        else:
+            start = len(state.wire_edge_a)
+            state.wire_edge_a.extend([a for a, _ in new_edges])
+            state.wire_edge_b.extend([b for _, b in new_edges])
+
+        edge_index.update(zip(new_edges, range(start, start + len(new_edges))))
+
+    def disconnect_many(
+        self, a_ids: Iterable[int] | memoryview, b_ids: Iterable[int] | memoryview
+    ) -> None:
+        """Remove wire connections between raw Node id columns in one pass."""
+        self._ensure_mutable()
+        keys = self._canonical_keys(a_ids, b_ids)
+        edge_storage = self._edge_storage
+
+        if edge_storage == "psoa":
+            remove_key = self._remove_key_psoa
+
+            for key in keys:
+                remove_key(key)
+
+            return
+
+        remove_edge = (
+            self._remove_edge_aos if edge_storage == "aos" else self._remove_edge_soa
+        )
+
+        for key in keys:
+            remove_edge((key >> 32, key & 0xFFFFFFFF))
 
     # --------------------------------------------------------------------------
     # Simulation Logic
     # --------------------------------------------------------------------------
 
-    def _build_static_topology_aos(self) -> None:
-        """Build Static Topology using AoS edge list."""
+    def _build_static_csr(self, edges: Callable[[], Iterable[tuple[int, int]]]) -> None:
+        """
+        Build the CSR static adjacency from an edge storage.
+
+        edges is called twice (degree count, then fill). Neighbors of node n
+        are static_indices[static_offsets[n]:static_offsets[n + 1]].
+        """
         state = self._state
-        node_count = len(state.nodes)
+        node_count = len(state.node_kinds)
+        offsets = array("Q", [0]) * (node_count + 1)
+
+        for a, b in edges():
+            offsets[a + 1] += 1
+            offsets[b + 1] += 1
+
+        for node_id in range(node_count):
+            offsets[node_id + 1] += offsets[node_id]
 
-        static_neighbors: list[list[int]] = [[] for _ in range(node_count)]
-        dynamic_neighbors: list[list[int]] = [[] for _ in range(node_count)]
+        cursor = offsets[:-1]
+        indices = array("I", [0]) * offsets[node_count]
 
-        for a, b in state.wire_edges:
-            static_neighbors[a].append(b)
-            static_neighbors[b].append(a)
+        for a, b in edges():
+            indices[cursor[a]] = b
+            cursor[a] += 1
+            indices[cursor[b]] = a
+            cursor[b] += 1
 
-        state.static_neighbors = static_neighbors
-        state.dynamic_neighbors = dynamic_neighbors
-        state.transistor_conducting = [False] * len(state.transistors)
+        state.static_offsets = offsets
+        state.static_indices = indices
+        state.transistor_conducting = bytearray(len(state.transistor_kinds))
+
+    def _build_static_topology_aos(self) -> None:
+        """Build Static Topology using AoS edge list."""
+        state = self._state
+        self._build_static_csr(lambda: state.wire_edges)
 
     def _build_static_topology_soa(self) -> None:
         """Build Static Topology using SoA edge lists."""
         state = self._state
-        node_count = len(state.nodes)
+        self._build_static_csr(lambda: zip(state.wire_edge_a, state.wire_edge_b))
 
-        static_neighbors: list[list[int]] = [[] for _ in range(node_count)]
-        dynamic_neighbors: list[list[int]] = [[] for _ in range(node_count)]
-
-        for a, b in zip(state.wire_edge_a, state.wire_edge_b):
-            static_neighbors[a].append(b)
-            static_neighbors[b].append(a)
-
-        state.static_neighbors = static_neighbors
-        state.dynamic_neighbors = dynamic_neighbors
-        state.transistor_conducting = [False] * len(state.transistors)
+    def _build_static_topology_psoa(self) -> None:
+        """Build Static Topology using Packed SoA edge list."""
+        state = self._state
+        self._build_static_csr(
+            lambda: ((key >> 32, key & 0xFFFFFFFF) for key in state.wire_edge_keys)
+        )
 
     def _build_static_topology(self) -> None:
         """Build Static Topology"""
-        self._build_static_topology_aos()
+        edge_storage = self._edge_storage
+
+        if edge_storage == "aos":
+            self._build_static_topology_aos()
+        elif edge_storage == "soa":
+            self._build_static_topology_soa()
+        else:
+            self._build_static_topology_psoa()
+
+    def _build_nets(self) -> None:
+        """
+        Collapse statically wired Nodes into nets.
 
-    def _build_dynamic_topology(self) -> bool:
-        """Build Dynamic Topology"""
+        Wire edges never change during a tick, so a union-find over them runs
+        once and every wired group (ports, device terminals, gates) becomes a
+        single dense net id with a precomputed OR of its driver defaults.
+        Dynamic connectivity and resolution then run over the net graph,
+        whose only edges are transistor channels.
+        """
         state = self._state
-        transistors = state.transistors
-        dynamic_neighbors = state.dynamic_neighbors
-        conducting = state.transistor_conducting
+        node_count = len(state.node_kinds)
+        parent = list(range(node_count))
+        size = [1] * node_count
+
+        static_offsets = state.static_offsets
+        static_indices = state.static_indices
+
+        for node_id in range(node_count):
+            neighbors = static_indices[
+                static_offsets[node_id] : static_offsets[node_id + 1]
+            ]
+
+            for b in neighbors:
+                a = node_id
+
+                if b < a:
+                    continue
+
+                while parent[a] != a:
+                    parent[a] = parent[parent[a]]
+                    a = parent[a]
+
+                while parent[b] != b:
+                    parent[b] = parent[parent[b]]
+                    b = parent[b]
+
+                if a == b:
+                    continue
+
+                if size[a] < size[b]:
+                    a, b = b, a
+
+                parent[b] = a
+                size[a] += size[b]
+
+        default_values = state.node_default_values
+        root_nets = [-1] * node_count
+        node_nets = array("I", [0]) * node_count
+        net_nodes: list[list[int]] = []
+        net_default_values = array("B")
+
+        for node_id in range(node_count):
+            root = node_id
+
+            while parent[root] != root:
+                root = parent[root]
+
+            net = root_nets[root]
+
+            if net < 0:
+                net = len(net_nodes)
+                root_nets[root] = net
+                net_nodes.append([])
+                net_default_values.append(0b000)
+
+            node_nets[node_id] = net
+            net_nodes[net].append(node_id)
+            net_default_values[net] |= default_values[node_id]
+
+        state.node_nets = node_nets
+        state.net_nodes = net_nodes
+        state.net_default_values = net_default_values
+        # Not a LogicValue: forces the first resolution to write every net.
+        state.net_resolved_values = array("b", [-1]) * len(net_nodes)
+        state.transistor_gate_nets = array(
+            "I", [node_nets[n] for n in state.transistor_gates]
+        )
+        state.transistor_source_nets = array(
+            "I", [node_nets[n] for n in state.transistor_sources]
+        )
+        state.transistor_drain_nets = array(
+            "I", [node_nets[n] for n in state.transistor_drains]
+        )
+
+    def _build_gate_fanout(self) -> None:
+        """
+        Build the CSR gate-fanout index from nets to the transistors they gate.
 
-        changed = False
+        Transistors gated by net n are
+        net_fanout[net_fanout_offsets[n]:net_fanout_offsets[n + 1]].
+        """
+        state = self._state
+        gate_nets = state.transistor_gate_nets
+        offsets = array("Q", [0]) * (len(state.net_nodes) + 1)
 
-        for neighbors in dynamic_neighbors:
-            neighbors.clear()
+        for net in gate_nets:
+            offsets[net + 1] += 1
 
-        for transistor_id, transistor in enumerate(transistors):
-            status = transistor.is_conducting()
+        for net in range(len(state.net_nodes)):
+            offsets[net + 1] += offsets[net]
 
-            if status != conducting[transistor_id]:
-                conducting[transistor_id] = status
-                changed = True
+        cursor = offsets[:-1]
+        fanout = array("I", [0]) * len(gate_nets)
 
-            if status:
-                source_id = transistor.source.id_
-                drain_id = transistor.drain.id_
-                dynamic_neighbors[source_id].append(drain_id)
-                dynamic_neighbors[drain_id].append(source_id)
+        for transistor_id, net in enumerate(gate_nets):
+            fanout[cursor[net]] = transistor_id
+            cursor[net] += 1
 
-        return changed
+        state.net_fanout_offsets = offsets
+        state.net_fanout = fanout
+
+    def _build_channel_index(self) -> None:
+        """
+        Build the CSR channel index from nets to the transistors whose
+        source-drain channel leaves them.
+
+        Channels of net n are
+        net_channel_transistors[net_channel_offsets[n]:net_channel_offsets[n + 1]],
+        with the net across each channel at the same index of net_channel_peers.
+        Channels with both terminals on one net never join nets and are skipped.
+        """
+        state = self._state
+        source_nets = state.transistor_source_nets
+        drain_nets = state.transistor_drain_nets
+        net_count = len(state.net_nodes)
+        offsets = array("Q", [0]) * (net_count + 1)
+
+        for source_net, drain_net in zip(source_nets, drain_nets):
+            if source_net != drain_net:
+                offsets[source_net + 1] += 1
+                offsets[drain_net + 1] += 1
+
+        for net in range(net_count):
+            offsets[net + 1] += offsets[net]
+
+        cursor = offsets[:-1]
+        channels = array("I", [0]) * offsets[net_count]
+        peers = array("I", [0]) * offsets[net_count]
+
+        for transistor_id, (source_net, drain_net) in enumerate(
+            zip(source_nets, drain_nets)
+        ):
+            if source_net != drain_net:
+                channels[cursor[source_net]] = transistor_id
+                peers[cursor[source_net]] = drain_net
+                cursor[source_net] += 1
+                channels[cursor[drain_net]] = transistor_id
+                peers[cursor[drain_net]] = source_net
+                cursor[drain_net] += 1
+
+        state.net_channel_offsets = offsets
+        state.net_channel_transistors = channels
+        state.net_channel_peers = peers
+
+    def _refresh_net_defaults(self) -> list[tuple[int, int]]:
+        """
+        Recompute the driver OR of nets holding pending Nodes.
+        Return (net, previous_value) for every net whose OR changed.
+        """
+        state = self._state
+        default_values = state.node_default_values
+        node_nets = state.node_nets
+        net_nodes = state.net_nodes
+        net_default_values = state.net_default_values
+
+        refreshed: list[tuple[int, int]] = []
+
+        for node_id in state.pending_nodes:
+            net = node_nets[node_id]
+            values = 0b000
+
+            for member in net_nodes[net]:
+                values |= default_values[member]
+
+            previous = net_default_values[net]
+
+            if values != previous:
+                net_default_values[net] = values
+                refreshed.append((net, previous))
+
+        state.pending_nodes.clear()
+        return refreshed
+
+    def _write_net(self, net: int, resolved_value: int) -> bool:
+        """Write a resolved value to a net and its Nodes; return True if changed."""
+        state = self._state
+        previous = state.net_resolved_values[net]
+
+        if previous == resolved_value:
+            return False
+
+        if self._journal is not None:
+            self._journal.setdefault(net, previous)
+
+        state.net_resolved_values[net] = resolved_value
+        resolved_values = state.node_resolved_values
+        nodes = state.net_nodes[net]
+
+        for node_id in nodes:
+            resolved_values[node_id] = resolved_value
+
+        self._stats.nodes_changed += len(nodes)
+        return True
+
+    def _build_dynamic_topology(self, changed_nets: list[int]) -> int:
+        """
+        Build Dynamic Topology
+
+        Only transistors gated by nets that changed in the last resolution
+        are re-checked. Channel adjacency is static (CSR); components read
+        transistor_conducting to decide which channels are open. Return the
+        number of transistors whose conduction toggled.
+        """
+        state = self._state
+        kinds = state.transistor_kinds
+        net_resolved_values = state.net_resolved_values
+        fanout_offsets = state.net_fanout_offsets
+        fanout = state.net_fanout
+        conducting = state.transistor_conducting
+
+        toggled = 0
+
+        for net in changed_nets:
+            gate_value = net_resolved_values[net]
+
+            for index in range(fanout_offsets[net], fanout_offsets[net + 1]):
+                transistor_id = fanout[index]
+                status = gate_value == CONDUCTING_GATE_VALUES[kinds[transistor_id]]
+
+                if status != conducting[transistor_id]:
+                    conducting[transistor_id] = status
+                    toggled += 1
+
+        self._stats.transistors_toggled += toggled
+        return toggled
 
     def _build_components(self) -> None:
         """Build Components"""
         state = self._state
-        node_count = len(state.nodes)
+        net_count = len(state.net_nodes)
 
-        if not node_count:
+        if not net_count:
             state.components = []
             state.component_id = []
             return
 
-        static_neighbors = state.static_neighbors
-        dynamic_neighbors = state.dynamic_neighbors
-        visited = [False] * node_count
+        channel_offsets = state.net_channel_offsets
+        channel_transistors = state.net_channel_transistors
+        channel_peers = state.net_channel_peers
+        conducting = state.transistor_conducting
+        visited = [False] * net_count
         components: list[list[int]] = []
-        component_id = [-1] * node_count
+        component_id = [-1] * net_count
 
         cid = 0
 
-        for start in range(node_count):
+        for start in range(net_count):
             if visited[start]:
                 continue
 
@@ -352,16 +969,16 @@ class DeviceSimulator:
             component: list[int] = []
 
             while stack:
-                node = stack.pop()
-                component.append(node)
-                component_id[node] = cid
+                net = stack.pop()
+                component.append(net)
+                component_id[net] = cid
 
-                for neighbor in static_neighbors[node]:
-                    if not visited[neighbor]:
-                        visited[neighbor] = True
-                        stack.append(neighbor)
+                for index in range(channel_offsets[net], channel_offsets[net + 1]):
+                    if not conducting[channel_transistors[index]]:
+                        continue
+
+                    neighbor = channel_peers[index]
 
-                for neighbor in dynamic_neighbors[node]:
                     if not visited[neighbor]:
                         visited[neighbor] = True
                         stack.append(neighbor)
@@ -372,52 +989,902 @@ class DeviceSimulator:
 
         state.components = components
         state.component_id = component_id
-
-    def _resolve_components(self) -> bool:
-        """Resolve Components"""
+        stats = self._stats
+        stats.component_builds += 1
+        stats.components_built += len(components)
+        stats.largest_component = max(
+            chain((stats.largest_component,), map(len, components))
+        )
+
+    def _resolve_components(self) -> list[int]:
+        """Resolve Components. Return the nets whose value changed."""
         state = self._state
-        nodes = state.nodes
-        components = state.components
+        net_default_values = state.net_default_values
+        write_net = self._write_net
 
-        changed = False
+        changed: list[int] = []
 
-        for component in components:
+        for component in state.components:
             values: int = 0b000
 
-            for node_id in component:
-                node = nodes[node_id]
-                default_value = node.default_value
+            for net in component:
+                values |= net_default_values[net]
+
+            resolved_value = RESOLVE_TABLE[values]
+
+            for net in component:
+                if write_net(net, resolved_value):
+                    changed.append(net)
+
+        return changed
+
+    # --------------------------------------------------------------------------
+    # Incremental Connectivity
+    # --------------------------------------------------------------------------
+
+    def _build_net_components(self) -> None:
+        """
+        Start incremental connectivity from the all-off conduction state:
+        every net is its own component.
+        """
+        state = self._state
+        net_count = len(state.net_nodes)
+
+        state.net_channels = [[] for _ in range(net_count)]
+        state.channel_slots = [0] * (2 * len(state.transistor_kinds))
+        state.net_component = list(range(net_count))
+        state.net_position = [0] * net_count
+        state.component_nets = [[net] for net in range(net_count)]
+        state.component_drivers = [
+            [values & 0b001, values >> 1 & 0b1, values >> 2]
+            for values in state.net_default_values
+        ]
+        state.component_values = [-1] * net_count
+        state.component_free = []
+        stats = self._stats
+        stats.component_builds += 1
+        stats.components_built += net_count
+
+        # Every net starts as its own one-net component.
+        if net_count:
+            stats.largest_component = max(stats.largest_component, 1)
+
+    def _add_net_drivers(self, cid: int, values: int, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) a net's drivers from a component."""
+        drivers = self._state.component_drivers[cid]
+        drivers[0] += sign * (values & 0b001)
+        drivers[1] += sign * (values >> 1 & 0b1)
+        drivers[2] += sign * (values >> 2)
+
+    def _merge_components(
+        self, ca: int, cb: int, touched: set[int], moved: list[int]
+    ) -> None:
+        """Union two components by moving the smaller into the larger."""
+        state = self._state
+        component_nets = state.component_nets
+        net_component = state.net_component
+        net_position = state.net_position
+        component_drivers = state.component_drivers
+
+        if len(component_nets[ca]) < len(component_nets[cb]):
+            ca, cb = cb, ca
+
+        target = component_nets[ca]
+        source = component_nets[cb]
+
+        for net in source:
+            net_component[net] = ca
+            net_position[net] = len(target)
+            target.append(net)
+
+        moved.extend(source)
+        stats = self._stats
+        stats.largest_component = max(stats.largest_component, len(target))
+        drivers = component_drivers[ca]
+        other = component_drivers[cb]
+        drivers[0] += other[0]
+        drivers[1] += other[1]
+        drivers[2] += other[2]
+
+        component_nets[cb] = []
+        state.component_free.append(cb)
+        touched.discard(cb)
+        touched.add(ca)
+
+    def _channel_peer(self, transistor_id: int, net: int) -> int:
+        """Return the net on the other side of a transistor channel."""
+        state = self._state
+        peer = state.transistor_source_nets[transistor_id]
+
+        if peer == net:
+            peer = state.transistor_drain_nets[transistor_id]
+
+        return peer
+
+    def _remove_channel(self, net: int, transistor_id: int, side: int) -> None:
+        """
+        Swap-remove a transistor channel from a net in O(1).
+        side is 0 for the source terminal and 1 for the drain terminal.
+        """
+        state = self._state
+        channels = state.net_channels[net]
+        channel_slots = state.channel_slots
+        index = channel_slots[2 * transistor_id + side]
+        last = channels.pop()
+
+        if index < len(channels):
+            channels[index] = last
+            last_side = 0 if state.transistor_source_nets[last] == net else 1
+            channel_slots[2 * last + last_side] = index
+
+    def _split_component(
+        self, na: int, nb: int, touched: set[int], moved: list[int]
+    ) -> None:
+        """
+        Re-split a component after the channel between na and nb turned off.
+
+        Two searches over conducting channels run in lockstep from na and nb,
+        one channel per side per step. If they meet, the component is still
+        connected. Otherwise the side that is exhausted first is the smaller
+        part and is moved into a new component, so the cost is bounded by the
+        smaller side even when the other side holds a high-fanout rail.
+        """
+        state = self._state
+        net_channels = state.net_channels
+        channel_peer = self._channel_peer
+
+        queues = ([na], [nb])
+        seen = ({na}, {nb})
+        current = [na, nb]
+        indices = [1, 1]
+        channels = [net_channels[na], net_channels[nb]]
+        positions = [0, 0]
+        side = 0
+
+        while True:
+            position = positions[side]
 
-                if default_value:
-                    values |= default_value
+            while position == len(channels[side]):
+                index = indices[side]
+                queue = queues[side]
 
-            resolved_value = LogicValue.resolve_mask(values)
+                if index == len(queue):
+                    break
 
-            for node_id in component:
-                node = nodes[node_id]
+                current[side] = queue[index]
+                indices[side] = index + 1
+                channels[side] = net_channels[queue[index]]
+                position = 0
+            else:
+                positions[side] = position + 1
+                peer = channel_peer(channels[side][position], current[side])
 
-                if node.resolved_value != resolved_value:
-                    changed = True
+                if peer in seen[side ^ 1]:
+                    return
 
-                node.resolved_value = resolved_value
+                if peer not in seen[side]:
+                    seen[side].add(peer)
+                    queues[side].append(peer)
+
+                side ^= 1
+                continue
+
+            split = queues[side]
+            break
+
+        net_component = state.net_component
+        net_position = state.net_position
+        net_default_values = state.net_default_values
+        component_nets = state.component_nets
+        component_drivers = state.component_drivers
+        component_values = state.component_values
+        component_free = state.component_free
+
+        parent = net_component[na]
+        parent_nets = component_nets[parent]
+
+        if component_free:
+            cid = component_free.pop()
+            component_nets[cid] = split
+            component_drivers[cid] = [0, 0, 0]
+            component_values[cid] = component_values[parent]
+        else:
+            cid = len(component_nets)
+            component_nets.append(split)
+            component_drivers.append([0, 0, 0])
+            component_values.append(component_values[parent])
+
+        for position, net in enumerate(split):
+            # Swap-remove net from the parent component.
+            last = parent_nets.pop()
+
+            if last != net:
+                index = net_position[net]
+                parent_nets[index] = last
+                net_position[last] = index
+
+            net_component[net] = cid
+            net_position[net] = position
+            values = net_default_values[net]
+            self._add_net_drivers(parent, values, -1)
+            self._add_net_drivers(cid, values, 1)
+
+        moved.extend(split)
+        touched.add(parent)
+        touched.add(cid)
+        self._stats.components_built += 1
+
+    def _apply_toggles(
+        self, toggled: list[int], touched: set[int], moved: list[int]
+    ) -> None:
+        """Layer channel unions and re-splits for toggled transistors."""
+        state = self._state
+        source_nets = state.transistor_source_nets
+        drain_nets = state.transistor_drain_nets
+        conducting = state.transistor_conducting
+        net_channels = state.net_channels
+        net_component = state.net_component
+        channel_slots = state.channel_slots
+
+        # Turn-offs first: splitting before merging avoids transient shorts
+        # that would join (and then re-split) large rail components.
+        for transistor_id in toggled:
+            if conducting[transistor_id]:
+                continue
+
+            na = source_nets[transistor_id]
+            nb = drain_nets[transistor_id]
+
+            if na != nb:
+                self._remove_channel(na, transistor_id, 0)
+                self._remove_channel(nb, transistor_id, 1)
+                self._split_component(na, nb, touched, moved)
+
+        for transistor_id in toggled:
+            if not conducting[transistor_id]:
+                continue
+
+            na = source_nets[transistor_id]
+            nb = drain_nets[transistor_id]
+
+            if na != nb:
+                channel_slots[2 * transistor_id] = len(net_channels[na])
+                net_channels[na].append(transistor_id)
+                channel_slots[2 * transistor_id + 1] = len(net_channels[nb])
+                net_channels[nb].append(transistor_id)
+                ca = net_component[na]
+                cb = net_component[nb]
+
+                if ca != cb:
+                    self._merge_components(ca, cb, touched, moved)
+
+    # --------------------------------------------------------------------------
+    # Event-Driven Propagation
+    # --------------------------------------------------------------------------
+
+    def _resolve_touched(self, touched: set[int], moved: list[int]) -> list[int]:
+        """
+        Resolve touched components and return the nets that changed.
+
+        A component whose resolved value changed rewrites all its nets;
+        otherwise only the nets that moved between components do.
+        """
+        state = self._state
+        net_component = state.net_component
+        component_nets = state.component_nets
+        component_drivers = state.component_drivers
+        component_values = state.component_values
+        write_net = self._write_net
+
+        changed: list[int] = []
+
+        for cid in touched:
+            zeros, ones, xs = component_drivers[cid]
+            resolved_value = RESOLVE_TABLE[
+                (zeros > 0) | (ones > 0) << 1 | (xs > 0) << 2
+            ]
+
+            if resolved_value == component_values[cid]:
+                continue
+
+            component_values[cid] = resolved_value
+
+            for net in component_nets[cid]:
+                if write_net(net, resolved_value):
+                    changed.append(net)
+
+        for net in moved:
+            if write_net(net, component_values[net_component[net]]):
+                changed.append(net)
 
         return changed
 
-    def build_topology(self) -> None:
-        """Build Topology"""
-        self._build_static_topology()
+    def _update_conduction(self, changed_nets: list[int]) -> list[int]:
+        """
+        Re-evaluate transistors gated by changed nets.
+        Return the ids of transistors whose conduction toggled.
+        """
+        state = self._state
+        kinds = state.transistor_kinds
+        net_resolved_values = state.net_resolved_values
+        fanout_offsets = state.net_fanout_offsets
+        fanout = state.net_fanout
+        conducting = state.transistor_conducting
+
+        toggled: list[int] = []
+
+        for net in changed_nets:
+            gate_value = net_resolved_values[net]
+
+            for index in range(fanout_offsets[net], fanout_offsets[net + 1]):
+                transistor_id = fanout[index]
+                status = gate_value == CONDUCTING_GATE_VALUES[kinds[transistor_id]]
+
+                if status != conducting[transistor_id]:
+                    conducting[transistor_id] = status
+                    toggled.append(transistor_id)
+
+        return toggled
+
+    def _tick_event(self) -> None:
+        """Event-driven tick: propagate only from nets whose value changed."""
+        state = self._state
+        stats = self._stats
+        timer = self._phase_timer
+        touched: set[int] = set()
+
+        if timer is not None:
+            timer.start()
+
+        if len(state.net_component) != len(state.net_nodes):
+            # First tick after build_topology: every net still holds the
+            # unresolved marker, so every net resolves as changed and every
+            # transistor is re-evaluated once.
+            self._refresh_net_defaults()
+            self._build_net_components()
+
+            if timer is not None:
+                timer.lap("component_build")
+
+            touched.update(range(len(state.component_nets)))
+            changed = self._resolve_touched(touched, [])
+        else:
+            net_component = state.net_component
+            add_net_drivers = self._add_net_drivers
+
+            for net, previous in self._refresh_net_defaults():
+                cid = net_component[net]
+                add_net_drivers(cid, previous, -1)
+                add_net_drivers(cid, state.net_default_values[net], 1)
+                touched.add(cid)
+
+            changed = self._resolve_touched(touched, [])
+
+        if timer is not None:
+            timer.lap("resolution")
+
+        detector = self._detector
+        detector.reset()
+        # XOR of the keys of toggled transistors: a hash of the conduction
+        # vector relative to the start of the tick.
+        state_hash = 0
+
+        while changed:
+            stats.iterations += 1
+            toggled = self._update_conduction(changed)
+            stats.transistors_toggled += len(toggled)
+
+            if timer is not None:
+                timer.lap("dynamic_topology")
+
+            if not toggled:
+                break
+
+            for transistor_id in toggled:
+                state_hash ^= hash((transistor_id,))
+
+            touched = set()
+            moved: list[int] = []
+            self._apply_toggles(toggled, touched, moved)
+
+            if timer is not None:
+                timer.lap("component_build")
+
+            changed = self._resolve_touched(touched, moved)
+
+            if timer is not None:
+                timer.lap("resolution")
+
+            if changed and detector.step(state_hash, changed):
+                self._oscillated()
+                break
+
+        if timer is not None:
+            timer.stop()
+
+    def _tick_sweep(self) -> None:
+        """Full-sweep tick: iterate over every transistor and net until stable."""
+        stats = self._stats
+        timer = self._phase_timer
+        detector = self._detector
+        detector.reset()
+
+        if timer is not None:
+            timer.start()
+
+        # Driver refresh is counted as resolution.
+        self._refresh_net_defaults()
+
+        if timer is not None:
+            timer.lap("resolution")
 
-    def tick(self) -> None:
-        """Tick"""
         self._build_components()
 
+        if timer is not None:
+            timer.lap("component_build")
+
+        value_changed: list[int] = []
+
         while True:
-            dynamic_changed = self._build_dynamic_topology()
+            stats.iterations += 1
+            dynamic_changed = self._build_dynamic_topology(value_changed)
+
+            if timer is not None:
+                timer.lap("dynamic_topology")
 
             if dynamic_changed:
                 self._build_components()
 
+                if timer is not None:
+                    timer.lap("component_build")
+
             value_changed = self._resolve_components()
 
+            if timer is not None:
+                timer.lap("resolution")
+
             if not dynamic_changed and not value_changed:
                 break
+
+            if detector.step(
+                hash(bytes(self._state.transistor_conducting)), value_changed
+            ):
+                self._oscillated()
+                break
+
+        if timer is not None:
+            timer.stop()
+
+    def _tick_sweep_bytes(self) -> None:
+        """Full-sweep tick over whole byte columns (bytes backend)."""
+        detector = self._detector
+        detector.reset()
+        self._refresh_net_defaults()
+        tick_sweep_bytes(
+            self._state, CONDUCTING_GATE_VALUES, detector, self._journal, self._stats
+        )
+
+        if detector.stopped:
+            self._oscillated()
+
+    def _tick_sweep_numpy(self) -> None:
+        """Full-sweep tick over whole arrays (NumPy backend)."""
+        detector = self._detector
+        detector.reset()
+        self._refresh_net_defaults()
+        tick_sweep_numpy(
+            self._state, CONDUCTING_GATE_VALUES, detector, self._journal, self._stats
+        )
+
+        if detector.stopped:
+            self._oscillated()
+
+    def _tick_ccc(self) -> None:
+        """CCC tick: re-evaluate only the CCCs reached by changed nets."""
+        engine = self._ccc_engine
+        stats = self._stats
+
+        if engine is None:
+            engine = self._ccc_engine = CCCEngine(
+                self._state,
+                CONDUCTING_GATE_VALUES,
+                self._ccc_cache_size,
+                self._ccc_threads,
+            )
+            # The CCC partition is this engine's component build.
+            output_offsets = self._state.ccc_output_offsets
+            stats.component_builds += 1
+            stats.components_built += len(output_offsets) - 1
+            stats.largest_component = max(
+                chain(
+                    (stats.largest_component,),
+                    (b - a for a, b in zip(output_offsets, output_offsets[1:])),
+                )
+            )
+
+        detector = self._detector
+        detector.reset()
+        iterations = engine.iterations
+        transistors_toggled = engine.transistors_toggled
+        nodes_changed = engine.nodes_changed
+        engine.tick(
+            [net for net, _ in self._refresh_net_defaults()], detector, self._journal
+        )
+        stats.iterations += engine.iterations - iterations
+        stats.transistors_toggled += engine.transistors_toggled - transistors_toggled
+        stats.nodes_changed += engine.nodes_changed - nodes_changed
+
+        if detector.stopped:
+            self._oscillated()
+
+    def _oscillated(self) -> None:
+        """
+        Report a tick the CycleDetector stopped: record last_oscillation,
+        then raise OscillationError or mark the oscillating nets X.
+        """
+        detector = self._detector
+        state = self._state
+        nets = sorted(detector.nets)
+        net_nodes = state.net_nodes
+        oscillation = Oscillation(
+            detector.iterations,
+            detector.period,
+            nets,
+            sorted(node_id for net in nets for node_id in net_nodes[net]),
+        )
+        self._last_oscillation = oscillation
+
+        if self._on_oscillation == "raise":
+            raise OscillationError(oscillation)
+
+        # The event engine only rewrites a component's nets when its value
+        # changes, so the component must agree with its marked nets.
+        components = self._propagation == "event"
+
+        for net in nets:
+            self._write_net(net, X)
+
+            if components:
+                state.component_values[state.net_component[net]] = X
+
+    @staticmethod
+    def _tick_timed(tick: Callable[[], None], histogram: LatencyHistogram) -> None:
+        """Run an engine without timed phases and record its whole tick."""
+        start = perf_counter_ns()
+        tick()
+        histogram.record(perf_counter_ns() - start)
+
+    def _tick_function(self) -> Callable[[], None]:
+        """
+        Return the tick implementation for this propagation and backend,
+        timed when enable_timing is on.
+        """
+        timings = self._timings
+        tick = self._engine_tick_function()
+
+        # The event and python sweep ticks time their phases through
+        # _phase_timer; the other engines are timed as a whole.
+        if timings is None or tick in (self._tick_event, self._tick_sweep):
+            return tick
+
+        return partial(self._tick_timed, tick, timings.phases["tick"])
+
+    def _engine_tick_function(self) -> Callable[[], None]:
+        """Return the tick implementation of the selected engine."""
+        if self._propagation == "event":
+            return self._tick_event
+
+        if self._propagation == "ccc":
+            return self._tick_ccc
+
+        if self._backend == "bytes":
+            return self._tick_sweep_bytes
+
+        if self._backend == "numpy":
+            return self._tick_sweep_numpy
+
+        return self._tick_sweep
+
+    def build_topology(self) -> None:
+        """Build Topology"""
+        self._ensure_mutable()
+        state = self._state
+        self._build_static_topology()
+        self._build_nets()
+        self._build_gate_fanout()
+        self._build_channel_index()
+
+        if self._propagation == "ccc":
+            build_cccs(state)
+
+        self.close()
+        self._net_probes = None
+        state.components = []
+        state.component_id = []
+        state.net_component = []
+
+    def tick(self, changes: str | None = None) -> array[int] | list[Probe] | None:
+        """
+        Tick
+
+        changes selects what the tick reports: None (the default) returns
+        None; "nodes" returns the ids of the Nodes whose resolved value
+        changed, grouped by net, in an array the next collecting tick
+        overwrites; "probes" returns the Probes on those Nodes in id order.
+        The first tick after build_topology reports every Node.
+        """
+        self._stats.ticks += 1
+
+        if changes is None:
+            self._tick_function()()
+            return None
+
+        if changes not in CHANGE_KINDS:
+            raise ValueError(f"Unknown change kind: {changes!r}")
+
+        journal: dict[int, int] = {}
+        self._journal = journal
+
+        try:
+            self._tick_function()()
+        finally:
+            self._journal = None
+
+        net_resolved_values = self._state.net_resolved_values
+        nets = [
+            net
+            for net, previous in journal.items()
+            if net_resolved_values[net] != previous
+        ]
+
+        if changes == "probes":
+            net_probes = self._probes_by_net()
+            probes = [probe for net in nets for probe in net_probes.get(net, ())]
+            probes.sort(key=lambda probe: probe.id_)
+            return probes
+
+        net_nodes = self._state.net_nodes
+        changed_nodes = self._changed_nodes
+        del changed_nodes[:]
+
+        for net in nets:
+            changed_nodes.extend(net_nodes[net])
+
+        return changed_nodes
+
+    def _probes_by_net(self) -> dict[int, list[Probe]]:
+        """Return the Probes grouped by the net of their Node, built once."""
+        net_probes = self._net_probes
+
+        if net_probes is None:
+            state = self._state
+            node_nets = state.node_nets
+            device_nodes = state.device_nodes
+            devices = state.devices
+            net_probes = self._net_probes = {}
+
+            for device_id, kind in enumerate(state.device_kinds):
+                if kind == PROBE_DEVICE_KIND:
+                    net = node_nets[device_nodes[device_id]]
+                    probe = cast(Probe, devices[device_id])
+                    net_probes.setdefault(net, []).append(probe)
+
+        return net_probes
+
+    def close(self) -> None:
+        """
+        Stop the ccc engine's worker threads and drop the engine. The
+        simulator stays usable: the next ccc tick builds a new engine.
+        """
+        if self._ccc_engine is not None:
+            self._ccc_engine.close()
+            self._ccc_engine = None
+
+    def __enter__(self) -> DeviceSimulator:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # --------------------------------------------------------------------------
+    # Batch Stimulus
+    # --------------------------------------------------------------------------
+
+    def run_vectors(
+        self,
+        inputs: Sequence[Input],
+        probes: Sequence[Probe],
+        vectors: bytes | bytearray | memoryview | array[int],
+    ) -> bytearray:
+        """
+        Apply a matrix of raw input values and collect raw probe samples.
+
+        vectors is row-major with one row of len(inputs) raw LogicValues per
+        vector. Each row is applied, the circuit ticks, and one row of
+        len(probes) raw resolved values is appended to the result. Handles
+        are resolved to Node ids once; see run_node_vectors.
+        """
+        device_nodes = self._state.device_nodes
+        return self.run_node_vectors(
+            [device_nodes[device.id_] for device in inputs],
+            [device_nodes[device.id_] for device in probes],
+            vectors,
+        )
+
+    def run_node_vectors(
+        self,
+        input_nodes: Sequence[int],
+        probe_nodes: Sequence[int],
+        vectors: bytes | bytearray | memoryview | array[int],
+    ) -> bytearray:
+        """
+        Raw-id form of run_vectors over Input and Probe terminal Node ids.
+
+        The per-vector loop only touches raw state arrays, and only Inputs
+        whose value changed are queued.
+        """
+        width = len(input_nodes)
+
+        if not width or len(vectors) % width:
+            raise ValueError(
+                f"vectors length {len(vectors)} is not a multiple of {width} inputs"
+            )
+
+        state = self._state
+        default_values = state.node_default_values
+        resolved_values = state.node_resolved_values
+        pending_nodes = state.pending_nodes
+        tick = self._tick_function()
+
+        results = bytearray(len(vectors) // width * len(probe_nodes))
+        cursor = 0
+        self._stats.ticks += len(vectors) // width
+
+        for row in range(0, len(vectors), width):
+            for node_id, value in zip(input_nodes, vectors[row : row + width]):
+                if default_values[node_id] != value:
+                    default_values[node_id] = value
+                    pending_nodes.append(node_id)
+
+            tick()
+
+            for node_id in probe_nodes:
+                results[cursor] = resolved_values[node_id]
+                cursor += 1
+
+        return results
+
+    # --------------------------------------------------------------------------
+    # Observation
+    # --------------------------------------------------------------------------
+
+    def resolved_view(self) -> memoryview:
+        """
+        Return a read-only, zero-copy view of every Node's raw resolved value.
+
+        Item i is node_resolved_values[i] (format "B"), so np.frombuffer
+        reads it directly. The view tracks later ticks without copying.
+        While it is held the column cannot grow: creating a Node raises
+        BufferError, before any record is added, until the view is released.
+        """
+        return memoryview(self._state.node_resolved_values).toreadonly()
+
+    def conducting_view(self) -> memoryview:
+        """
+        Return a read-only, zero-copy view of every Transistor's conduction
+        flag (format "B", 1 when conducting).
+
+        build_topology replaces the column, so take the view after it; the
+        growth restriction of resolved_view applies here too.
+        """
+        return memoryview(self._state.transistor_conducting).toreadonly()
+
+    # --------------------------------------------------------------------------
+    # Compiled Netlist Files
+    # --------------------------------------------------------------------------
+
+    def _edge_columns(self) -> tuple[list[int], list[int]]:
+        """Return the canonical wire edges as (a, b) columns."""
+        state = self._state
+        edge_storage = self._edge_storage
+
+        if edge_storage == "aos":
+            return [a for a, _ in state.wire_edges], [b for _, b in state.wire_edges]
+
+        if edge_storage == "soa":
+            return list(state.wire_edge_a), list(state.wire_edge_b)
+
+        keys = state.wire_edge_keys
+        return [key >> 32 for key in keys], [key & 0xFFFFFFFF for key in keys]
+
+    def save_compiled(self, path: str | PathLike[str]) -> None:
+        """
+        Write the compiled netlist to a versioned binary file.
+
+        build_topology must have run. The file holds the node, device and
+        transistor columns, the wire edges, and every array build_topology
+        derives from them; see sirc.simulator.compiled.
+        """
+        state = self._state
+
+        if len(state.node_nets) != len(state.node_kinds):
+            raise ValueError("build_topology() must run before save_compiled()")
+
+        default_values = state.node_default_values
+        net_default_values: list[int] = []
+        net_node_offsets = [0]
+        net_node_ids: list[int] = []
+
+        # Net defaults are rebuilt so Nodes still pending a tick are saved.
+        for nodes in state.net_nodes:
+            values = 0b000
+
+            for node_id in nodes:
+                values |= default_values[node_id]
+
+            net_default_values.append(values)
+            net_node_ids.extend(nodes)
+            net_node_offsets.append(len(net_node_ids))
+
+        wire_edge_a, wire_edge_b = self._edge_columns()
+        columns: dict[str, Sequence[int]] = {
+            name: getattr(state, name)
+            for name, _ in COMPILED_FIELDS
+            if hasattr(state, name)
+        }
+        columns.update(
+            wire_edge_a=wire_edge_a,
+            wire_edge_b=wire_edge_b,
+            net_default_values=net_default_values,
+            net_node_offsets=net_node_offsets,
+            net_node_ids=net_node_ids,
+        )
+        write_compiled(path, columns)
+
+    @classmethod
+    def load_compiled(
+        cls,
+        path: str | PathLike[str],
+        propagation: str = "event",
+        backend: str = "python",
+        ccc_cache_size: int = DEFAULT_CACHE_SIZE,
+        ccc_threads: int = 1,
+        max_iterations: int | None = None,
+        on_oscillation: str = "raise",
+    ) -> DeviceSimulator:
+        """
+        Map a file written by save_compiled and return a ready simulator.
+
+        Columns are copy-on-write memoryviews of the mapping, so nothing is
+        parsed or copied and processes loading the same file share its
+        pages. The returned simulator is frozen: it ticks, runs vectors and
+        saves, but create_*, connect, disconnect and build_topology raise
+        RuntimeError. The remaining arguments are as for the constructor.
+        """
+        columns = read_compiled(path)
+        sim = cls(
+            propagation=propagation,
+            edge_storage="soa",
+            backend=backend,
+            ccc_cache_size=ccc_cache_size,
+            ccc_threads=ccc_threads,
+            max_iterations=max_iterations,
+            on_oscillation=on_oscillation,
+        )
+        state = sim._state
+
+        for name, _ in COMPILED_FIELDS:
+            if hasattr(state, name):
+                setattr(state, name, columns[name])
+
+        offsets = columns["net_node_offsets"]
+        ids = columns["net_node_ids"]
+        net_count = len(offsets) - 1
+        state.net_nodes = [
+            ids[offsets[net] : offsets[net + 1]].tolist() for net in range(net_count)
+        ]
+        state.node_resolved_values = array("B", [Z]) * len(state.node_kinds)
+        state.net_resolved_values = array("b", [-1]) * net_count
+        state.transistor_conducting = bytearray(len(state.transistor_kinds))
+        sim._frozen = True
+        return sim
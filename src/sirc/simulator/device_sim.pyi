@@ -1,19 +1,137 @@
-from ..core.logic_device import GND as GND, Input as Input, LogicDevice as LogicDevice, Port as Port, Probe as Probe, VDD as VDD
-from ..core.logic_value import LogicValue as LogicValue
+from ..core.logic_device import (
+    GND as GND,
+    Input as Input,
+    Port as Port,
+    Probe as Probe,
+    VDD as VDD,
+)
 from ..core.node import Node as Node
-from ..core.transistor import NMOS as NMOS, PMOS as PMOS, Transistor as Transistor
-from .device_dep import DeviceSimulatorState as DeviceSimulatorState, IdentificationFactory as IdentificationFactory, LogicDeviceFactory as LogicDeviceFactory, NodeFactory as NodeFactory, TransistorFactory as TransistorFactory
+from ..core.transistor import NMOS as NMOS, PMOS as PMOS
+from .convergence import (
+    CycleDetector as CycleDetector,
+    OSCILLATION_ACTIONS as OSCILLATION_ACTIONS,
+    Oscillation as Oscillation,
+    OscillationError as OscillationError,
+)
+from .ccc import (
+    CCCEngine as CCCEngine,
+    DEFAULT_CACHE_SIZE as DEFAULT_CACHE_SIZE,
+    build_cccs as build_cccs,
+)
+from .compiled import (
+    COMPILED_FIELDS as COMPILED_FIELDS,
+    read_compiled as read_compiled,
+    write_compiled as write_compiled,
+)
+from .device_dep import (
+    DeviceRange as DeviceRange,
+    DeviceSimulatorState as DeviceSimulatorState,
+    IdentificationFactory as IdentificationFactory,
+    LogicDeviceFactory as LogicDeviceFactory,
+    NodeFactory as NodeFactory,
+    TransistorFactory as TransistorFactory,
+    TransistorRange as TransistorRange,
+)
+from .tick_stats import (
+    LatencyHistogram as LatencyHistogram,
+    PhaseTimer as PhaseTimer,
+    TickStats as TickStats,
+    TickTimings as TickTimings,
+)
+from .vectorized import (
+    HAS_NUMPY as HAS_NUMPY,
+    tick_sweep_bytes as tick_sweep_bytes,
+    tick_sweep_numpy as tick_sweep_numpy,
+)
+from array import array
+from os import PathLike
+from typing import Final, Iterable, Sequence
+
+CONDUCTING_GATE_VALUES: Final[tuple[int, ...]]
+PROPAGATION_MODES: Final[tuple[str, ...]]
+EDGE_STORAGES: Final[tuple[str, ...]]
+BACKENDS: Final[tuple[str, ...]]
+CHANGE_KINDS: Final[tuple[str, ...]]
 
 class DeviceSimulator:
-    def __init__(self) -> None: ...
+    def __init__(
+        self,
+        propagation: str = "event",
+        edge_storage: str = "aos",
+        backend: str = "python",
+        ccc_cache_size: int = ...,
+        ccc_threads: int = ...,
+        max_iterations: int | None = ...,
+        on_oscillation: str = "raise",
+    ) -> None: ...
+    @property
+    def state(self) -> DeviceSimulatorState: ...
+    @property
+    def propagation(self) -> str: ...
+    @property
+    def backend(self) -> str: ...
+    @property
+    def ccc_cache_size(self) -> int: ...
+    @property
+    def ccc_threads(self) -> int: ...
+    @property
+    def max_iterations(self) -> int | None: ...
+    @property
+    def on_oscillation(self) -> str: ...
+    @property
+    def stats(self) -> TickStats: ...
+    @property
+    def last_oscillation(self) -> Oscillation | None: ...
+    @property
+    def timings(self) -> TickTimings | None: ...
+    def enable_timing(self, enabled: bool = ...) -> None: ...
+    def reset_stats(self) -> None: ...
     def create_vdd(self) -> VDD: ...
     def create_gnd(self) -> GND: ...
     def create_input(self) -> Input: ...
     def create_probe(self) -> Probe: ...
     def create_port(self) -> Port: ...
+    def create_ports(self, n: int) -> DeviceRange[Port]: ...
     def create_nmos(self) -> NMOS: ...
     def create_pmos(self) -> PMOS: ...
+    def create_nmos_batch(self, n: int) -> TransistorRange[NMOS]: ...
+    def create_pmos_batch(self, n: int) -> TransistorRange[PMOS]: ...
     def connect(self, node_a: Node, node_b: Node) -> None: ...
     def disconnect(self, node_a: Node, node_b: Node) -> None: ...
+    def connect_many(
+        self, a_ids: Iterable[int] | memoryview, b_ids: Iterable[int] | memoryview
+    ) -> None: ...
+    def disconnect_many(
+        self, a_ids: Iterable[int] | memoryview, b_ids: Iterable[int] | memoryview
+    ) -> None: ...
     def build_topology(self) -> None: ...
-    def tick(self) -> None: ...
+    def tick(self, changes: str | None = ...) -> array[int] | list[Probe] | None: ...
+    def close(self) -> None: ...
+    def __enter__(self) -> DeviceSimulator: ...
+    def __exit__(self, *exc: object) -> None: ...
+    def run_vectors(
+        self,
+        inputs: Sequence[Input],
+        probes: Sequence[Probe],
+        vectors: bytes | bytearray | memoryview | array[int],
+    ) -> bytearray: ...
+    def run_node_vectors(
+        self,
+        input_nodes: Sequence[int],
+        probe_nodes: Sequence[int],
+        vectors: bytes | bytearray | memoryview | array[int],
+    ) -> bytearray: ...
+    def resolved_view(self) -> memoryview: ...
+    def conducting_view(self) -> memoryview: ...
+    def save_compiled(self, path: str | PathLike[str]) -> None: ...
+    @classmethod
+    def load_compiled(
+        cls,
+        path: str | PathLike[str],
+        propagation: str = "event",
+        backend: str = "python",
+        ccc_cache_size: int = ...,
+        ccc_threads: int = ...,
+        max_iterations: int | None = ...,
+        on_oscillation: str = "raise",
+    ) -> DeviceSimulator: ...
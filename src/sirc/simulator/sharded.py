@@ -0,0 +1,316 @@
+"""
+SIRC Sharded Runner Module.
+
+Provides the ShardedRunner class, which spreads batches of stimulus vectors
+over a process pool that shares one compiled netlist.
+
+Shared layout
+-------------
+
+The read-only topology arrays of a compiled DeviceSimulatorState (node and
+net maps, channel and gate-fanout CSR indexes, transistor nets and kinds,
+device kinds and terminals, and the initial driver defaults) are packed
+once into a single multiprocessing.shared_memory block. Net driver defaults
+are rebuilt from the Node defaults while packing, so Input values set
+without a tick are shared too. Workers receive only the block name and a
+small (field, typecode, offset, length) layout, attach, and index typed
+memoryview casts of the block directly. Nothing of the netlist is pickled.
+
+Batches
+-------
+
+Every batch starts from the compiled initial state, with a fresh CCC
+engine for the ccc propagation mode (the CCC partition itself is built
+once per worker), so results do not
+depend on which worker ran which batch and are merged back in vector order.
+Sequential circuits whose outputs depend on earlier vectors must therefore
+be run with one batch (or through DeviceSimulator.run_vectors directly).
+"""
+
+from __future__ import annotations
+from array import array
+from multiprocessing import get_all_start_methods, get_context
+from multiprocessing.context import BaseContext
+from multiprocessing.pool import Pool
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Final, Literal, Sequence, TypeAlias
+from ..core.logic_device import Input, Probe
+from .device_dep import DeviceSimulatorState
+from .device_sim import DeviceSimulator
+
+# Typecodes of shared columns; each casts to an integer memoryview.
+_ColumnCode: TypeAlias = Literal["B", "I", "Q"]
+
+# (field, typecode, byte offset, byte length) of every shared column.
+_Layout: TypeAlias = list[tuple[str, _ColumnCode, int, int]]
+
+# Read-only state fields placed in shared memory, with their typecodes.
+SHARED_FIELDS: Final[tuple[tuple[str, _ColumnCode], ...]] = (
+    ("node_default_values", "B"),
+    ("node_nets", "I"),
+    ("device_kinds", "B"),
+    ("device_nodes", "I"),
+    ("net_default_values", "B"),
+    ("net_node_offsets", "Q"),
+    ("net_node_ids", "I"),
+    ("transistor_kinds", "B"),
+    ("transistor_gate_nets", "I"),
+    ("transistor_source_nets", "I"),
+    ("transistor_drain_nets", "I"),
+    ("net_fanout_offsets", "Q"),
+    ("net_fanout", "I"),
+    ("net_channel_offsets", "Q"),
+    ("net_channel_transistors", "I"),
+    ("net_channel_peers", "I"),
+)
+
+# Per-process worker context set by _attach_worker.
+_WORKER: dict[str, Any] = {}
+
+
+def _shared_buffer(shm: SharedMemory) -> memoryview:
+    """Return the buffer of an open shared block."""
+    buffer = shm.buf
+
+    if buffer is None:
+        raise RuntimeError(f"Shared block {shm.name} is closed")
+
+    return buffer
+
+
+def _shared_arrays(state: DeviceSimulatorState) -> dict[str, array[int]]:
+    """
+    Return every SHARED_FIELDS column of a compiled state as a typed array.
+    net_default_values is recomputed from node_default_values, since Nodes
+    still pending a tick have not reached the state's net column yet.
+    """
+    default_values = state.node_default_values
+    net_node_offsets = array("Q", [0])
+    net_node_ids = array("I")
+    net_default_values = array("B")
+
+    for nodes in state.net_nodes:
+        values = 0b000
+
+        for node_id in nodes:
+            values |= default_values[node_id]
+
+        net_node_ids.extend(nodes)
+        net_node_offsets.append(len(net_node_ids))
+        net_default_values.append(values)
+
+    columns = {
+        "net_node_offsets": net_node_offsets,
+        "net_node_ids": net_node_ids,
+        "net_default_values": net_default_values,
+    }
+
+    for name, typecode in SHARED_FIELDS:
+        if name not in columns:
+            columns[name] = array(typecode, getattr(state, name))
+
+    return columns
+
+
+def _attach_worker(
+    shm_name: str,
+    layout: _Layout,
+    options: dict[str, Any],
+    input_nodes: list[int],
+    probe_nodes: list[int],
+) -> None:
+    """
+    Pool initializer: attach to the shared block and cast its columns.
+    options are the DeviceSimulator constructor arguments of the original.
+    """
+    shm = SharedMemory(name=shm_name)
+    buffer = _shared_buffer(shm)
+    views = {
+        name: buffer[offset : offset + length].cast(typecode)
+        for name, typecode, offset, length in layout
+    }
+    offsets = views["net_node_offsets"]
+    ids = views["net_node_ids"]
+    sim = DeviceSimulator(**options)
+    state = sim.state
+
+    for name, _ in SHARED_FIELDS:
+        if hasattr(state, name):
+            setattr(state, name, views[name])
+
+    state.net_nodes = [
+        ids[offsets[net] : offsets[net + 1]].tolist() for net in range(len(offsets) - 1)
+    ]
+    _WORKER.update(
+        shm=shm,
+        views=views,
+        sim=sim,
+        input_nodes=input_nodes,
+        probe_nodes=probe_nodes,
+    )
+
+
+def _run_batch(vectors: bytes) -> bytearray:
+    """Pool task: reset to the compiled initial state and run one batch."""
+    views = _WORKER["views"]
+    sim: DeviceSimulator = _WORKER["sim"]
+    state = sim.state
+    net_count = len(views["net_default_values"])
+
+    state.node_default_values = array("B", views["node_default_values"])
+    state.node_resolved_values = array("B", [0]) * len(state.node_default_values)
+    state.net_default_values = array("B", views["net_default_values"])
+    state.net_resolved_values = array("b", [-1]) * net_count
+    state.transistor_conducting = bytearray(len(views["transistor_kinds"]))
+    state.pending_nodes = []
+    state.components = []
+    state.component_id = []
+    state.net_component = []
+    # The ccc engine's worklist and rail terms describe the previous batch;
+    # the next tick builds a new engine over the kept CCC partition.
+    sim.close()
+
+    return sim.run_node_vectors(_WORKER["input_nodes"], _WORKER["probe_nodes"], vectors)
+
+
+def _pool_context() -> BaseContext:
+    """
+    Return the context that starts workers. A parent with live threads,
+    such as a ccc engine's pool, cannot be forked safely, so workers come
+    from a forkserver that has imported this module once (or are spawned
+    where there is no forkserver).
+    """
+    if "forkserver" not in get_all_start_methods():
+        return get_context("spawn")
+
+    context = get_context("forkserver")
+    context.set_forkserver_preload([__name__])
+    return context
+
+
+class ShardedRunner:
+    """
+    Process-pool runner for large stimulus sets over one compiled netlist.
+
+    The DeviceSimulator must have run build_topology. Its read-only arrays
+    are copied once into shared memory; workers attach on start-up and
+    simulate with its propagation, backend, ccc and oscillation settings.
+    Use as a context manager, or call close(), to stop the pool and release
+    the shared block.
+    """
+
+    __slots__ = (
+        "_shm",
+        "_pool",
+        "_workers",
+        "_width",
+    )
+
+    def __init__(
+        self,
+        sim: DeviceSimulator,
+        inputs: Sequence[Input],
+        probes: Sequence[Probe],
+        workers: int = 1,
+    ) -> None:
+        """
+        Share the compiled topology of sim and start the worker processes.
+
+        inputs and probes fix the column order of run's vector and result
+        buffers, as in DeviceSimulator.run_vectors.
+        """
+        state = sim.state
+
+        if workers < 1:
+            raise ValueError(f"workers must be positive: {workers!r}")
+
+        if len(state.node_nets) != len(state.node_kinds):
+            raise ValueError("build_topology() must run before sharding")
+
+        columns = _shared_arrays(state)
+        layout: _Layout = []
+        size = 0
+
+        for name, typecode in SHARED_FIELDS:
+            column = columns[name]
+            # Align each column to its item size for memoryview.cast.
+            size = -(-size // column.itemsize) * column.itemsize
+            length = len(column) * column.itemsize
+            layout.append((name, typecode, size, length))
+            size += length
+
+        self._shm = SharedMemory(create=True, size=max(size, 1))
+        buffer = _shared_buffer(self._shm)
+
+        for name, _, offset, length in layout:
+            buffer[offset : offset + length] = columns[name].tobytes()
+
+        device_nodes = state.device_nodes
+        self._width = len(inputs)
+        self._workers = workers
+        self._pool: Pool = _pool_context().Pool(
+            workers,
+            initializer=_attach_worker,
+            initargs=(
+                self._shm.name,
+                layout,
+                {
+                    "propagation": sim.propagation,
+                    "backend": sim.backend,
+                    "ccc_cache_size": sim.ccc_cache_size,
+                    "ccc_threads": sim.ccc_threads,
+                    "max_iterations": sim.max_iterations,
+                    "on_oscillation": sim.on_oscillation,
+                },
+                [device_nodes[device.id_] for device in inputs],
+                [device_nodes[device.id_] for device in probes],
+            ),
+        )
+
+    def run(
+        self,
+        vectors: bytes | bytearray | memoryview | array[int],
+        batch_size: int | None = None,
+    ) -> bytearray:
+        """
+        Run a row-major vector buffer across the pool and merge in order.
+
+        batch_size is the number of vectors per task; by default each worker
+        receives about four batches.
+        """
+        width = self._width
+
+        if not width or len(vectors) % width:
+            raise ValueError(
+                f"vectors length {len(vectors)} is not a multiple of {width} inputs"
+            )
+
+        rows = len(vectors) // width
+
+        if batch_size is None:
+            batch_size = max(1, -(-rows // (4 * self._workers)))
+        elif batch_size < 1:
+            raise ValueError(f"batch_size must be positive: {batch_size!r}")
+
+        data = array("B", vectors).tobytes()
+        step = batch_size * width
+        batches = [data[start : start + step] for start in range(0, len(data), step)]
+        results = bytearray()
+
+        for batch in self._pool.imap(_run_batch, batches):
+            results += batch
+
+        return results
+
+    def close(self) -> None:
+        """Stop the workers and release the shared block."""
+        self._pool.close()
+        self._pool.join()
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self) -> ShardedRunner:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
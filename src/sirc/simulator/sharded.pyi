@@ -0,0 +1,24 @@
+from ..core.logic_device import Input as Input, Probe as Probe
+from .device_dep import DeviceSimulatorState as DeviceSimulatorState
+from .device_sim import DeviceSimulator as DeviceSimulator
+from array import array
+from typing import Final, Literal, Sequence
+
+SHARED_FIELDS: Final[tuple[tuple[str, Literal["B", "I", "Q"]], ...]]
+
+class ShardedRunner:
+    def __init__(
+        self,
+        sim: DeviceSimulator,
+        inputs: Sequence[Input],
+        probes: Sequence[Probe],
+        workers: int = 1,
+    ) -> None: ...
+    def run(
+        self,
+        vectors: bytes | bytearray | memoryview | array[int],
+        batch_size: int | None = None,
+    ) -> bytearray: ...
+    def close(self) -> None: ...
+    def __enter__(self) -> ShardedRunner: ...
+    def __exit__(self, *exc: object) -> None: ...
@@ -0,0 +1,284 @@
+"""
+SIRC Tick Statistics Module.
+
+Provides the TickStats class: cumulative counters DeviceSimulator.tick
+records while settling, read through DeviceSimulator.stats and zeroed with
+DeviceSimulator.reset_stats; and the TickTimings and LatencyHistogram
+classes behind the optional DeviceSimulator.timings.
+
+Counters are bumped once per fixed-point iteration, component build, merge
+or split, from lengths the tick already has at hand, so recording them
+costs nothing per transistor or per net.
+
+Timings
+-------
+
+The event and python sweep ticks report their phase boundaries to an
+optional PhaseTimer hook. DeviceSimulator.enable_timing installs one,
+which reads time.perf_counter_ns at each boundary and adds one sample per
+tick and phase to a LatencyHistogram, collected in TickTimings; other
+engines are timed as a whole tick. Disabled (the default), the hook is
+None: each boundary costs one local None test, with no call and no clock
+read.
+
+Histograms have fixed log-linear buckets: four per power of two, so a
+bucket spans at most a quarter of its lower bound and percentiles are
+reported as the upper bound of their bucket, capped at the exact maximum.
+"""
+
+from __future__ import annotations
+from array import array
+from time import perf_counter_ns
+from typing import Final
+
+# Counter attributes of TickStats, in report order.
+TICK_STAT_FIELDS: Final[tuple[str, ...]] = (
+    "ticks",
+    "iterations",
+    "component_builds",
+    "components_built",
+    "largest_component",
+    "transistors_toggled",
+    "nodes_changed",
+)
+
+
+# Tick phases timed by TickTimings, in report order. "tick" is the whole
+# tick; engines without the three phases only record it.
+TICK_PHASES: Final[tuple[str, ...]] = (
+    "dynamic_topology",
+    "component_build",
+    "resolution",
+    "tick",
+)
+
+# Number of LatencyHistogram buckets: four per power of two up to 2**64 ns.
+HISTOGRAM_BUCKETS: Final[int] = 256
+
+
+def _bucket(ns: int) -> int:
+    """Return the histogram bucket of a duration in nanoseconds."""
+    if ns < 4:
+        return ns
+
+    shift = ns.bit_length() - 3
+    return (shift + 1) * 4 + (ns >> shift & 0b11)
+
+
+def _bucket_limit(bucket: int) -> int:
+    """Return the largest duration in nanoseconds a bucket holds."""
+    if bucket < 4:
+        return bucket
+
+    shift = bucket // 4 - 1
+    return ((4 + bucket % 4 + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket histogram of durations in nanoseconds.
+
+    count, total and max are exact; percentile is bucket-accurate.
+    """
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        """Start empty."""
+        self.counts = array("Q", [0]) * HISTOGRAM_BUCKETS
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, ns: int) -> None:
+        """Add one sample."""
+        self.counts[_bucket(ns)] += 1
+        self.count += 1
+        self.total += ns
+
+        if ns > self.max:
+            self.max = ns
+
+    def percentile(self, q: float) -> int:
+        """
+        Return the q-th percentile (0 < q <= 100) in nanoseconds, as the
+        upper bound of its bucket; 0 when empty.
+        """
+        if not 0 < q <= 100:
+            raise ValueError(f"percentile must be in (0, 100]: {q!r}")
+
+        rank = -(-self.count * q // 100)
+        seen = 0
+
+        for bucket, count in enumerate(self.counts):
+            seen += count
+
+            if count and seen >= rank:
+                return min(_bucket_limit(bucket), self.max)
+
+        return 0
+
+    def reset(self) -> None:
+        """Drop every sample."""
+        self.counts = array("Q", [0]) * HISTOGRAM_BUCKETS
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def copy(self) -> LatencyHistogram:
+        """Return an independent copy."""
+        histogram = LatencyHistogram.__new__(LatencyHistogram)
+        histogram.counts = array("Q", self.counts)
+        histogram.count = self.count
+        histogram.total = self.total
+        histogram.max = self.max
+        return histogram
+
+
+class TickTimings:
+    """
+    Per-phase latency histograms of one DeviceSimulator.
+
+    phases maps every TICK_PHASES name to its LatencyHistogram; each timed
+    tick adds one sample per phase it ran, holding the nanoseconds the tick
+    spent in that phase.
+    """
+
+    __slots__ = ("phases",)
+
+    def __init__(self) -> None:
+        """Start with empty histograms."""
+        self.phases = {phase: LatencyHistogram() for phase in TICK_PHASES}
+
+    def reset(self) -> None:
+        """Drop every sample."""
+        for histogram in self.phases.values():
+            histogram.reset()
+
+    def copy(self) -> TickTimings:
+        """Return an independent snapshot."""
+        timings = TickTimings.__new__(TickTimings)
+        timings.phases = {
+            phase: histogram.copy() for phase, histogram in self.phases.items()
+        }
+        return timings
+
+    def report(self) -> str:
+        """Return a table of sample count, p50, p99, max and total per phase."""
+        lines = [
+            f"{'phase':<18} {'count':>8} {'p50 us':>10} {'p99 us':>10} "
+            f"{'max us':>10} {'total ms':>10}"
+        ]
+
+        for phase, histogram in self.phases.items():
+            lines.append(
+                f"{phase:<18} {histogram.count:>8} "
+                f"{histogram.percentile(50) / 1e3:>10.1f} "
+                f"{histogram.percentile(99) / 1e3:>10.1f} "
+                f"{histogram.max / 1e3:>10.1f} "
+                f"{histogram.total / 1e6:>10.1f}"
+            )
+
+        return "\n".join(lines)
+
+
+class PhaseTimer:
+    """
+    Phase-timing hook of the event and python sweep ticks.
+
+    A tick calls start, then lap(phase) after each stretch of work, then
+    stop. The timer records, per tick, the nanoseconds charged to every
+    timed phase and the whole tick into the TickTimings.phases histograms.
+    """
+
+    __slots__ = ("_phases", "_totals", "_start", "_mark")
+
+    def __init__(self, phases: dict[str, LatencyHistogram]) -> None:
+        """Record into phases, keyed by TICK_PHASES names."""
+        self._phases = phases
+        self._totals = dict.fromkeys(TICK_PHASES[:-1], 0)
+        self._start = 0
+        self._mark = 0
+
+    def start(self) -> None:
+        """Begin a tick with every phase at 0."""
+        self._totals = dict.fromkeys(TICK_PHASES[:-1], 0)
+        self._start = self._mark = perf_counter_ns()
+
+    def lap(self, phase: str) -> None:
+        """Charge the time since the previous boundary to phase."""
+        now = perf_counter_ns()
+        self._totals[phase] += now - self._mark
+        self._mark = now
+
+    def stop(self) -> None:
+        """Record one sample per phase, and the tick up to the last lap."""
+        phases = self._phases
+
+        for phase, ns in self._totals.items():
+            phases[phase].record(ns)
+
+        phases["tick"].record(self._mark - self._start)
+
+
+class TickStats:
+    """
+    Cumulative tick counters of one DeviceSimulator.
+
+    ticks:                tick calls
+    iterations:           outer fixed-point iterations: sweep passes, event
+                          conduction rounds, or ccc worklist rounds
+    component_builds:     whole-netlist connectivity builds: python and
+                          numpy sweep labellings, one labelling per bytes
+                          sweep tick, the event engine's initial per-net
+                          build, or the ccc engine's CCC partition
+    components_built:     components produced by those builds and by event
+                          and bytes re-splits (CCCs, for ccc)
+    largest_component:    most nets seen in one built or merged component
+    transistors_toggled:  transistor conduction changes
+    nodes_changed:        Node resolved value changes, counted per net
+                          write
+
+    Every engine and backend records every counter. Engines reach the same
+    fixed point by different routes, so iterations and the component
+    counters are comparable within an engine rather than across engines.
+    """
+
+    __slots__ = TICK_STAT_FIELDS
+
+    def __init__(self) -> None:
+        """Start with every counter at 0."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero every counter."""
+        self.ticks = 0
+        self.iterations = 0
+        self.component_builds = 0
+        self.components_built = 0
+        self.largest_component = 0
+        self.transistors_toggled = 0
+        self.nodes_changed = 0
+
+    def copy(self) -> TickStats:
+        """Return an independent snapshot of the counters."""
+        snapshot = TickStats.__new__(TickStats)
+
+        for name in TICK_STAT_FIELDS:
+            setattr(snapshot, name, getattr(self, name))
+
+        return snapshot
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters by name, in TICK_STAT_FIELDS order."""
+        return {name: getattr(self, name) for name in TICK_STAT_FIELDS}
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TickStats):
+            return NotImplemented
+
+        return self.as_dict() == other.as_dict()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value}" for name, value in self.as_dict().items())
+        return f"TickStats({fields})"
@@ -0,0 +1,44 @@
+from array import array
+from typing import Final
+
+TICK_STAT_FIELDS: Final[tuple[str, ...]]
+TICK_PHASES: Final[tuple[str, ...]]
+HISTOGRAM_BUCKETS: Final[int]
+
+class LatencyHistogram:
+    counts: array[int]
+    count: int
+    total: int
+    max: int
+    def __init__(self) -> None: ...
+    def record(self, ns: int) -> None: ...
+    def percentile(self, q: float) -> int: ...
+    def reset(self) -> None: ...
+    def copy(self) -> LatencyHistogram: ...
+
+class TickTimings:
+    phases: dict[str, LatencyHistogram]
+    def __init__(self) -> None: ...
+    def reset(self) -> None: ...
+    def copy(self) -> TickTimings: ...
+    def report(self) -> str: ...
+
+class PhaseTimer:
+    def __init__(self, phases: dict[str, LatencyHistogram]) -> None: ...
+    def start(self) -> None: ...
+    def lap(self, phase: str) -> None: ...
+    def stop(self) -> None: ...
+
+class TickStats:
+    ticks: int
+    iterations: int
+    component_builds: int
+    components_built: int
+    largest_component: int
+    transistors_toggled: int
+    nodes_changed: int
+    def __init__(self) -> None: ...
+    def reset(self) -> None: ...
+    def copy(self) -> TickStats: ...
+    def as_dict(self) -> dict[str, int]: ...
+    def __eq__(self, other: object) -> bool: ...
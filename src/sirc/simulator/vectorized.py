@@ -0,0 +1,545 @@
+"""
+SIRC Vectorized Sweep Module.
+
+Whole-array implementations of the sweep propagation engine, selected with
+DeviceSimulator(propagation="sweep", backend=...). Both iterate to the same
+fixed point as the pure-Python sweep.
+
+bytes backend
+-------------
+
+Dependency-free. Every logic value and mask fits in a byte, so per-net and
+per-transistor columns are handled as bytes objects and the per-element
+work runs in C:
+
+    gathers:     operator.itemgetter over a bytes column
+    conduction:  gate value | kind << 3, built with one big-int OR, mapped
+                 through a 256-byte conduction table with bytes.translate
+    resolution:  component masks through RESOLVE_BYTES with bytes.translate
+    changes:     bytes comparisons
+
+Component tracking over conducting channels stays in Python. Net defaults
+are fixed within a tick, so after one full labelling pass, each transistor
+that flips merges two components (relabelling the smaller) or splits one
+(walking only the side that broke away).
+
+numpy backend
+-------------
+
+Optional; HAS_NUMPY is False when NumPy is not importable, and
+DeviceSimulator then keeps the pure-Python sweep. Each iteration works on
+whole arrays:
+
+    conduction:  gate_table[kinds] == net_resolved[transistor_gate_nets]
+    components:  min-label hooking with pointer jumping over the nets joined
+                 by conducting channels
+    driver mask: np.bitwise_or.reduceat of net defaults in component order
+    resolution:  RESOLVE_TABLE[mask] as a take, scattered back to the nets
+
+State columns are read and written in place through np.frombuffer views,
+so resolved_view and conducting_view see the results without a copy.
+
+Both take an optional CycleDetector, stepped once per pass with a hash of
+the conduction vector, and stop early when it reports a cycle, and an
+optional journal dict that records each net's value before its first
+write of the tick; see DeviceSimulator.tick. Given a TickStats, they add
+the same counters as the pure-Python sweep: one component build per
+labelling (the bytes backend relabels once and then counts split-off
+components), toggles, and Node changes per net write.
+"""
+
+from __future__ import annotations
+from importlib import import_module
+from importlib.util import find_spec
+from operator import itemgetter
+from typing import Any, Callable, Final, Iterator, Sequence
+from ..core.logic_value import RESOLVE_TABLE
+from .convergence import CycleDetector
+from .tick_stats import TickStats
+from .device_dep import DeviceSimulatorState
+
+HAS_NUMPY: Final[bool] = find_spec("numpy") is not None
+
+# The numpy module, or None without NumPy; only the numpy backend uses it.
+np: Any = import_module("numpy") if HAS_NUMPY else None
+
+# RESOLVE_TABLE as a bytes.translate table over driver masks.
+RESOLVE_BYTES: Final[bytes] = bytes(RESOLVE_TABLE[mask & 0b111] for mask in range(256))
+
+# bytes.translate table mapping every nonzero byte to 1.
+_NONZERO: Final[bytes] = bytes([0]) + bytes([1]) * 255
+
+# Raw transistor kind k moved to bits 3..7, to be OR-ed with a gate value.
+_KIND_SHIFT: Final[bytes] = bytes(kind << 3 & 0xFF for kind in range(256))
+
+
+def _gatherer(indices: Sequence[int]) -> Callable[[bytes], bytes]:
+    """Return a C-level gather of a bytes column at fixed indices."""
+    if not indices:
+        return lambda values: b""
+
+    if len(indices) == 1:
+        index = indices[0]
+        return lambda values: values[index : index + 1]
+
+    getter = itemgetter(*indices)
+    return lambda values: bytes(getter(values))
+
+
+def _differing(before: bytes, after: bytes) -> Iterator[int]:
+    """Yield the indices where two equal-length byte strings differ."""
+    diff = int.from_bytes(before, "little") ^ int.from_bytes(after, "little")
+    flags = diff.to_bytes(len(before), "little").translate(_NONZERO)
+    index = flags.find(1)
+
+    while index >= 0:
+        yield index
+        index = flags.find(1, index + 1)
+
+
+def _flipped(status: bytes, conducting: bytearray) -> list[int]:
+    """Return the transistors whose conduction differs between two columns."""
+    count = len(status)
+    diff = int.from_bytes(status, "little") ^ int.from_bytes(conducting, "little")
+    changes = diff.to_bytes(count, "little")
+    flipped: list[int] = []
+    index = changes.find(1)
+
+    while index >= 0:
+        flipped.append(index)
+        index = changes.find(1, index + 1)
+
+    return flipped
+
+
+class _Components:
+    """
+    Conducting components of a compiled state, kept up to date as single
+    transistors turn on or off.
+
+    Each component keeps its set of nets and a count of member nets per
+    driver bit, so a merge relabels the smaller side and a split only walks
+    the side that breaks away. Components whose mask or membership moved
+    are collected in dirty.
+    """
+
+    __slots__ = (
+        "_state",
+        "_conducting",
+        "component_id",
+        "members",
+        "_bit_counts",
+        "dirty",
+        "largest",
+    )
+
+    def __init__(self, state: DeviceSimulatorState, conducting: bytearray) -> None:
+        self._state = state
+        self._conducting = conducting
+        self.component_id = [-1] * len(state.net_nodes)
+        self.members: list[set[int]] = []
+        self._bit_counts: list[int] = []
+        self.dirty: set[int] = set()
+        # Most nets held by one component, as built or merged.
+        self.largest = 0
+
+        for start, visited in enumerate(self.component_id):
+            if visited < 0:
+                self._add(self._reach(start))
+
+    def _neighbors(self, net: int) -> Iterator[int]:
+        """Yield the nets joined to net by a conducting channel."""
+        state = self._state
+        channel_transistors = state.net_channel_transistors
+        channel_peers = state.net_channel_peers
+        conducting = self._conducting
+
+        for index in range(
+            state.net_channel_offsets[net], state.net_channel_offsets[net + 1]
+        ):
+            if conducting[channel_transistors[index]]:
+                yield channel_peers[index]
+
+    def _reach(self, start: int) -> set[int]:
+        """Return the nets conducting to start."""
+        seen = {start}
+        stack = [start]
+
+        while stack:
+            for neighbor in self._neighbors(stack.pop()):
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    stack.append(neighbor)
+
+        return seen
+
+    def _add(self, nets: set[int]) -> int:
+        """Register nets as a new component and return its id."""
+        cid = len(self.members)
+        component_id = self.component_id
+        net_default_values = self._state.net_default_values
+        counts = [0, 0, 0]
+
+        for net in nets:
+            component_id[net] = cid
+            value = net_default_values[net]
+            counts[0] += value & 0b001
+            counts[1] += value >> 1 & 0b001
+            counts[2] += value >> 2 & 0b001
+
+        self.members.append(nets)
+        self._bit_counts.extend(counts)
+        self.largest = max(self.largest, len(nets))
+        return cid
+
+    def mask(self, cid: int) -> int:
+        """Return the OR of net defaults over a component."""
+        counts = self._bit_counts
+        base = 3 * cid
+        return (
+            (counts[base] > 0)
+            | (counts[base + 1] > 0) << 1
+            | (counts[base + 2] > 0) << 2
+        )
+
+    def connect(self, a: int, b: int) -> None:
+        """Merge the components of nets a and b after a channel turned on."""
+        component_id = self.component_id
+        keep, drop = component_id[a], component_id[b]
+
+        if keep == drop:
+            return
+
+        if len(self.members[keep]) < len(self.members[drop]):
+            keep, drop = drop, keep
+
+        moved = self.members[drop]
+        self.members[drop] = set()
+        self.members[keep].update(moved)
+        self.largest = max(self.largest, len(self.members[keep]))
+
+        for net in moved:
+            component_id[net] = keep
+
+        counts = self._bit_counts
+
+        for bit in range(3):
+            counts[3 * keep + bit] += counts[3 * drop + bit]
+            counts[3 * drop + bit] = 0
+
+        self.dirty.discard(drop)
+        self.dirty.add(keep)
+
+    def disconnect(self, a: int, b: int) -> None:
+        """Split the component of nets a and b if a channel turning off broke it."""
+        component_id = self.component_id
+
+        if a == b or component_id[a] != component_id[b]:
+            return
+
+        # Walk out from both ends one channel at a time; the first side to
+        # run out without meeting the other is the piece that broke away, so
+        # the cost follows the smaller side even next to a supply hub.
+        seen = ({a}, {b})
+        stacks = ([self._neighbors(a)], [self._neighbors(b)])
+
+        while True:
+            for side in (0, 1):
+                stack = stacks[side]
+
+                if not stack:
+                    self._split(component_id[a], seen[side])
+                    return
+
+                neighbor = next(stack[-1], None)
+
+                if neighbor is None:
+                    stack.pop()
+                elif neighbor in seen[1 - side]:
+                    return
+                elif neighbor not in seen[side]:
+                    seen[side].add(neighbor)
+                    stack.append(self._neighbors(neighbor))
+
+    def _split(self, old: int, piece: set[int]) -> None:
+        """Move piece out of component old into a new component."""
+        self.members[old] -= piece
+        new = self._add(piece)
+        counts = self._bit_counts
+
+        for bit in range(3):
+            counts[3 * old + bit] -= counts[3 * new + bit]
+
+        self.dirty.add(old)
+        self.dirty.add(new)
+
+
+def tick_sweep_bytes(
+    state: DeviceSimulatorState,
+    conducting_gate_values: Sequence[int],
+    detector: CycleDetector | None = None,
+    journal: dict[int, int] | None = None,
+    stats: TickStats | None = None,
+) -> None:
+    """
+    Settle a compiled state to its sweep fixed point with bytes operations.
+
+    Net defaults must already be refreshed for pending Nodes.
+    conducting_gate_values is the gate value turning each raw transistor
+    kind on. Stops early when detector.step returns True. journal, if
+    given, gains net -> previous value for every net written, and stats
+    the tick's counters.
+    """
+    net_count = len(state.net_nodes)
+
+    if not net_count:
+        return
+
+    conduction_table = bytes(
+        index >> 3 < len(conducting_gate_values)
+        and index & 0b111 == conducting_gate_values[index >> 3]
+        for index in range(256)
+    )
+    transistor_count = len(state.transistor_kinds)
+    kind_bits = int.from_bytes(
+        bytes(state.transistor_kinds).translate(_KIND_SHIFT), "little"
+    )
+    gate_values = _gatherer(state.transistor_gate_nets)
+    source_nets = state.transistor_source_nets
+    drain_nets = state.transistor_drain_nets
+    # The signed column keeps the -1 unresolved marker for the journal.
+    previous = state.net_resolved_values
+    net_resolved = memoryview(previous).cast("B")
+    conducting = state.transistor_conducting
+
+    def conduction() -> bytes:
+        gates = int.from_bytes(gate_values(net_resolved.tobytes()), "little")
+        status = (gates | kind_bits).to_bytes(transistor_count, "little")
+        return status.translate(conduction_table)
+
+    # Net defaults only change between ticks, so the first pass labels and
+    # resolves every net; later passes only revisit the components that
+    # flipped transistors merged or split.
+    status = conduction()
+    toggled = len(_flipped(status, conducting)) if stats is not None else 0
+    conducting[:] = status
+    components = _Components(state, conducting)
+    built = len(components.members)
+    masks = bytes(map(components.mask, range(built)))
+    resolved = _gatherer(components.component_id)(masks.translate(RESOLVE_BYTES))
+    any_value_changed = resolved != net_resolved
+    net_nodes = state.net_nodes
+    nodes_changed = 0
+    iterations = 1
+
+    if any_value_changed:
+        if journal is not None or stats is not None:
+            for net in _differing(net_resolved.tobytes(), resolved):
+                if journal is not None:
+                    journal.setdefault(net, previous[net])
+
+                nodes_changed += len(net_nodes[net])
+
+        net_resolved[:] = resolved
+
+    # Without a value change conduction cannot move, so the tick has settled.
+    while any_value_changed:
+        iterations += 1
+        status = conduction()
+
+        if status == conducting:
+            break
+
+        flipped = _flipped(status, conducting)
+        toggled += len(flipped)
+
+        # Splits go first so a channel turning on next to one turning off
+        # never merges the two sides only to split them again.
+        for index in flipped:
+            if not status[index]:
+                conducting[index] = 0
+                components.disconnect(source_nets[index], drain_nets[index])
+
+        for index in flipped:
+            if status[index]:
+                conducting[index] = 1
+                components.connect(source_nets[index], drain_nets[index])
+
+        changed: list[int] = []
+
+        for cid in components.dirty:
+            value = RESOLVE_BYTES[components.mask(cid)]
+
+            for net in components.members[cid]:
+                if net_resolved[net] != value:
+                    if journal is not None:
+                        journal.setdefault(net, previous[net])
+
+                    net_resolved[net] = value
+                    changed.append(net)
+                    nodes_changed += len(net_nodes[net])
+
+        components.dirty.clear()
+        any_value_changed = any_value_changed or bool(changed)
+
+        if detector is not None and detector.step(hash(status), changed):
+            break
+
+    if stats is not None:
+        stats.iterations += iterations
+        stats.component_builds += 1
+        stats.components_built += len(components.members)
+        stats.largest_component = max(stats.largest_component, components.largest)
+        stats.transistors_toggled += toggled
+        stats.nodes_changed += nodes_changed
+
+    if any_value_changed:
+        node_values = _gatherer(state.node_nets)
+        node_resolved = memoryview(state.node_resolved_values).cast("B")
+        node_resolved[:] = node_values(net_resolved.tobytes())
+
+
+def _net_components(net_count: int, ends_a: Any, ends_b: Any) -> Any:
+    """
+    Label every net with the smallest net id of its conducting component.
+
+    Each round hooks the root of the larger label onto the smaller across
+    every open channel, then pointer-jumps until every label is a root.
+    """
+    labels = np.arange(net_count, dtype=np.intp)
+
+    while True:
+        low = np.minimum(labels[ends_a], labels[ends_b])
+        hooked = labels.copy()
+        np.minimum.at(hooked, labels[ends_a], low)
+        np.minimum.at(hooked, labels[ends_b], low)
+
+        while True:
+            jumped = hooked[hooked]
+
+            if np.array_equal(jumped, hooked):
+                break
+
+            hooked = jumped
+
+        if np.array_equal(hooked, labels):
+            return labels
+
+        labels = hooked
+
+
+def _count_components(stats: TickStats, labels: Any) -> None:
+    """Record one component build over a net labelling in stats."""
+    sizes = np.bincount(labels)
+    stats.component_builds += 1
+    stats.components_built += int(np.count_nonzero(sizes))
+    stats.largest_component = max(stats.largest_component, int(sizes.max()))
+
+
+def _resolve_nets(labels: Any, net_defaults: Any, resolve_table: Any) -> Any:
+    """Resolve each component's OR of net defaults and scatter it to its nets."""
+    order = np.argsort(labels, kind="stable")
+    grouped = labels[order]
+    starts = np.flatnonzero(np.concatenate(([True], grouped[1:] != grouped[:-1])))
+    masks = np.bitwise_or.reduceat(net_defaults[order], starts)
+    resolved = np.empty(len(labels), dtype=np.int8)
+    resolved[order] = np.repeat(
+        resolve_table[masks], np.diff(np.append(starts, len(labels)))
+    )
+    return resolved
+
+
+def tick_sweep_numpy(
+    state: DeviceSimulatorState,
+    conducting_gate_values: Sequence[int],
+    detector: CycleDetector | None = None,
+    journal: dict[int, int] | None = None,
+    stats: TickStats | None = None,
+) -> None:
+    """
+    Settle a compiled state to its sweep fixed point with whole-array steps.
+
+    Net defaults must already be refreshed for pending Nodes.
+    conducting_gate_values is the gate value turning each raw transistor
+    kind on. Stops early when detector.step returns True. journal, if
+    given, gains net -> previous value for every net written, and stats
+    the tick's counters. Raise RuntimeError when NumPy is not installed.
+    """
+    if np is None:
+        raise RuntimeError("The numpy backend requires NumPy")
+
+    net_count = len(state.net_nodes)
+
+    if not net_count:
+        return
+
+    resolve_table = np.array(RESOLVE_TABLE, dtype=np.int8)
+    gate_table = np.array(conducting_gate_values, dtype=np.int8)[
+        np.frombuffer(state.transistor_kinds, dtype=np.uint8)
+    ]
+    gate_nets = np.frombuffer(state.transistor_gate_nets, dtype=np.uint32)
+    source_nets = np.frombuffer(state.transistor_source_nets, dtype=np.uint32)
+    drain_nets = np.frombuffer(state.transistor_drain_nets, dtype=np.uint32)
+    net_defaults = np.frombuffer(state.net_default_values, dtype=np.uint8)
+    net_resolved = np.frombuffer(state.net_resolved_values, dtype=np.int8)
+    conducting = np.frombuffer(state.transistor_conducting, dtype=np.uint8)
+    channels = source_nets != drain_nets
+
+    open_channels = channels & (conducting != 0)
+    labels = _net_components(
+        net_count, source_nets[open_channels], drain_nets[open_channels]
+    )
+    any_value_changed = False
+
+    if stats is not None:
+        node_nets = np.frombuffer(state.node_nets, dtype=np.uint32)
+        net_sizes = np.bincount(node_nets, minlength=net_count)
+        _count_components(stats, labels)
+
+    while True:
+        status = (net_resolved[gate_nets] == gate_table).astype(np.uint8)
+        dynamic_changed = not np.array_equal(status, conducting)
+
+        if stats is not None:
+            stats.iterations += 1
+
+        if dynamic_changed:
+            if stats is not None:
+                stats.transistors_toggled += int(np.count_nonzero(status != conducting))
+
+            conducting[:] = status
+            open_channels = channels & (status != 0)
+            labels = _net_components(
+                net_count, source_nets[open_channels], drain_nets[open_channels]
+            )
+
+            if stats is not None:
+                _count_components(stats, labels)
+
+        resolved = _resolve_nets(labels, net_defaults, resolve_table)
+        changed = np.flatnonzero(resolved != net_resolved)
+        value_changed = len(changed) > 0
+
+        if value_changed:
+            if journal is not None:
+                for net, value in zip(changed.tolist(), net_resolved[changed].tolist()):
+                    journal.setdefault(net, value)
+
+            net_resolved[:] = resolved
+            any_value_changed = True
+
+            if stats is not None:
+                stats.nodes_changed += int(net_sizes[changed].sum())
+
+        if not dynamic_changed and not value_changed:
+            break
+
+        if detector is not None and detector.step(
+            hash(conducting.tobytes()), changed.tolist()
+        ):
+            break
+
+    if any_value_changed:
+        node_nets = np.frombuffer(state.node_nets, dtype=np.uint32)
+        node_resolved = np.frombuffer(state.node_resolved_values, dtype=np.uint8)
+        node_resolved[:] = net_resolved[node_nets]
@@ -0,0 +1,23 @@
+from ..core.logic_value import RESOLVE_TABLE as RESOLVE_TABLE
+from .convergence import CycleDetector as CycleDetector
+from .device_dep import DeviceSimulatorState as DeviceSimulatorState
+from .tick_stats import TickStats as TickStats
+from typing import Final, Sequence
+
+HAS_NUMPY: Final[bool]
+RESOLVE_BYTES: Final[bytes]
+
+def tick_sweep_bytes(
+    state: DeviceSimulatorState,
+    conducting_gate_values: Sequence[int],
+    detector: CycleDetector | None = ...,
+    journal: dict[int, int] | None = ...,
+    stats: TickStats | None = ...,
+) -> None: ...
+def tick_sweep_numpy(
+    state: DeviceSimulatorState,
+    conducting_gate_values: Sequence[int],
+    detector: CycleDetector | None = ...,
+    journal: dict[int, int] | None = ...,
+    stats: TickStats | None = ...,
+) -> None: ...
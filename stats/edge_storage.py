@@ -0,0 +1,141 @@
+"""SIRC Edge Storage Benchmark"""
+
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from sirc.core import Node
+from sirc.simulator import DeviceSimulator
+from sirc.simulator.device_sim import EDGE_STORAGES
+
+SIZES = (10_000, 100_000, 1_000_000, 10_000_000)
+
+
+def build_netlist(
+    sim: DeviceSimulator, edges: int, seed: int = 0
+) -> list[tuple[Node, Node]]:
+    """
+    Create Ports and a reproducible random list of wire pairs between them.
+
+    Args:
+        sim: DeviceSimulator
+        edges: Number of wire pairs to generate
+        seed: Random seed
+
+    Returns:
+        pairs: Node pairs to connect
+    """
+    rng = random.Random(seed)
+    nodes = [sim.create_port().node for _ in range(max(2, edges // 2))]
+    return [(rng.choice(nodes), rng.choice(nodes)) for _ in range(edges)]
+
+
+def edge_storage_bytes(sim: DeviceSimulator) -> int:
+    """
+    Measure the deep size of the wire edge containers.
+
+    Args:
+        sim: DeviceSimulator
+
+    Returns:
+        size: Bytes held by the edge lists, tuples, keys and index dicts
+    """
+    # pylint: disable=protected-access
+    state = sim._state
+    seen: set[int] = set()
+    stack: list[object] = [
+        state.wire_edges,
+        state.wire_edge_index,
+        state.wire_edge_a,
+        state.wire_edge_b,
+        state.wire_edge_keys,
+        state.wire_edge_key_index,
+    ]
+    size = 0
+
+    while stack:
+        obj = stack.pop()
+
+        if id(obj) in seen:
+            continue
+
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+
+    return size
+
+
+def bench(edge_storage: str, edges: int) -> None:
+    """
+    Benchmark one edge storage on one netlist size and print a row.
+
+    Args:
+        edge_storage: Backend name passed to DeviceSimulator
+        edges: Number of wire pairs
+    """
+    sim = DeviceSimulator(edge_storage=edge_storage)
+    pairs = build_netlist(sim, edges)
+    gc.collect()
+
+    t = time.perf_counter()
+    for node_a, node_b in pairs:
+        sim.connect(node_a, node_b)
+    connect_s = time.perf_counter() - t
+
+    storage = edge_storage_bytes(sim)
+
+    # pylint: disable=protected-access
+    gc.collect()
+    t = time.perf_counter()
+    sim._build_static_topology()
+    build_s = time.perf_counter() - t
+
+    # Second build under tracemalloc for the peak only; tracing skews timing.
+    gc.collect()
+    tracemalloc.start()
+    sim._build_static_topology()
+    _, build_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    t = time.perf_counter()
+    for node_a, node_b in pairs[::2]:
+        sim.disconnect(node_a, node_b)
+    disconnect_s = time.perf_counter() - t
+
+    print(
+        f"{edge_storage:>5} {edges:>10} "
+        f"{edges / connect_s / 1e6:>9.2f} "
+        f"{(edges + 1) // 2 / disconnect_s / 1e6:>9.2f} "
+        f"{edges / build_s / 1e6:>9.2f} "
+        f"{storage / edges:>9.1f} "
+        f"{build_peak / 1e6:>10.1f}"
+    )
+
+
+def main(sizes: tuple[int, ...] = SIZES[:3]):
+    """
+    SIRC Edge Storage Benchmark
+
+    Prints connect, disconnect and static-build throughput (Medges/s),
+    edge storage bytes per edge and tracemalloc peak MB of the build.
+    """
+    print(
+        f"{'store':>5} {'edges':>10} {'conn M/s':>9} {'disc M/s':>9} "
+        f"{'build M/s':>9} {'B/edge':>9} {'build MB':>10}"
+    )
+
+    for edges in sizes:
+        for edge_storage in EDGE_STORAGES:
+            bench(edge_storage, edges)
+
+
+if __name__ == "__main__":
+    # python stats/edge_storage.py [edges ...]; 10M edges needs several GB.
+    main(tuple(int(arg) for arg in sys.argv[1:]) or SIZES[:3])
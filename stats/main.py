@@ -2,6 +2,7 @@
 
 import cProfile
 import pstats
+import sys
 from sirc.core import LogicValue, Node, VDD, GND
 from sirc.simulator import DeviceSimulator
 
@@ -44,9 +45,16 @@ def build_inverter(
     return out_port.node
 
 
-def main(n: int = 1000):
-    """SIRC Profiler"""
-    sim = DeviceSimulator()
+def main(n: int = 1000, propagation: str = "event", ticks: int = 2):
+    """
+    SIRC Profiler
+
+    Builds an n-inverter chain, toggles its input for the given number of
+    ticks with phase timing enabled, and prints the per-phase latency
+    breakdown and tick counters.
+    """
+    sim = DeviceSimulator(propagation=propagation)
+    sim.enable_timing()
 
     vdd = sim.create_vdd()
     gnd = sim.create_gnd()
@@ -63,20 +71,31 @@ def main(n: int = 1000):
 
     sim.build_topology()
 
-    inp.set_value(LogicValue.ONE)
-    sim.tick()
-    print("Input = 1 → Output =", probe.sample())
+    for tick in range(ticks):
+        value = LogicValue.ZERO if tick % 2 else LogicValue.ONE
+        inp.set_value(value)
+        sim.tick()
+        print(f"Input = {value.name} → Output =", probe.sample())
 
-    inp.set_value(LogicValue.ZERO)
-    sim.tick()
-    print("Input = 0 → Output =", probe.sample())
+    print(sim.timings.report())
+    print(sim.stats)
 
 
 if __name__ == "__main__":
-    profiler = cProfile.Profile()
-    profiler.enable()
-
-    main()
-
-    profiler.disable()
-    pstats.Stats(profiler).sort_stats("cumtime").print_stats()
+    # python stats/main.py [inverters] [propagation] [ticks] [--profile]
+    # Phase timings are inflated under --profile; compare them without it.
+    args = [arg for arg in sys.argv[1:] if arg != "--profile"]
+    options = (
+        int(args[0]) if args else 1000,
+        args[1] if len(args) > 1 else "event",
+        int(args[2]) if len(args) > 2 else 2,
+    )
+
+    if "--profile" in sys.argv:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        main(*options)
+        profiler.disable()
+        pstats.Stats(profiler).sort_stats("cumtime").print_stats()
+    else:
+        main(*options)
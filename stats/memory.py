@@ -0,0 +1,135 @@
+"""SIRC State Memory Benchmark"""
+
+import gc
+import sys
+import tracemalloc
+from sirc.simulator import DeviceSimulator, DeviceSimulatorState
+
+SIZES = (10_000, 100_000, 1_000_000)
+
+NODE_COLUMNS = (
+    "node_kinds",
+    "node_default_values",
+    "node_resolved_values",
+    "node_nets",
+)
+
+TRANSISTOR_COLUMNS = (
+    "transistor_kinds",
+    "transistor_gates",
+    "transistor_sources",
+    "transistor_drains",
+    "transistor_conducting",
+    "transistor_gate_nets",
+    "transistor_source_nets",
+    "transistor_drain_nets",
+)
+
+
+def build_inverters(sim: DeviceSimulator, n: int) -> None:
+    """
+    Build a chain of n CMOS inverters with the batch creation APIs.
+
+    Args:
+        sim: DeviceSimulator
+        n: Number of inverters
+    """
+    vdd = sim.create_vdd().node.id_
+    gnd = sim.create_gnd().node.id_
+    inp = sim.create_input().node.id_
+    ports = sim.create_ports(n)
+    pmos = sim.create_pmos_batch(n)
+    nmos = sim.create_nmos_batch(n)
+    drivers = [inp, *ports.nodes[:-1]]
+    a_ids: list[int] = []
+    b_ids: list[int] = []
+
+    for pairs in (
+        zip(pmos.sources, [vdd] * n),
+        zip(nmos.sources, [gnd] * n),
+        zip(pmos.gates, drivers),
+        zip(nmos.gates, drivers),
+        zip(pmos.drains, ports.nodes),
+        zip(nmos.drains, ports.nodes),
+    ):
+        for a, b in pairs:
+            a_ids.append(a)
+            b_ids.append(b)
+
+    sim.connect_many(a_ids, b_ids)
+
+
+def columns_bytes(state: DeviceSimulatorState, names: tuple[str, ...]) -> int:
+    """
+    Measure the deep size of dense state columns.
+
+    Args:
+        state: DeviceSimulatorState
+        names: Column attribute names
+
+    Returns:
+        size: Bytes held by the columns and any boxed elements they reference
+    """
+    seen: set[int] = set()
+    size = 0
+
+    for name in names:
+        column = getattr(state, name)
+        size += sys.getsizeof(column)
+
+        if isinstance(column, list):
+            for item in column:
+                if id(item) not in seen:
+                    seen.add(id(item))
+                    size += sys.getsizeof(item)
+
+    return size
+
+
+def bench(n: int) -> None:
+    """
+    Build and compile one n-inverter chain and print a row.
+
+    Args:
+        n: Number of inverters
+    """
+    gc.collect()
+    tracemalloc.start()
+    sim = DeviceSimulator()
+    build_inverters(sim, n)
+    sim.build_topology()
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    state = sim.state
+    nodes = len(state.node_kinds)
+    transistors = len(state.transistor_kinds)
+
+    print(
+        f"{n:>10} {nodes:>10} {transistors:>10} "
+        f"{columns_bytes(state, NODE_COLUMNS) / nodes:>8.1f} "
+        f"{columns_bytes(state, TRANSISTOR_COLUMNS) / transistors:>8.1f} "
+        f"{retained / 1e6:>10.1f}"
+    )
+
+
+def main(sizes: tuple[int, ...] = SIZES[:2]):
+    """
+    SIRC State Memory Benchmark
+
+    Prints bytes per node and per transistor held by the dense state
+    columns, and the tracemalloc MB retained by the whole compiled state.
+    """
+    print(
+        f"{'inverters':>10} {'nodes':>10} {'trans':>10} "
+        f"{'B/node':>8} {'B/trans':>8} {'total MB':>10}"
+    )
+
+    for n in sizes:
+        bench(n)
+
+
+if __name__ == "__main__":
+    # python stats/memory.py [inverters ...]
+    main(tuple(int(arg) for arg in sys.argv[1:]) or SIZES[:2])
@@ -0,0 +1,80 @@
+"""SIRC Sharded Runner Scaling Benchmark"""
+
+import os
+import random
+import sys
+import time
+from main import build_inverter
+from sirc.core import Input, Node, Probe
+from sirc.simulator import DeviceSimulator, ShardedRunner
+
+
+def build_chains(
+    sim: DeviceSimulator, chains: int, depth: int
+) -> tuple[list[Input], list[Probe]]:
+    """
+    Build independent inverter chains sharing one pair of rails.
+
+    Args:
+        sim: DeviceSimulator
+        chains: Number of chains (one Input and one Probe each)
+        depth: Inverters per chain
+
+    Returns:
+        inputs, probes: Chain Inputs and Probes in order
+    """
+    vdd = sim.create_vdd()
+    gnd = sim.create_gnd()
+    inputs: list[Input] = []
+    probes: list[Probe] = []
+
+    for _ in range(chains):
+        inp = sim.create_input()
+        probe = sim.create_probe()
+        current: Node = inp.node
+
+        for _ in range(depth):
+            current = build_inverter(sim, vdd, gnd, current)
+
+        sim.connect(current, probe.node)
+        inputs.append(inp)
+        probes.append(probe)
+
+    return inputs, probes
+
+
+def main(vectors: int = 2000, max_workers: int = os.cpu_count() or 1):
+    """
+    SIRC Sharded Runner Scaling Benchmark
+
+    Runs the same vector set sequentially and then through ShardedRunner
+    with 1 to max_workers processes, printing vectors/s and speedup.
+    """
+    sim = DeviceSimulator()
+    inputs, probes = build_chains(sim, chains=8, depth=25)
+    sim.build_topology()
+
+    rng = random.Random(0)
+    data = bytes(rng.choice((1, 2)) for _ in range(vectors * len(inputs)))
+
+    t = time.perf_counter()
+    expected = sim.run_vectors(inputs, probes, data)
+    base = time.perf_counter() - t
+    print(f"sequential      {vectors / base:>10.0f} vec/s")
+
+    for workers in range(1, max_workers + 1):
+        with ShardedRunner(sim, inputs, probes, workers=workers) as runner:
+            t = time.perf_counter()
+            results = runner.run(data)
+            elapsed = time.perf_counter() - t
+
+        assert results == expected
+        print(
+            f"workers={workers:<3}     {vectors / elapsed:>10.0f} vec/s "
+            f"speedup {base / elapsed:>5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    # python stats/sharded.py [vectors] [max_workers]
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,137 @@
+"""SIRC Threaded CCC Scaling Benchmark"""
+
+import os
+import random
+import sys
+import time
+from sirc.core import GND, Input, Node, Probe, VDD
+from sirc.simulator import DeviceSimulator
+
+
+def build_nand(sim: DeviceSimulator, vdd: VDD, gnd: GND, a: Node, b: Node) -> Node:
+    """
+    Build one CMOS NAND2 cell.
+
+    Args:
+        sim: DeviceSimulator
+        vdd: Shared VDD rail
+        gnd: Shared GND rail
+        a: First input Node
+        b: Second input Node
+
+    Returns:
+        out: Node driven by this cell
+    """
+    out = sim.create_port().node
+    first = sim.create_nmos()
+    second = sim.create_nmos()
+
+    for gate in (a, b):
+        pmos = sim.create_pmos()
+        sim.connect(gate, pmos.gate)
+        sim.connect(vdd.node, pmos.source)
+        sim.connect(pmos.drain, out)
+
+    sim.connect(a, first.gate)
+    sim.connect(b, second.gate)
+    sim.connect(gnd.node, first.source)
+    sim.connect(first.drain, second.source)
+    sim.connect(second.drain, out)
+    return out
+
+
+def build_datapath(
+    sim: DeviceSimulator, width: int, depth: int
+) -> tuple[list[Input], list[Probe]]:
+    """
+    Build a width-bit datapath of depth NAND2 stages.
+
+    Bit i of each stage reads bits i and i + 1 of the previous stage, so
+    every stage is one CCC level holding width independent cells.
+
+    Args:
+        sim: DeviceSimulator
+        width: Bits per stage (one Input and one Probe each)
+        depth: Number of stages
+
+    Returns:
+        inputs, probes: Datapath Inputs and Probes in bit order
+    """
+    vdd = sim.create_vdd()
+    gnd = sim.create_gnd()
+    inputs = [sim.create_input() for _ in range(width)]
+    bits: list[Node] = [inp.node for inp in inputs]
+
+    for _ in range(depth):
+        bits = [
+            build_nand(sim, vdd, gnd, bits[i], bits[(i + 1) % width])
+            for i in range(width)
+        ]
+
+    probes = [sim.create_probe() for _ in range(width)]
+
+    for bit, probe in zip(bits, probes):
+        sim.connect(bit, probe.node)
+
+    return inputs, probes
+
+
+def bench(
+    threads: int, width: int, depth: int, vectors: bytes, cache_size: int
+) -> tuple[float, bytearray]:
+    """
+    Build the datapath for one thread count and time its vectors.
+
+    Returns:
+        elapsed, results: Seconds spent in run_vectors and the probe samples
+    """
+    sim = DeviceSimulator(
+        propagation="ccc", ccc_cache_size=cache_size, ccc_threads=threads
+    )
+    inputs, probes = build_datapath(sim, width, depth)
+    sim.build_topology()
+    t = time.perf_counter()
+    results = sim.run_vectors(inputs, probes, vectors)
+    elapsed = time.perf_counter() - t
+    # pylint: disable=protected-access
+    sim._ccc_engine.close()
+    return elapsed, results
+
+
+def main(
+    width: int = 1024,
+    depth: int = 16,
+    count: int = 20,
+    max_threads: int = os.cpu_count() or 1,
+    cache_size: int = 0,
+):
+    """
+    SIRC Threaded CCC Scaling Benchmark
+
+    Runs the same vectors through the ccc propagation mode with 1 to
+    max_threads worker threads on a wide NAND2 datapath, printing vectors/s
+    and speedup. cache_size defaults to 0 so every evaluation is a solve.
+    """
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(
+        f"python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}, "
+        f"{width}x{depth} NAND2 datapath, {count} vectors"
+    )
+
+    rng = random.Random(0)
+    vectors = bytes(rng.choice((1, 2)) for _ in range(count * width))
+    base, expected = bench(1, width, depth, vectors, cache_size)
+    print(f"threads=1       {count / base:>10.1f} vec/s")
+
+    for threads in range(2, max_threads + 1):
+        elapsed, results = bench(threads, width, depth, vectors, cache_size)
+        assert results == expected
+        print(
+            f"threads={threads:<3}     {count / elapsed:>10.1f} vec/s "
+            f"speedup {base / elapsed:>5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    # python stats/threads.py [width] [depth] [vectors] [max_threads] [cache_size]
+    main(*(int(arg) for arg in sys.argv[1:6]))
@@ -0,0 +1,180 @@
+"""Unit tests for Bit-Parallel Simulator module."""
+
+import random
+import pytest
+from sirc.core import LogicValue
+from sirc.simulator import BitParallelSimulator, DeviceSimulator
+from sirc.simulator.convergence import OscillationError
+from .test_convergence import build_ring_oscillator
+from .test_device_sim import (
+    build_cmos_inverter,
+    build_inverter_chain,
+    build_random_circuit,
+    build_random_switch_network,
+)
+
+VALUES = (LogicValue.ZERO, LogicValue.ONE, LogicValue.Z, LogicValue.X)
+
+
+def assert_lanes_match_sweep(builder, seed: int, lanes: int = 8, ticks: int = 6):
+    """Every lane must settle exactly like a sweep simulator fed that lane."""
+    rng = random.Random(seed)
+    sim = DeviceSimulator()
+    inputs = builder(sim, seed)
+    sim.build_topology()
+    bit = BitParallelSimulator(sim, lanes=lanes)
+    references = [DeviceSimulator(propagation="sweep") for _ in range(lanes)]
+    reference_inputs = [builder(ref, seed) for ref in references]
+    for ref in references:
+        ref.build_topology()
+    for _ in range(ticks):
+        stimulus = [[rng.choice(VALUES) for _ in range(lanes)] for _ in inputs]
+        for device, values in zip(inputs, stimulus):
+            bit.set_input(device, values)
+        bit.tick()
+        for lane, (ref, devices) in enumerate(zip(references, reference_inputs)):
+            for device, values in zip(devices, stimulus):
+                device.set_value(values[lane])
+            ref.tick()
+        # pylint: disable=protected-access
+        for net, (zero, one, x) in enumerate(bit._resolved_planes):
+            for lane, ref in enumerate(references):
+                value = (
+                    (zero >> lane & 1) | (one >> lane & 1) << 1 | (x >> lane & 1) << 2
+                )
+                assert value == ref.state.net_resolved_values[net]
+
+
+def test_bit_parallel_requires_compiled_topology():
+    """BitParallelSimulator must reject uncompiled simulators and bad lanes."""
+    sim = DeviceSimulator()
+    sim.create_input()
+    with pytest.raises(ValueError):
+        BitParallelSimulator(sim)
+    sim.build_topology()
+    with pytest.raises(ValueError):
+        BitParallelSimulator(sim, lanes=0)
+
+
+def test_bit_parallel_inverter_all_values():
+    """Each lane of an inverter must see its own input value."""
+    sim = DeviceSimulator()
+    inp, probe = build_cmos_inverter(sim)
+    sim.build_topology()
+    bit = BitParallelSimulator(sim, lanes=4)
+    bit.set_input(inp, VALUES)
+    bit.tick()
+    # An X gate turns neither transistor on, leaving the output floating.
+    assert bit.sample(probe) == [
+        LogicValue.ONE,
+        LogicValue.ZERO,
+        LogicValue.Z,
+        LogicValue.Z,
+    ]
+    with pytest.raises(ValueError):
+        bit.set_input(inp, VALUES[:3])
+
+
+def test_bit_parallel_inverter_chain_wide_lanes():
+    """A 256-lane chain must invert every lane's input n times."""
+    lanes = 256
+    sim = DeviceSimulator()
+    inp, probe = build_inverter_chain(sim, 9)
+    sim.build_topology()
+    bit = BitParallelSimulator(sim, lanes=lanes)
+    pattern = random.Random(0).getrandbits(lanes)
+    bit.set_input_planes(inp, ~pattern, pattern, 0)
+    bit.tick()
+    assert bit.sample_planes(probe) == (pattern, ~pattern & ((1 << lanes) - 1), 0)
+
+
+def test_bit_parallel_ring_oscillator_raises():
+    """An enabled ring in any lane must raise OscillationError."""
+    sim = DeviceSimulator()
+    enable, probes = build_ring_oscillator(sim)
+    sim.build_topology()
+    bit = BitParallelSimulator(sim, lanes=2)
+    bit.set_input(enable, (LogicValue.ZERO, LogicValue.ZERO))
+    bit.tick()
+    assert bit.last_oscillation is None
+    bit.set_input(enable, (LogicValue.ONE, LogicValue.ZERO))
+    with pytest.raises(OscillationError) as info:
+        bit.tick()
+    oscillation = info.value.oscillation
+    assert oscillation is bit.last_oscillation
+    assert oscillation.period > 0
+    assert {probe.node.id_ for probe in probes} <= set(oscillation.nodes)
+
+
+def test_bit_parallel_ring_oscillator_marked_x_per_lane():
+    """With on_oscillation="x", only the oscillating lane reads X."""
+    sim = DeviceSimulator(on_oscillation="x")
+    enable, probes = build_ring_oscillator(sim)
+    sim.build_topology()
+    bit = BitParallelSimulator(sim, lanes=2)
+    bit.set_input(enable, (LogicValue.ZERO, LogicValue.ZERO))
+    bit.tick()
+    bit.set_input(enable, (LogicValue.ONE, LogicValue.ZERO))
+    bit.tick()
+    assert bit.last_oscillation is not None
+    assert [bit.sample(probe) for probe in probes] == [
+        [LogicValue.X, LogicValue.ONE],
+        [LogicValue.X, LogicValue.ZERO],
+        [LogicValue.X, LogicValue.ONE],
+    ]
+
+    bit.set_input(enable, (LogicValue.ZERO, LogicValue.ZERO))
+    bit.tick()
+    assert [bit.sample(probe) for probe in probes] == [
+        [LogicValue.ONE] * 2,
+        [LogicValue.ZERO] * 2,
+        [LogicValue.ONE] * 2,
+    ]
+
+
+def test_bit_parallel_marked_x_reaches_fanout():
+    """Transistors gated by a marked net must turn off in its X lanes."""
+    sim = DeviceSimulator(on_oscillation="x")
+    enable, probes = build_ring_oscillator(sim)
+    # A complementary pass pair from VDD holds its output at ONE for either
+    # value of the ring net, so that output never changes during the cycle.
+    vdd = sim.create_vdd()
+    passed = sim.create_probe()
+    for transistor in (sim.create_nmos(), sim.create_pmos()):
+        sim.connect(probes[1].node, transistor.gate)
+        sim.connect(vdd.node, transistor.source)
+        sim.connect(transistor.drain, passed.node)
+    sim.build_topology()
+    bit = BitParallelSimulator(sim, lanes=2)
+    bit.set_input(enable, (LogicValue.ZERO, LogicValue.ZERO))
+    bit.tick()
+    assert bit.sample(passed) == [LogicValue.ONE] * 2
+    bit.set_input(enable, (LogicValue.ONE, LogicValue.ZERO))
+    bit.tick()
+    assert bit.sample(probes[1]) == [LogicValue.X, LogicValue.ZERO]
+    assert bit.sample(passed) == [LogicValue.Z, LogicValue.ONE]
+
+
+def test_bit_parallel_iteration_bound():
+    """max_iterations of the DeviceSimulator caps a bit-parallel tick."""
+    sim = DeviceSimulator(max_iterations=3)
+    inp, _ = build_inverter_chain(sim, 10)
+    sim.build_topology()
+    bit = BitParallelSimulator(sim, lanes=1)
+    bit.set_input(inp, (LogicValue.ONE,))
+    with pytest.raises(OscillationError) as info:
+        bit.tick()
+    assert info.value.oscillation.period == 0
+    assert info.value.oscillation.iterations == 3
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_bit_parallel_random_circuit_matches_sweep(seed: int):
+    """Random CMOS netlists must match the sweep engine lane for lane."""
+    assert_lanes_match_sweep(build_random_circuit, seed)
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_bit_parallel_switch_network_matches_sweep(seed: int):
+    """Random pass-transistor networks must match the sweep lane for lane."""
+    assert_lanes_match_sweep(build_random_switch_network, seed)
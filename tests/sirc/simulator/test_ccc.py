@@ -0,0 +1,349 @@
+"""Unit tests for Channel-Connected Component module."""
+
+import random
+import pytest
+from sirc.core import LogicValue, Input, Probe
+from sirc.simulator import DeviceSimulator
+from sirc.simulator import ccc
+from .test_device_sim import (
+    assert_matches_sweep,
+    build_cmos_inverter,
+    build_inverter_chain,
+    build_random_circuit,
+    build_random_switch_network,
+)
+
+
+def ccc_rows(offsets, values) -> list[list[int]]:
+    """Unpack a CCC CSR index into per-CCC lists."""
+    return [
+        list(values[offsets[cid] : offsets[cid + 1]]) for cid in range(len(offsets) - 1)
+    ]
+
+
+def test_build_topology_partitions_inverter_chain_at_rails():
+    """Each inverter stage must be its own CCC, gated by the previous one."""
+    sim = DeviceSimulator(propagation="ccc")
+    build_inverter_chain(sim, 3)
+    sim.build_topology()
+    state = sim.state
+    rails = [state.node_nets[d.node.id_] for d in list(state.devices)[:2]]
+    assert [state.net_ccc[net] for net in rails] == [-1, -1]
+    outputs = ccc_rows(state.ccc_output_offsets, state.ccc_output_nets)
+    inputs = ccc_rows(state.ccc_input_offsets, state.ccc_input_nets)
+    transistors = ccc_rows(state.ccc_transistor_offsets, state.ccc_transistors)
+    stages = sorted(
+        (cid for cid, t in enumerate(transistors) if t), key=transistors.__getitem__
+    )
+    assert [transistors[cid] for cid in stages] == [[0, 1], [2, 3], [4, 5]]
+    rail_rows = ccc_rows(state.ccc_rail_offsets, state.ccc_rail_nets)
+    fanout = ccc_rows(state.net_ccc_fanout_offsets, state.net_ccc_fanout)
+    attached = ccc_rows(state.rail_ccc_offsets, state.rail_cccs)
+    for previous, cid in zip(stages, stages[1:]):
+        assert inputs[cid] == outputs[previous]
+    for cid in stages:
+        (net,) = outputs[cid]
+        assert state.net_ccc[net] == cid
+        assert sorted(rail_rows[cid]) == sorted(rails)
+        assert all(cid in fanout[gate] for gate in inputs[cid])
+    assert all(sorted(attached[rail]) == sorted(stages) for rail in rails)
+
+
+def test_rail_to_rail_transistor_forms_its_own_ccc():
+    """A channel joining two rails must still be evaluated, shorting them."""
+    sim = DeviceSimulator(propagation="ccc")
+    vdd = sim.create_vdd()
+    gnd = sim.create_gnd()
+    inp = sim.create_input()
+    probe = sim.create_probe()
+    nmos = sim.create_nmos()
+    sim.connect(inp.node, nmos.gate)
+    sim.connect(vdd.node, nmos.source)
+    sim.connect(gnd.node, nmos.drain)
+    sim.connect(vdd.node, probe.node)
+    sim.build_topology()
+    state = sim.state
+    cid = state.transistor_ccc[nmos.id_]
+    assert state.ccc_output_offsets[cid] == state.ccc_output_offsets[cid + 1]
+    inp.set_value(LogicValue.ZERO)
+    sim.tick()
+    assert probe.sample() is LogicValue.ONE
+    inp.set_value(LogicValue.ONE)
+    sim.tick()
+    assert probe.sample() is LogicValue.X
+    assert nmos.conducting
+
+
+def test_input_change_only_evaluates_dependent_cccs(monkeypatch):
+    """Toggling one inverter's input must leave an unrelated inverter alone."""
+    sim = DeviceSimulator(propagation="ccc")
+    first, first_probe = build_cmos_inverter(sim)
+    second, second_probe = build_cmos_inverter(sim)
+    sim.build_topology()
+    first.set_value(LogicValue.ONE)
+    second.set_value(LogicValue.ONE)
+    sim.tick()
+    evaluated: list[int] = []
+    # pylint: disable=protected-access
+    evaluate = ccc.CCCEngine._evaluate
+    monkeypatch.setattr(
+        ccc.CCCEngine,
+        "_evaluate",
+        lambda engine, cid: evaluated.append(cid) or evaluate(engine, cid),
+    )
+    first.set_value(LogicValue.ZERO)
+    sim.tick()
+    state = sim.state
+    second_net = state.node_nets[second.node.id_]
+    fanout = ccc_rows(state.net_ccc_fanout_offsets, state.net_ccc_fanout)
+    untouched = {state.net_ccc[second_net], *fanout[second_net]}
+    assert evaluated and not untouched & set(evaluated)
+    assert first_probe.sample() is LogicValue.ONE
+    assert second_probe.sample() is LogicValue.ZERO
+
+
+def test_load_compiled_partitions_on_first_tick(tmp_path):
+    """A loaded netlist must build its CCCs lazily and simulate the same."""
+    path = tmp_path / "chain.sirc"
+    sim = DeviceSimulator()
+    inp, probe = build_inverter_chain(sim, 5)
+    sim.build_topology()
+    sim.save_compiled(path)
+    loaded = DeviceSimulator.load_compiled(path, propagation="ccc")
+    vectors = bytes([1, 2, 0, 2])
+    assert loaded.run_vectors([inp], [probe], vectors) == sim.run_vectors(
+        [inp], [probe], vectors
+    )
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_ccc_propagation_matches_sweep(seed: int):
+    """CCC worklist evaluation must settle to the same state as the sweep."""
+    assert_matches_sweep(build_random_circuit, seed, propagation="ccc")
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_ccc_rails_match_sweep_through_shorts(seed: int):
+    """Rail groups joined through shorts must resolve as in the sweep."""
+    assert_matches_sweep(build_random_switch_network, seed, ticks=30, propagation="ccc")
+
+
+def test_identical_cells_share_a_signature():
+    """Every inverter stage must intern to the same structural signature."""
+    sim = DeviceSimulator(propagation="ccc")
+    build_inverter_chain(sim, 6)
+    sim.build_topology()
+    state = sim.state
+    stages = {state.ccc_signatures[cid] for cid in state.transistor_ccc}
+    assert len(stages) == 1
+    assert stages.isdisjoint(
+        state.ccc_signatures[cid]
+        for cid in range(len(state.ccc_signatures))
+        if state.ccc_transistor_offsets[cid] == state.ccc_transistor_offsets[cid + 1]
+    )
+
+
+def test_repeated_cells_hit_the_cache():
+    """After the first stage solves, the rest of a chain must be cache hits."""
+    sim = DeviceSimulator(propagation="ccc")
+    inp, probe = build_inverter_chain(sim, 40)
+    sim.build_topology()
+    for value in (LogicValue.ONE, LogicValue.ZERO):
+        inp.set_value(value)
+        sim.tick()
+        assert probe.sample() is value
+    # pylint: disable=protected-access
+    engine = sim._ccc_engine
+    assert engine.cache_misses <= 6
+    assert engine.cache_hits >= 70
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_cache_size_does_not_change_results(seed: int):
+    """Disabled, thrashing and default caches must settle identically."""
+    rng = random.Random(seed)
+    sims = [
+        DeviceSimulator(propagation="ccc", ccc_cache_size=size) for size in (0, 1, 3)
+    ]
+    sims.append(DeviceSimulator(propagation="ccc"))
+    inputs = [build_random_switch_network(sim, seed) for sim in sims]
+    for sim in sims:
+        sim.build_topology()
+    for _ in range(20):
+        stimulus = [rng.choice((1, 2, 0, 4)) for _ in inputs[0]]
+        for sim, devices in zip(sims, inputs):
+            for device, value in zip(devices, stimulus):
+                device.set_value(value)
+            sim.tick()
+        states = [sim.state for sim in sims]
+        assert all(
+            s.node_resolved_values == states[0].node_resolved_values for s in states
+        )
+        assert all(
+            s.transistor_conducting == states[0].transistor_conducting for s in states
+        )
+    # pylint: disable=protected-access
+    assert sims[0]._ccc_engine.cache_hits == sims[0]._ccc_engine.cache_misses == 0
+    assert len(sims[2]._ccc_engine._cache) <= 3
+
+
+def test_negative_cache_size_is_rejected():
+    """A negative ccc_cache_size must raise ValueError."""
+    with pytest.raises(ValueError):
+        DeviceSimulator(propagation="ccc", ccc_cache_size=-1)
+
+
+def build_sr_latch(sim: DeviceSimulator) -> tuple[Input, Input, Probe]:
+    """Build a cross-coupled NAND SR latch; return its nS, nR and Q."""
+    vdd = sim.create_vdd()
+    gnd = sim.create_gnd()
+    set_n, reset_n = sim.create_input(), sim.create_input()
+    q, q_n = sim.create_port().node, sim.create_port().node
+    for a, b, out in ((set_n.node, q_n, q), (reset_n.node, q, q_n)):
+        for gate in (a, b):
+            pmos = sim.create_pmos()
+            sim.connect(gate, pmos.gate)
+            sim.connect(vdd.node, pmos.source)
+            sim.connect(pmos.drain, out)
+        first, second = sim.create_nmos(), sim.create_nmos()
+        sim.connect(a, first.gate)
+        sim.connect(b, second.gate)
+        sim.connect(gnd.node, first.source)
+        sim.connect(first.drain, second.source)
+        sim.connect(second.drain, out)
+    probe = sim.create_probe()
+    sim.connect(q, probe.node)
+    return set_n, reset_n, probe
+
+
+def test_levels_follow_gate_to_output_order():
+    """Inverter stages must sit on increasing levels with no feedback."""
+    sim = DeviceSimulator(propagation="ccc")
+    build_inverter_chain(sim, 5)
+    sim.build_topology()
+    state = sim.state
+    stages = sorted(set(state.transistor_ccc))
+    levels = sorted(state.ccc_levels[cid] for cid in stages)
+    assert levels == list(range(levels[0], levels[0] + 5))
+    assert not any(state.ccc_feedback)
+
+
+def test_latch_forms_a_feedback_region():
+    """Cross-coupled NANDs must share a level, be flagged and still latch."""
+    sim = DeviceSimulator(propagation="ccc")
+    set_n, reset_n, q = build_sr_latch(sim)
+    sim.build_topology()
+    state = sim.state
+    nands = sorted(set(state.transistor_ccc))
+    assert len(nands) == 2
+    assert [state.ccc_feedback[cid] for cid in nands] == [1, 1]
+    assert state.ccc_levels[nands[0]] == state.ccc_levels[nands[1]]
+    for s, r, expected in ((0, 1, 2), (1, 1, 2), (1, 0, 1), (1, 1, 1), (0, 1, 2)):
+        set_n.set_value(LogicValue(1 + s))
+        reset_n.set_value(LogicValue(1 + r))
+        sim.tick()
+        assert q.sample() is LogicValue(expected)
+
+
+def test_acyclic_design_evaluates_each_ccc_once_per_tick(monkeypatch):
+    """Level order must settle a feed-forward netlist in one ordered pass."""
+    sim = DeviceSimulator(propagation="ccc")
+    inputs = build_random_circuit(sim, 5, inputs=6, cells=200)
+    sim.build_topology()
+    assert not any(sim.state.ccc_feedback)
+    evaluated: list[int] = []
+    # pylint: disable=protected-access
+    evaluate = ccc.CCCEngine._evaluate
+    monkeypatch.setattr(
+        ccc.CCCEngine,
+        "_evaluate",
+        lambda engine, cid: evaluated.append(cid) or evaluate(engine, cid),
+    )
+    rng = random.Random(5)
+    for _ in range(20):
+        for device in inputs:
+            device.set_value(rng.choice((LogicValue.ZERO, LogicValue.ONE)))
+        evaluated.clear()
+        sim.tick()
+        assert len(evaluated) == len(set(evaluated))
+
+
+@pytest.mark.parametrize("threads", (2, 3))
+@pytest.mark.parametrize("cache_size", (0, 2, ccc.DEFAULT_CACHE_SIZE))
+@pytest.mark.parametrize("seed", range(4))
+def test_threaded_levels_match_sequential(
+    monkeypatch, threads: int, cache_size: int, seed: int
+):
+    """Level batches split across threads must settle like one thread."""
+    monkeypatch.setattr(ccc, "PARALLEL_MIN_BATCH", 1)
+    rng = random.Random(seed)
+    sims = [
+        DeviceSimulator(propagation="ccc", ccc_cache_size=cache_size, ccc_threads=count)
+        for count in (1, threads)
+    ]
+    builder = build_random_switch_network if seed % 2 else build_random_circuit
+    inputs = [builder(sim, seed) for sim in sims]
+    for sim in sims:
+        sim.build_topology()
+    for _ in range(16):
+        stimulus = [rng.choice((1, 2, 0, 4)) for _ in inputs[0]]
+        for sim, devices in zip(sims, inputs):
+            for device, value in zip(devices, stimulus):
+                device.set_value(value)
+            sim.tick()
+        single, threaded = (sim.state for sim in sims)
+        assert single.node_resolved_values == threaded.node_resolved_values
+        assert single.net_resolved_values == threaded.net_resolved_values
+        assert single.transistor_conducting == threaded.transistor_conducting
+    # pylint: disable=protected-access
+    engine = sims[1]._ccc_engine
+    if cache_size:
+        assert engine.cache_hits + engine.cache_misses > 0
+        assert len(engine._cache) <= cache_size
+    sims[1].build_topology()
+    assert engine._pool is None
+
+
+def test_threaded_latch_still_latches(monkeypatch):
+    """A feedback level evaluated in parallel must reach the same state."""
+    monkeypatch.setattr(ccc, "PARALLEL_MIN_BATCH", 1)
+    sim = DeviceSimulator(propagation="ccc", ccc_threads=2)
+    set_n, reset_n, q = build_sr_latch(sim)
+    sim.build_topology()
+    for s, r, expected in ((0, 1, 2), (1, 1, 2), (1, 0, 1), (1, 1, 1), (0, 1, 2)):
+        set_n.set_value(LogicValue(1 + s))
+        reset_n.set_value(LogicValue(1 + r))
+        sim.tick()
+        assert q.sample() is LogicValue(expected)
+
+
+def test_close_stops_the_thread_pool(monkeypatch):
+    """close, also on leaving a with block, must stop the engine's threads."""
+    # pylint: disable=protected-access
+    monkeypatch.setattr(ccc, "PARALLEL_MIN_BATCH", 1)
+    with DeviceSimulator(propagation="ccc", ccc_threads=2) as sim:
+        set_n, reset_n, q = build_sr_latch(sim)
+        sim.build_topology()
+        set_n.set_value(LogicValue.ZERO)
+        reset_n.set_value(LogicValue.ONE)
+        sim.tick()
+        engine = sim._ccc_engine
+        assert engine._pool is not None
+    assert engine._pool is None and sim._ccc_engine is None
+    # A closed simulator keeps its state and builds a new engine on demand.
+    set_n.set_value(LogicValue.ONE)
+    sim.tick()
+    assert q.sample() is LogicValue.ONE
+    sim.close()
+    sim.close()
+
+
+def test_non_positive_thread_count_is_rejected():
+    """ccc_threads and CCCEngine threads below one must raise ValueError."""
+    with pytest.raises(ValueError):
+        DeviceSimulator(propagation="ccc", ccc_threads=0)
+    sim = DeviceSimulator(propagation="ccc")
+    build_cmos_inverter(sim)
+    sim.build_topology()
+    with pytest.raises(ValueError):
+        ccc.CCCEngine(sim.state, (2, 1), threads=0)
@@ -0,0 +1,156 @@
+"""Unit tests for Compiled Netlist module."""
+
+import random
+import pytest
+from sirc.core import LogicValue, Port, Input, Probe
+from sirc.simulator import DeviceSimulator
+from sirc.simulator.compiled import COMPILED_MAGIC, read_compiled
+from .test_convergence import build_ring_oscillator
+from .test_device_sim import build_inverter_chain, build_random_circuit
+
+EDGE_STORAGES = ("aos", "soa", "psoa")
+
+
+def build_probed_circuit(sim: DeviceSimulator) -> None:
+    """Build a random CMOS netlist with a Probe on its last cell output."""
+    build_random_circuit(sim, 7, inputs=4, cells=20)
+    last_port = [d for d in sim.state.devices if isinstance(d, Port)][-1]
+    sim.connect(last_port.node, sim.create_probe().node)
+    sim.build_topology()
+
+
+@pytest.mark.parametrize("edge_storage", EDGE_STORAGES)
+def test_save_and_load_compiled_round_trip(tmp_path, edge_storage: str):
+    """A loaded netlist must hold the saved columns and simulate the same."""
+    path = tmp_path / "netlist.sirc"
+    sim = DeviceSimulator(edge_storage=edge_storage)
+    build_probed_circuit(sim)
+    sim.save_compiled(path)
+    loaded = DeviceSimulator.load_compiled(path)
+    state, loaded_state = sim.state, loaded.state
+    assert list(loaded_state.node_nets) == list(state.node_nets)
+    assert loaded_state.net_nodes == state.net_nodes
+    assert list(loaded_state.net_channel_peers) == list(state.net_channel_peers)
+    assert [type(d) for d in loaded_state.devices] == [type(d) for d in state.devices]
+    inputs = [d for d in state.devices if isinstance(d, Input)]
+    probes = [d for d in state.devices if isinstance(d, Probe)]
+    loaded_inputs = [d for d in loaded_state.devices if isinstance(d, Input)]
+    loaded_probes = [d for d in loaded_state.devices if isinstance(d, Probe)]
+    rng = random.Random(3)
+    vectors = bytes(rng.choice((1, 2, 0)) for _ in range(len(inputs) * 40))
+    expected = sim.run_vectors(inputs, probes, vectors)
+    assert loaded.run_vectors(loaded_inputs, loaded_probes, vectors) == expected
+
+
+def test_load_compiled_is_copy_on_write_and_resaves(tmp_path):
+    """Simulating a loaded netlist must not modify the file it maps."""
+    path = tmp_path / "chain.sirc"
+    sim = DeviceSimulator()
+    build_inverter_chain(sim, 5)
+    sim.build_topology()
+    sim.save_compiled(path)
+    original = path.read_bytes()
+    loaded = DeviceSimulator.load_compiled(path, propagation="sweep")
+    inp = next(d for d in loaded.state.devices if isinstance(d, Input))
+    probe = next(d for d in loaded.state.devices if isinstance(d, Probe))
+    inp.set_value(LogicValue.ONE)
+    loaded.tick()
+    assert probe.sample() is LogicValue.ZERO
+    assert path.read_bytes() == original
+    resaved = tmp_path / "resaved.sirc"
+    DeviceSimulator.load_compiled(path).save_compiled(resaved)
+    assert resaved.read_bytes() == original
+
+
+def test_load_compiled_forwards_simulator_options(tmp_path):
+    """load_compiled must build the simulator with every constructor option."""
+    path = tmp_path / "ring.sirc"
+    sim = DeviceSimulator()
+    build_ring_oscillator(sim)
+    sim.build_topology()
+    sim.save_compiled(path)
+    loaded = DeviceSimulator.load_compiled(
+        path,
+        propagation="ccc",
+        ccc_cache_size=0,
+        ccc_threads=2,
+        max_iterations=50,
+        on_oscillation="x",
+    )
+    assert loaded.propagation == "ccc"
+    assert loaded.ccc_cache_size == 0
+    assert loaded.ccc_threads == 2
+    assert loaded.max_iterations == 50
+    assert loaded.on_oscillation == "x"
+    enable = next(d for d in loaded.state.devices if isinstance(d, Input))
+    probes = [d for d in loaded.state.devices if isinstance(d, Probe)]
+    enable.set_value(LogicValue.ZERO)
+    loaded.tick()
+    enable.set_value(LogicValue.ONE)
+    loaded.tick()
+    assert loaded.last_oscillation is not None
+    assert all(probe.sample() is LogicValue.X for probe in probes)
+
+
+def test_save_compiled_keeps_values_set_without_tick(tmp_path):
+    """Input values set after the last tick must be saved with their nets."""
+    path = tmp_path / "held.sirc"
+    sim = DeviceSimulator()
+    inp = sim.create_input()
+    probe = sim.create_probe()
+    sim.connect(inp.node, probe.node)
+    sim.build_topology()
+    inp.set_value(LogicValue.ONE)
+    sim.save_compiled(path)
+    sim.tick()
+    assert probe.sample() is LogicValue.ONE
+    loaded = DeviceSimulator.load_compiled(path)
+    loaded.tick()
+    loaded_probe = next(d for d in loaded.state.devices if isinstance(d, Probe))
+    assert loaded_probe.sample() is LogicValue.ONE
+
+
+def test_loaded_netlist_is_frozen(tmp_path):
+    """Editing operations on a loaded netlist must raise RuntimeError."""
+    path = tmp_path / "chain.sirc"
+    sim = DeviceSimulator()
+    build_inverter_chain(sim, 1)
+    sim.build_topology()
+    sim.save_compiled(path)
+    loaded = DeviceSimulator.load_compiled(path)
+    nodes = loaded.state.nodes
+    with pytest.raises(RuntimeError):
+        loaded.create_nmos()
+    with pytest.raises(RuntimeError):
+        loaded.connect(nodes[0], nodes[1])
+    with pytest.raises(RuntimeError):
+        loaded.build_topology()
+
+
+def test_compiled_rejects_bad_files(tmp_path):
+    """Uncompiled simulators, foreign files and other versions must fail."""
+    sim = DeviceSimulator()
+    sim.create_input()
+    with pytest.raises(ValueError):
+        sim.save_compiled(tmp_path / "early.sirc")
+    foreign = tmp_path / "foreign.sirc"
+    foreign.write_bytes(b"NOTSIRC!" + bytes(32))
+    with pytest.raises(ValueError):
+        read_compiled(foreign)
+    empty = tmp_path / "empty.sirc"
+    empty.write_bytes(b"")
+    with pytest.raises(ValueError, match="not a compiled SIRC netlist"):
+        read_compiled(empty)
+    good = tmp_path / "good.sirc"
+    sim.build_topology()
+    sim.save_compiled(good)
+    data = good.read_bytes()
+    truncated = tmp_path / "truncated.sirc"
+    for size in (40, len(data) - 1):
+        truncated.write_bytes(data[:size])
+        with pytest.raises(ValueError, match="is truncated"):
+            DeviceSimulator.load_compiled(truncated)
+    future = tmp_path / "future.sirc"
+    future.write_bytes(COMPILED_MAGIC + (99).to_bytes(4, "little") + bytes(4))
+    with pytest.raises(ValueError):
+        DeviceSimulator.load_compiled(future)
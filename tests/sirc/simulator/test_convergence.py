@@ -0,0 +1,182 @@
+"""Unit tests for Convergence module."""
+
+import pytest
+from sirc.core import Input, LogicValue, Node, Probe
+from sirc.simulator import DeviceSimulator
+from sirc.simulator.convergence import CycleDetector, OscillationError
+from .test_device_sim import build_inverter_chain
+
+# (propagation, backend) pairs covering every tick engine.
+ENGINES = (
+    ("event", "python"),
+    ("sweep", "python"),
+    ("sweep", "bytes"),
+    ("sweep", "numpy"),
+    ("ccc", "python"),
+)
+
+
+def make_sim(propagation: str, backend: str, **kwargs) -> DeviceSimulator:
+    """Create a simulator, skipping the numpy backend without NumPy."""
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    return DeviceSimulator(propagation=propagation, backend=backend, **kwargs)
+
+
+def build_ring_oscillator(
+    sim: DeviceSimulator, inverters: int = 2
+) -> tuple[Input, list[Probe]]:
+    """
+    Build a NAND2 gated ring of inverters; return the enable Input and one
+    Probe per ring stage. An even inverter count makes the ring inverting,
+    so it oscillates while enable is ONE.
+    """
+    vdd = sim.create_vdd()
+    gnd = sim.create_gnd()
+    enable = sim.create_input()
+    feedback = sim.create_port().node
+    stages: list[Node] = [sim.create_port().node]
+    first, second = sim.create_nmos(), sim.create_nmos()
+    for gate in (enable.node, feedback):
+        pmos = sim.create_pmos()
+        sim.connect(gate, pmos.gate)
+        sim.connect(vdd.node, pmos.source)
+        sim.connect(pmos.drain, stages[0])
+    sim.connect(enable.node, first.gate)
+    sim.connect(feedback, second.gate)
+    sim.connect(gnd.node, first.source)
+    sim.connect(first.drain, second.source)
+    sim.connect(second.drain, stages[0])
+    for _ in range(inverters):
+        pmos, nmos = sim.create_pmos(), sim.create_nmos()
+        sim.connect(stages[-1], pmos.gate)
+        sim.connect(stages[-1], nmos.gate)
+        sim.connect(vdd.node, pmos.source)
+        sim.connect(gnd.node, nmos.source)
+        sim.connect(pmos.drain, nmos.drain)
+        stages.append(pmos.drain)
+    sim.connect(stages[-1], feedback)
+    probes = [sim.create_probe() for _ in stages]
+    for stage, probe in zip(stages, probes):
+        sim.connect(stage, probe.node)
+    return enable, probes
+
+
+def test_detector_finds_period_and_collects_nets():
+    """A repeating hash sequence must stop after one confirming period."""
+    detector = CycleDetector()
+    sequence = [10, 11, 12, 13, 14] + [20, 21, 22] * 8
+    for iteration, state_hash in enumerate(sequence):
+        if detector.step(state_hash, [iteration % 3 + 100]):
+            break
+    else:
+        pytest.fail("cycle not detected")
+    assert detector.stopped
+    assert detector.period == 3
+    assert detector.nets == {100, 101, 102}
+    detector.reset()
+    assert not detector.stopped and detector.iterations == 0
+
+
+def test_detector_survives_a_hash_collision():
+    """A repeat that does not recur one period later must not stop the tick."""
+    detector = CycleDetector()
+    # 7 repeats after two steps, but the states then diverge.
+    stopped = [detector.step(h, [h]) for h in (7, 8, 7, 9, 10, 11, 12, 13, 14)]
+    assert not any(stopped)
+    assert detector.period == 0
+
+
+def test_detector_bound_and_validation():
+    """max_iterations stops a tick with period 0; it must be positive."""
+    detector = CycleDetector(max_iterations=4)
+    stopped = [detector.step(h, [h]) for h in (1, 2, 3, 4)]
+    assert stopped == [False, False, False, True]
+    assert detector.period == 0 and detector.nets == {4}
+    with pytest.raises(ValueError):
+        CycleDetector(max_iterations=0)
+    with pytest.raises(ValueError):
+        DeviceSimulator(on_oscillation="ignore")
+
+
+@pytest.mark.parametrize("propagation, backend", ENGINES)
+def test_ring_oscillator_raises(propagation: str, backend: str):
+    """An enabled ring must raise OscillationError naming its nets."""
+    sim = make_sim(propagation, backend)
+    enable, probes = build_ring_oscillator(sim)
+    sim.build_topology()
+    enable.set_value(LogicValue.ZERO)
+    sim.tick()
+    assert [probe.sample() for probe in probes] == [
+        LogicValue.ONE,
+        LogicValue.ZERO,
+        LogicValue.ONE,
+    ]
+    assert sim.last_oscillation is None
+
+    enable.set_value(LogicValue.ONE)
+    with pytest.raises(OscillationError) as info:
+        sim.tick()
+    oscillation = info.value.oscillation
+    assert oscillation is sim.last_oscillation
+    assert oscillation.period > 0
+    assert oscillation.iterations >= oscillation.period
+    ring_nodes = {probe.node.id_ for probe in probes}
+    assert ring_nodes <= set(oscillation.nodes)
+    state = sim.state
+    assert {state.node_nets[node_id] for node_id in ring_nodes} <= set(oscillation.nets)
+
+
+@pytest.mark.parametrize("propagation, backend", ENGINES)
+def test_ring_oscillator_marked_x_recovers(propagation: str, backend: str):
+    """With on_oscillation="x", the ring reads X until it is disabled."""
+    sim = make_sim(propagation, backend, on_oscillation="x")
+    enable, probes = build_ring_oscillator(sim)
+    sim.build_topology()
+    # From power-up every ring net floats at Z, which is a fixed point.
+    enable.set_value(LogicValue.ZERO)
+    sim.tick()
+    enable.set_value(LogicValue.ONE)
+    sim.tick()
+    assert sim.last_oscillation is not None
+    assert all(probe.sample() is LogicValue.X for probe in probes)
+
+    enable.set_value(LogicValue.ZERO)
+    sim.tick()
+    assert [probe.sample() for probe in probes] == [
+        LogicValue.ONE,
+        LogicValue.ZERO,
+        LogicValue.ONE,
+    ]
+
+
+@pytest.mark.parametrize("propagation", ("event", "sweep"))
+def test_iteration_bound_stops_a_settling_tick(propagation: str):
+    """max_iterations caps even a convergent tick, reporting period 0."""
+    sim = DeviceSimulator(propagation=propagation, max_iterations=3)
+    inp, _ = build_inverter_chain(sim, 10)
+    sim.build_topology()
+    inp.set_value(LogicValue.ONE)
+    with pytest.raises(OscillationError) as info:
+        sim.tick()
+    assert info.value.oscillation.period == 0
+    assert info.value.oscillation.iterations == 3
+    assert "did not settle within 3 iterations" in str(info.value)
+
+
+def test_threaded_ccc_ring_oscillator_raises(monkeypatch):
+    """Level batches on the thread pool must detect the ring as well."""
+    # pylint: disable=import-outside-toplevel
+    from sirc.simulator import ccc
+
+    monkeypatch.setattr(ccc, "PARALLEL_MIN_BATCH", 1)
+    sim = DeviceSimulator(propagation="ccc", ccc_threads=2)
+    enable, _ = build_ring_oscillator(sim, inverters=4)
+    sim.build_topology()
+    enable.set_value(LogicValue.ZERO)
+    sim.tick()
+    enable.set_value(LogicValue.ONE)
+    with pytest.raises(OscillationError) as info:
+        sim.tick()
+    assert info.value.oscillation.period > 0
+    assert len(info.value.oscillation.nets) >= 5
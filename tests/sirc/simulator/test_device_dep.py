@@ -1,5 +1,6 @@
 """Unit tests for Device Simulator Dependency module."""
 
+import pytest
 from sirc.core import LogicValue, NodeKind, LogicDeviceKind, TransistorKind
 from sirc.simulator import (
     IdentificationFactory,
@@ -46,6 +47,32 @@ def test_identification_factory_counters_are_independent():
         assert factory.allocate_transistor_id() == i
 
 
+def test_identification_factory_allocates_id_ranges():
+    """Range allocation must continue the same counters as single ids."""
+    factory = IdentificationFactory()
+    assert factory.allocate_node_id() == 0
+    assert factory.allocate_node_ids(5) == range(1, 6)
+    assert factory.allocate_node_id() == 6
+    assert factory.allocate_device_ids(3) == range(0, 3)
+    assert factory.allocate_transistor_ids(0) == range(0, 0)
+    assert factory.allocate_transistor_id() == 0
+
+
+def test_identification_factory_rejects_negative_counts():
+    """Negative range sizes must raise without moving any counter."""
+    factory = IdentificationFactory()
+    for allocate in (
+        factory.allocate_node_ids,
+        factory.allocate_device_ids,
+        factory.allocate_transistor_ids,
+    ):
+        with pytest.raises(ValueError):
+            allocate(-3)
+    assert factory.allocate_node_id() == 0
+    assert factory.allocate_device_id() == 0
+    assert factory.allocate_transistor_id() == 0
+
+
 # ------------------------------------------------------------------------------
 # Node Factory Tests
 # ------------------------------------------------------------------------------
@@ -173,8 +200,26 @@ def test_logic_device_factory_ids_are_shared():
     assert port.id_ == 4
 
 
-# ------------------------------------------------------------------------------
-# Transistor Factory Tests
+def test_logic_device_factory_creates_port_batches():
+    """create_ports must append n Ports in id order with their terminals."""
+    id_factory = IdentificationFactory()
+    node_factory = NodeFactory(id_factory)
+    device_factory = LogicDeviceFactory(id_factory, node_factory)
+    first = device_factory.create_port()
+    ports = device_factory.create_ports(4)
+    state = node_factory.state
+    assert ports.ids == range(1, 5)
+    assert ports.nodes == range(1, 5)
+    assert len(ports) == 4 and len(state.devices) == len(state.device_kinds) == 5
+    for device_id, port in zip(ports.ids, ports):
+        assert port is state.devices[device_id]
+        assert port.kind is LogicDeviceKind.PORT
+        assert port.node.kind is NodeKind.BASE
+        assert port.node.default_value is LogicValue.Z
+    assert ports[-1].id_ == 4 and [p.id_ for p in ports[1:3]] == [2, 3]
+    assert first.node.id_ == 0
+
+
 # ------------------------------------------------------------------------------
 
 
@@ -235,3 +280,119 @@ def test_transistor_factory_ids_are_shared():
     assert b.id_ == 1
     assert c.id_ == 2
     assert d.id_ == 3
+
+
+def test_transistor_factory_creates_batches_like_single_creation():
+    """Batch creation must lay out records exactly like repeated create_*."""
+    id_factory = IdentificationFactory()
+    node_factory = NodeFactory(id_factory)
+    transistor_factory = TransistorFactory(id_factory, node_factory)
+    single = TransistorFactory(
+        IdentificationFactory(), NodeFactory(IdentificationFactory())
+    )
+    transistor_factory.create_pmos()
+    nmos = transistor_factory.create_nmos_batch(3)
+    pmos = transistor_factory.create_pmos_batch(2)
+    single.create_pmos()
+    for _ in range(3):
+        single.create_nmos()
+    for _ in range(2):
+        single.create_pmos()
+    assert nmos.ids == range(1, 4) and pmos.ids == range(4, 6)
+    assert nmos.gates == range(3, 12, 3)
+    assert nmos.sources == range(4, 12, 3)
+    assert pmos.drains == range(14, 18, 3)
+    state = node_factory.state
+    expected = single._node_f.state  # pylint: disable=protected-access
+    for name in (
+        "node_kinds",
+        "node_default_values",
+        "transistor_kinds",
+        "transistor_gates",
+        "transistor_sources",
+        "transistor_drains",
+        "transistor_conducting",
+    ):
+        assert list(getattr(state, name)) == list(getattr(expected, name))
+    assert [t.kind for t in pmos] == [TransistorKind.PMOS] * 2
+    assert nmos[0].gate.id_ == nmos.gates[0]
+
+
+def test_batch_creation_rejects_negative_counts():
+    """Negative batch sizes must raise before any record is appended."""
+    id_factory = IdentificationFactory()
+    node_factory = NodeFactory(id_factory)
+    device_factory = LogicDeviceFactory(id_factory, node_factory)
+    transistor_factory = TransistorFactory(id_factory, node_factory)
+    with pytest.raises(ValueError):
+        device_factory.create_ports(-3)
+    for create in (
+        transistor_factory.create_nmos_batch,
+        transistor_factory.create_pmos_batch,
+    ):
+        with pytest.raises(ValueError):
+            create(-3)
+    state = node_factory.state
+    assert len(state.nodes) == len(state.devices) == len(state.transistors) == 0
+    assert len(state.transistor_conducting) == 0
+    assert device_factory.create_port().id_ == 0
+    assert transistor_factory.create_nmos().id_ == 0
+
+
+# ------------------------------------------------------------------------------
+# Handle Table Tests
+# ------------------------------------------------------------------------------
+
+
+def test_handle_tables_materialize_handles_lazily():
+    """Batch creation must not build handles; lookups build and reuse them."""
+    id_factory = IdentificationFactory()
+    node_factory = NodeFactory(id_factory)
+    transistor_factory = TransistorFactory(id_factory, node_factory)
+    device_factory = LogicDeviceFactory(id_factory, node_factory)
+    batch = transistor_factory.create_nmos_batch(4)
+    ports = device_factory.create_ports(2)
+    state = node_factory.state
+    # pylint: disable=protected-access
+    assert len(state.transistors._cache) == 0 and len(state.nodes._cache) == 0
+    assert len(state.nodes) == 14 and len(state.transistors) == 4
+    transistor = state.transistors[-1]
+    assert transistor.id_ == 3 and transistor.kind is TransistorKind.NMOS
+    assert transistor is state.transistors[3] is batch[3]
+    assert transistor.gate is state.nodes[batch.gates[3]]
+    assert [d.id_ for d in state.devices] == list(ports.ids)
+    assert [n.id_ for n in state.nodes[12:]] == list(ports.nodes)
+    with pytest.raises(IndexError):
+        state.nodes[14]  # pylint: disable=pointless-statement
+
+
+def test_handle_tables_drop_unreferenced_handles():
+    """Handles no longer referenced must not be kept alive by the cache."""
+    node_factory = NodeFactory(IdentificationFactory())
+    node = node_factory.create_base_node()
+    state = node_factory.state
+    node_id = node.id_
+    assert state.nodes[node_id] is node
+    del node
+    # pylint: disable=protected-access
+    assert node_id not in state.nodes._cache
+    assert state.nodes[node_id].id_ == node_id
+
+
+def test_handle_table_cache_shrinks_when_handles_die():
+    """Dropping handles must remove their cache entries, not leave dead refs."""
+    id_factory = IdentificationFactory()
+    node_factory = NodeFactory(id_factory)
+    transistor_factory = TransistorFactory(id_factory, node_factory)
+    transistor_factory.create_nmos_batch(1000)
+    state = node_factory.state
+    # pylint: disable=protected-access
+    handles = list(state.nodes)
+    kept = handles[::2]
+    assert len(state.nodes._cache) == 3000
+    del handles
+    assert len(state.nodes._cache) == 1500
+    transistors = list(state.transistors)
+    del transistors
+    assert len(state.transistors._cache) == 0
+    assert all(state.nodes[node.id_] is node for node in kept)
@@ -1,198 +1,633 @@
-# """Unit tests for sirc.simulator.device module."""
-
-# from sirc.simulator.device import DeviceSimulator
-# from sirc.core.logic import LogicValue
-# from sirc.core.node import Node
-# from sirc.core.device import LogicDevice, VDD, GND, Input, Probe, Port
-# from sirc.core.transistor import Transistor, NMOS, PMOS
-
-# # ------------------------------------------------------------------------------
-# # Simulator Construction Tests
-# # ------------------------------------------------------------------------------
-
-
-# def test_simulator_initial_state():
-#     """Simulator must start with no devices, no transistors, and no nodes."""
-#     sim = DeviceSimulator()
-#     assert not sim._devices
-#     assert not sim._transistors
-#     assert not sim._nodes
-
-
-# # ------------------------------------------------------------------------------
-# # Device Registration Tests
-# # ------------------------------------------------------------------------------
-
-
-# def test_register_single_device():
-#     """Registering a single device adds it and its terminal node."""
-#     sim = DeviceSimulator()
-#     vdd = VDD()
-#     sim.register_device(vdd)
-#     assert vdd in sim._devices
-#     assert vdd.terminal in sim._nodes
-
-
-# def test_register_multiple_devices():
-#     """Registering multiple devices adds them and their terminal nodes."""
-#     sim = DeviceSimulator()
-#     devices: list[LogicDevice] = [VDD(), GND(), Input(), Probe(), Port()]
-#     sim.register_devices(devices)
-#     for d in devices:
-#         assert d in sim._devices
-#         assert d.terminal in sim._nodes
-
-
-# def test_unregister_signle_device():
-#     """Unregistering a single device removes it and its terminal node."""
-#     sim = DeviceSimulator()
-#     gnd = GND()
-#     sim.register_device(gnd)
-#     sim.unregister_device(gnd)
-#     assert gnd not in sim._devices
-#     assert gnd.terminal not in sim._nodes
-
-
-# def test_unregister_multiple_devices():
-#     """Unregistering multiple devices removes them and their terminal nodes."""
-#     sim = DeviceSimulator()
-#     devices: list[LogicDevice] = [VDD(), GND(), Input(), Probe(), Port()]
-#     sim.register_devices(devices)
-#     sim.unregister_devices(devices)
-#     for d in devices:
-#         assert d not in sim._devices
-#         assert d.terminal not in sim._nodes
-
-
-# def test_register_single_transistor():
-#     """Registering a transistor adds it and its terminal nodes."""
-#     sim = DeviceSimulator()
-#     nmos = NMOS()
-#     sim.register_transistor(nmos)
-#     assert nmos in sim._transistors
-#     assert nmos.gate in sim._nodes
-#     assert nmos.source in sim._nodes
-#     assert nmos.drain in sim._nodes
-
-
-# def test_register_multiple_transistors():
-#     """Registering multiple transistors adds them and their terminal nodes."""
-#     sim = DeviceSimulator()
-#     transistors: list[Transistor] = [NMOS(), PMOS()]
-#     sim.register_transistors(transistors)
-#     for t in transistors:
-#         assert t in sim._transistors
-#         assert t.gate in sim._nodes
-#         assert t.source in sim._nodes
-#         assert t.drain in sim._nodes
-
-
-# def test_unregister_single_transistor():
-#     """Unregistering a transistor removes it and its terminal nodes."""
-#     sim = DeviceSimulator()
-#     pmos = PMOS()
-#     sim.register_transistor(pmos)
-#     sim.unregister_transistor(pmos)
-#     assert pmos not in sim._transistors
-#     assert pmos.gate not in sim._nodes
-#     assert pmos.source not in sim._nodes
-#     assert pmos.drain not in sim._nodes
-
-
-# def test_unregister_multiple_transistors():
-#     """Unregistering multiple transistors removes them and their terminal nodes."""
-#     sim = DeviceSimulator()
-#     transistors: list[Transistor] = [NMOS(), PMOS()]
-#     sim.register_transistors(transistors)
-#     sim.unregister_transistors(transistors)
-#     for t in transistors:
-#         assert t not in sim._transistors
-#         assert t.gate not in sim._nodes
-#         assert t.source not in sim._nodes
-#         assert t.drain not in sim._nodes
-
-
-# # ------------------------------------------------------------------------------
-# # Connectivity Tests
-# # ------------------------------------------------------------------------------
-
-
-# def test_connect_creates_bidirectional_connection():
-#     """Connecting two nodes creates a bidirectional connection."""
-#     sim = DeviceSimulator()
-#     a = Node()
-#     b = Node()
-#     sim.connect(a, b)
-#     assert a in b.get_connections()
-#     assert b in a.get_connections()
-
-
-# def test_disconnect_removes_bidirectional_connection():
-#     """Disconnecting two nodes removes the bidirectional connection."""
-#     sim = DeviceSimulator()
-#     a = Node()
-#     b = Node()
-#     sim.connect(a, b)
-#     sim.disconnect(a, b)
-#     assert a not in b.get_connections()
-#     assert b not in a.get_connections()
-
-
-# # ------------------------------------------------------------------------------
-# # Static Behavior Tick Tests
-# # ------------------------------------------------------------------------------
-
-
-# def test_tick_with_simple_devices():
-#     """Devices must drive their terminal Nodes after a tick()."""
-#     sim = DeviceSimulator()
-#     inp = Input()
-#     probe = Probe()
-#     sim.register_devices([inp, probe])
-#     sim.connect(inp.terminal, probe.terminal)
-#     inp.set_value(LogicValue.ONE)
-#     sim.build_topology()
-#     sim.tick()
-#     assert probe.sample() is LogicValue.ONE
-#     inp.set_value(LogicValue.ZERO)
-#     sim.build_topology()
-#     sim.tick()
-#     assert probe.sample() is LogicValue.ZERO
-
-
-# # ------------------------------------------------------------------------------
-# # Dynamic Behavior Tick Tests
-# # ------------------------------------------------------------------------------
-
-
-# def test_tick_cmos_inverter():
-#     """CMOS inverter must function correctly."""
-#     sim = DeviceSimulator()
-#     vdd = VDD()
-#     gnd = GND()
-#     inp = Input()
-#     probe = Probe()
-#     inp_port = Port()
-#     out_port = Port()
-#     pmos = PMOS()
-#     nmos = NMOS()
-#     sim.register_devices([vdd, gnd, inp, probe, inp_port, out_port])
-#     sim.register_transistors([pmos, nmos])
-#     sim.connect(inp.terminal, inp_port.terminal)
-#     sim.connect(inp_port.terminal, pmos.gate)
-#     sim.connect(inp_port.terminal, nmos.gate)
-#     sim.connect(vdd.terminal, pmos.source)
-#     sim.connect(gnd.terminal, nmos.source)
-#     sim.connect(pmos.drain, out_port.terminal)
-#     sim.connect(nmos.drain, out_port.terminal)
-#     sim.connect(out_port.terminal, probe.terminal)
-#     # Input = 0 → Probe = 1
-#     inp.set_value(LogicValue.ZERO)
-#     sim.build_topology()
-#     sim.tick()
-#     assert probe.sample() is LogicValue.ONE
-#     # Input = 1 → Probe = 0
-#     inp.set_value(LogicValue.ONE)
-#     sim.build_topology()
-#     sim.tick()
-#     assert probe.sample() is LogicValue.ZERO
+"""Unit tests for Device Simulator module."""
+
+import random
+from array import array
+import pytest
+from sirc.core import LogicValue, Node, Input, Probe, Port
+from sirc.simulator import DeviceSimulator
+
+PROPAGATION_MODES = ("event", "sweep", "ccc")
+EDGE_STORAGES = ("aos", "soa", "psoa")
+
+
+def build_cmos_inverter(sim: DeviceSimulator) -> tuple[Input, Probe]:
+    """Build a CMOS inverter and return its Input and Probe devices."""
+    vdd = sim.create_vdd()
+    gnd = sim.create_gnd()
+    inp = sim.create_input()
+    probe = sim.create_probe()
+    inp_port = sim.create_port()
+    out_port = sim.create_port()
+    pmos = sim.create_pmos()
+    nmos = sim.create_nmos()
+    sim.connect(inp.node, inp_port.node)
+    sim.connect(inp_port.node, pmos.gate)
+    sim.connect(inp_port.node, nmos.gate)
+    sim.connect(vdd.node, pmos.source)
+    sim.connect(gnd.node, nmos.source)
+    sim.connect(pmos.drain, out_port.node)
+    sim.connect(nmos.drain, out_port.node)
+    sim.connect(out_port.node, probe.node)
+    return inp, probe
+
+
+def build_inverter_chain(sim: DeviceSimulator, n: int) -> tuple[Input, Probe]:
+    """Build an n-stage CMOS inverter chain and return its Input and Probe."""
+    vdd = sim.create_vdd()
+    gnd = sim.create_gnd()
+    inp = sim.create_input()
+    probe = sim.create_probe()
+    current: Node = inp.node
+    for _ in range(n):
+        pmos = sim.create_pmos()
+        nmos = sim.create_nmos()
+        sim.connect(current, pmos.gate)
+        sim.connect(current, nmos.gate)
+        sim.connect(vdd.node, pmos.source)
+        sim.connect(gnd.node, nmos.source)
+        sim.connect(pmos.drain, nmos.drain)
+        current = pmos.drain
+    sim.connect(current, probe.node)
+    return inp, probe
+
+
+def build_random_circuit(
+    sim: DeviceSimulator, seed: int, inputs: int = 4, cells: int = 16
+) -> list[Input]:
+    """
+    Build a reproducible random netlist of complementary CMOS cells.
+
+    Each INV, NAND2, or NOR2 cell reads earlier nets only, so the netlist is
+    feed-forward and every tick settles.
+    """
+    rng = random.Random(seed)
+    vdd = sim.create_vdd()
+    gnd = sim.create_gnd()
+    devices = [sim.create_input() for _ in range(inputs)]
+    nets: list[Node] = [d.node for d in devices]
+    for _ in range(cells):
+        out = sim.create_port().node
+        a, b = rng.choice(nets), rng.choice(nets)
+        cell = rng.choice(("inv", "nand", "nor"))
+        if cell == "inv":
+            for t, rail in ((sim.create_pmos(), vdd), (sim.create_nmos(), gnd)):
+                sim.connect(a, t.gate)
+                sim.connect(rail.node, t.source)
+                sim.connect(t.drain, out)
+        else:
+            parallel, series = (vdd, gnd) if cell == "nand" else (gnd, vdd)
+            make_parallel = sim.create_pmos if cell == "nand" else sim.create_nmos
+            make_series = sim.create_nmos if cell == "nand" else sim.create_pmos
+            for gate in (a, b):
+                t = make_parallel()
+                sim.connect(gate, t.gate)
+                sim.connect(parallel.node, t.source)
+                sim.connect(t.drain, out)
+            first, second = make_series(), make_series()
+            sim.connect(a, first.gate)
+            sim.connect(b, second.gate)
+            sim.connect(series.node, first.source)
+            sim.connect(first.drain, second.source)
+            sim.connect(second.drain, out)
+        nets.append(out)
+    return devices
+
+
+def build_random_switch_network(
+    sim: DeviceSimulator, seed: int, inputs: int = 6, transistors: int = 40
+) -> list[Input]:
+    """
+    Build a reproducible random pass-transistor network and return its Inputs.
+
+    Gates read Inputs only while channels join ports and rails arbitrarily,
+    so every conduction pattern, including shorts, settles in one pass.
+    """
+    rng = random.Random(seed)
+    devices = [sim.create_input() for _ in range(inputs)]
+    nets = [sim.create_vdd().node, sim.create_gnd().node]
+    nets += [sim.create_port().node for _ in range(transistors // 3)]
+    for _ in range(transistors):
+        t = sim.create_nmos() if rng.random() < 0.5 else sim.create_pmos()
+        sim.connect(rng.choice(devices).node, t.gate)
+        sim.connect(rng.choice(nets), t.source)
+        sim.connect(rng.choice(nets), t.drain)
+    return devices
+
+
+def assert_matches_sweep(
+    builder, seed: int, ticks: int = 12, propagation: str = "event"
+) -> None:
+    """Drive identical propagation and sweep simulators and compare every tick."""
+    rng = random.Random(seed)
+    sims = [DeviceSimulator(propagation=mode) for mode in (propagation, "sweep")]
+    inputs = [builder(sim, seed) for sim in sims]
+    for sim in sims:
+        sim.build_topology()
+    values = (LogicValue.ZERO, LogicValue.ONE, LogicValue.Z)
+    for _ in range(ticks):
+        stimulus = [rng.choice(values) for _ in inputs[0]]
+        for sim, devices in zip(sims, inputs):
+            for device, value in zip(devices, stimulus):
+                device.set_value(value)
+            sim.tick()
+        # pylint: disable=protected-access
+        state, sweep_state = (sim._state for sim in sims)
+        assert state.node_resolved_values == sweep_state.node_resolved_values
+        assert state.transistor_conducting == sweep_state.transistor_conducting
+
+
+# ------------------------------------------------------------------------------
+# Simulator Construction Tests
+# ------------------------------------------------------------------------------
+
+
+def test_simulator_rejects_unknown_propagation_mode():
+    """DeviceSimulator must reject unknown propagation modes."""
+    with pytest.raises(ValueError):
+        DeviceSimulator(propagation="bogus")
+
+
+def test_simulator_rejects_unknown_edge_storage():
+    """DeviceSimulator must reject unknown edge storages."""
+    with pytest.raises(ValueError):
+        DeviceSimulator(edge_storage="bogus")
+
+
+def test_create_devices_and_transistors_allocate_dense_ids():
+    """Creation must allocate dense IDs and terminal Nodes in order."""
+    sim = DeviceSimulator()
+    vdd = sim.create_vdd()
+    nmos = sim.create_nmos()
+    probe = sim.create_probe()
+    assert vdd.id_ == 0
+    assert vdd.node.id_ == 0
+    assert nmos.id_ == 0
+    assert (nmos.gate.id_, nmos.source.id_, nmos.drain.id_) == (1, 2, 3)
+    assert probe.id_ == 1
+    assert probe.node.id_ == 4
+
+
+# ------------------------------------------------------------------------------
+# Logical Connection Tests
+# ------------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("edge_storage", EDGE_STORAGES)
+def test_connect_and_disconnect_route_to_selected_storage(edge_storage: str):
+    """connect/disconnect must dedupe and swap-remove in the chosen storage."""
+    sim = DeviceSimulator(edge_storage=edge_storage)
+    ports = [sim.create_port() for _ in range(4)]
+    sim.connect(ports[1].node, ports[0].node)
+    sim.connect(ports[0].node, ports[1].node)
+    sim.connect(ports[2].node, ports[2].node)
+    sim.connect(ports[2].node, ports[3].node)
+    sim.connect(ports[0].node, ports[3].node)
+    sim.disconnect(ports[0].node, ports[1].node)
+    # pylint: disable=protected-access
+    state = sim._state
+    stored = {
+        "aos": list(state.wire_edges),
+        "soa": list(zip(state.wire_edge_a, state.wire_edge_b)),
+        "psoa": [(k >> 32, k & 0xFFFFFFFF) for k in state.wire_edge_keys],
+    }
+    assert stored.pop(edge_storage) == [(0, 3), (2, 3)]
+    assert all(not edges for edges in stored.values())
+
+
+# ------------------------------------------------------------------------------
+# Topology Compilation Tests
+# ------------------------------------------------------------------------------
+
+
+def test_build_topology_collapses_wired_nodes_into_nets():
+    """Statically wired Nodes must share one net with an OR of their drivers."""
+    sim = DeviceSimulator()
+    vdd = sim.create_vdd()
+    gnd = sim.create_gnd()
+    port = sim.create_port()
+    nmos = sim.create_nmos()
+    sim.connect(vdd.node, port.node)
+    sim.connect(port.node, nmos.gate)
+    sim.connect(gnd.node, nmos.source)
+    sim.build_topology()
+    # pylint: disable=protected-access
+    state = sim._state
+    assert len(state.net_nodes) == 3
+    assert state.node_nets[vdd.node.id_] == state.node_nets[nmos.gate.id_]
+    assert state.node_nets[gnd.node.id_] == state.node_nets[nmos.source.id_]
+    vdd_net = state.node_nets[vdd.node.id_]
+    gnd_net = state.node_nets[gnd.node.id_]
+    assert state.net_default_values[vdd_net] == LogicValue.ONE
+    assert state.net_default_values[gnd_net] == LogicValue.ZERO
+    assert state.transistor_gate_nets[nmos.id_] == vdd_net
+    assert state.transistor_source_nets[nmos.id_] == gnd_net
+
+
+def test_state_columns_are_compact_typed_arrays():
+    """Dense columns must be typed buffers with one machine value per item."""
+    sim = DeviceSimulator()
+    inp, probe = build_cmos_inverter(sim)
+    sim.build_topology()
+    inp.set_value(LogicValue.ZERO)
+    sim.tick()
+    state = sim.state
+    for name, itemsize in (
+        ("node_kinds", 1),
+        ("node_resolved_values", 1),
+        ("device_nodes", 4),
+        ("transistor_gates", 4),
+        ("transistor_conducting", 1),
+        ("node_nets", 4),
+        ("net_resolved_values", 1),
+        ("transistor_drain_nets", 4),
+        ("net_fanout", 4),
+    ):
+        assert memoryview(getattr(state, name)).itemsize == itemsize, name
+    assert probe.sample() is LogicValue.ONE
+    assert list(state.transistor_conducting) == [1, 0]
+    assert sim.state.transistors[0].conducting is True
+
+
+def test_resolved_and_conducting_views_track_ticks_without_copies():
+    """The views must be read-only aliases of the live state columns."""
+    sim = DeviceSimulator()
+    inp, probe = build_cmos_inverter(sim)
+    sim.build_topology()
+    resolved = sim.resolved_view()
+    conducting = sim.conducting_view()
+    assert resolved.readonly and resolved.format == "B"
+    assert len(resolved) == len(sim.state.node_kinds)
+    out = sim.state.device_nodes[probe.id_]
+    for value, expected, flags in (
+        (LogicValue.ZERO, LogicValue.ONE, [1, 0]),
+        (LogicValue.ONE, LogicValue.ZERO, [0, 1]),
+    ):
+        inp.set_value(value)
+        sim.tick()
+        assert resolved[out] == expected
+        assert conducting.tolist() == flags
+    with pytest.raises(TypeError):
+        resolved[out] = LogicValue.X
+    node_count = len(sim.state.node_kinds)
+    with pytest.raises(BufferError):
+        sim.create_port()
+    assert len(sim.state.node_kinds) == node_count
+    resolved.release()
+    with pytest.raises(BufferError):
+        sim.create_nmos()
+    conducting.release()
+    assert sim.create_nmos().id_ == 2
+    assert sim.create_port().node.id_ == len(sim.state.node_kinds) - 1
+
+
+def test_failed_transistor_creation_leaves_no_records():
+    """A held view must make transistor creation fail without any record."""
+    sim = DeviceSimulator()
+    sim.create_nmos()
+    state = sim.state
+    counts = (len(state.node_kinds), len(state.transistor_kinds))
+    for view in (sim.resolved_view, sim.conducting_view):
+        held = view()
+        for create in (sim.create_nmos, lambda: sim.create_pmos_batch(3)):
+            with pytest.raises(BufferError):
+                create()
+            assert len(state.node_kinds) == len(state.node_resolved_values)
+            assert len(state.node_kinds) == counts[0]
+            assert len(state.transistor_kinds) == counts[1]
+            assert len(state.transistor_conducting) == counts[1]
+        held.release()
+    assert sim.create_pmos().gate.id_ == counts[0]
+    assert len(state.transistor_conducting) == counts[1] + 1
+
+
+def test_build_topology_builds_gate_fanout_index():
+    """The CSR gate-fanout index must list the transistors gated by each net."""
+    sim = DeviceSimulator()
+    inp = sim.create_input()
+    transistors = [sim.create_nmos(), sim.create_pmos(), sim.create_nmos()]
+    sim.connect(inp.node, transistors[0].gate)
+    sim.connect(inp.node, transistors[2].gate)
+    sim.build_topology()
+    # pylint: disable=protected-access
+    state = sim._state
+    offsets = state.net_fanout_offsets
+    assert len(offsets) == len(state.net_nodes) + 1
+    for net in range(len(state.net_nodes)):
+        gated = state.net_fanout[offsets[net] : offsets[net + 1]]
+        expected = [t.id_ for t in transistors if state.node_nets[t.gate.id_] == net]
+        assert sorted(gated) == expected
+    inp_net = state.node_nets[inp.node.id_]
+    assert state.net_fanout[offsets[inp_net] : offsets[inp_net + 1]].tolist() == [0, 2]
+
+
+def test_build_topology_builds_csr_adjacency():
+    """The CSR static adjacency and channel index must mirror the edges."""
+    sim = DeviceSimulator()
+    vdd = sim.create_vdd()
+    gnd = sim.create_gnd()
+    port = sim.create_port()
+    pmos = sim.create_pmos()
+    nmos = sim.create_nmos()
+    sim.connect(vdd.node, pmos.source)
+    sim.connect(pmos.drain, port.node)
+    sim.connect(port.node, nmos.drain)
+    sim.connect(gnd.node, nmos.source)
+    sim.build_topology()
+    # pylint: disable=protected-access
+    state = sim._state
+    offsets = state.static_offsets
+    assert offsets.typecode == "Q" and state.static_indices.typecode == "I"
+    assert len(offsets) == len(state.nodes) + 1
+    assert offsets[-1] == 2 * len(state.wire_edges)
+    for a, b in state.wire_edges:
+        assert b in state.static_indices[offsets[a] : offsets[a + 1]]
+        assert a in state.static_indices[offsets[b] : offsets[b + 1]]
+    port_net = state.node_nets[port.node.id_]
+    vdd_net = state.node_nets[vdd.node.id_]
+    channel_offsets = state.net_channel_offsets
+    lo, hi = channel_offsets[port_net], channel_offsets[port_net + 1]
+    assert sorted(state.net_channel_transistors[lo:hi]) == [pmos.id_, nmos.id_]
+    lo, hi = channel_offsets[vdd_net], channel_offsets[vdd_net + 1]
+    assert list(state.net_channel_transistors[lo:hi]) == [pmos.id_]
+    assert list(state.net_channel_peers[lo:hi]) == [port_net]
+
+
+# ------------------------------------------------------------------------------
+# Static Behavior Tick Tests
+# ------------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("propagation", PROPAGATION_MODES)
+def test_tick_with_simple_devices(propagation: str):
+    """Devices must drive their terminal Nodes after a tick()."""
+    sim = DeviceSimulator(propagation=propagation)
+    inp = sim.create_input()
+    probe = sim.create_probe()
+    sim.connect(inp.node, probe.node)
+    sim.build_topology()
+    inp.set_value(LogicValue.ONE)
+    sim.tick()
+    assert probe.sample() is LogicValue.ONE
+    inp.set_value(LogicValue.ZERO)
+    sim.tick()
+    assert probe.sample() is LogicValue.ZERO
+
+
+@pytest.mark.parametrize("propagation", PROPAGATION_MODES)
+def test_tick_conflicting_drivers_resolve_to_x(propagation: str):
+    """VDD and GND on the same node-group must resolve to X."""
+    sim = DeviceSimulator(propagation=propagation)
+    vdd = sim.create_vdd()
+    gnd = sim.create_gnd()
+    probe = sim.create_probe()
+    sim.connect(vdd.node, probe.node)
+    sim.connect(gnd.node, probe.node)
+    sim.build_topology()
+    sim.tick()
+    assert probe.sample() is LogicValue.X
+
+
+# ------------------------------------------------------------------------------
+# Dynamic Behavior Tick Tests
+# ------------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("propagation", PROPAGATION_MODES)
+def test_tick_cmos_inverter(propagation: str):
+    """CMOS inverter must function correctly."""
+    sim = DeviceSimulator(propagation=propagation)
+    inp, probe = build_cmos_inverter(sim)
+    sim.build_topology()
+    # Input = 0 → Probe = 1
+    inp.set_value(LogicValue.ZERO)
+    sim.tick()
+    assert probe.sample() is LogicValue.ONE
+    # Input = 1 → Probe = 0
+    inp.set_value(LogicValue.ONE)
+    sim.tick()
+    assert probe.sample() is LogicValue.ZERO
+    # Input = Z → Probe = Z
+    inp.set_value(LogicValue.Z)
+    sim.tick()
+    assert probe.sample() is LogicValue.Z
+
+
+@pytest.mark.parametrize("edge_storage", EDGE_STORAGES)
+@pytest.mark.parametrize("propagation", PROPAGATION_MODES)
+@pytest.mark.parametrize("n", [1, 2, 7, 50])
+def test_tick_inverter_chain(propagation: str, edge_storage: str, n: int):
+    """An n-stage inverter chain must invert the input n times."""
+    sim = DeviceSimulator(propagation=propagation, edge_storage=edge_storage)
+    inp, probe = build_inverter_chain(sim, n)
+    sim.build_topology()
+    for value in (LogicValue.ONE, LogicValue.ZERO, LogicValue.ONE):
+        inp.set_value(value)
+        sim.tick()
+        expected = value if n % 2 == 0 else LogicValue(value ^ 0b011)
+        assert probe.sample() is expected
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_event_propagation_matches_sweep(seed: int):
+    """Event-driven propagation must settle to the same state as the sweep."""
+    assert_matches_sweep(build_random_circuit, seed)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_incremental_connectivity_matches_sweep(seed: int):
+    """Channel merges and re-splits must match a full component rebuild."""
+    assert_matches_sweep(build_random_switch_network, seed, ticks=30)
+
+
+def test_incremental_connectivity_reuses_released_components():
+    """Toggling a channel repeatedly must not grow the component table."""
+    sim = DeviceSimulator()
+    inp = sim.create_input()
+    vdd = sim.create_vdd()
+    probe = sim.create_probe()
+    nmos = sim.create_nmos()
+    sim.connect(inp.node, nmos.gate)
+    sim.connect(vdd.node, nmos.source)
+    sim.connect(nmos.drain, probe.node)
+    sim.build_topology()
+    for _ in range(10):
+        inp.set_value(LogicValue.ONE)
+        sim.tick()
+        assert probe.sample() is LogicValue.ONE
+        inp.set_value(LogicValue.ZERO)
+        sim.tick()
+        assert probe.sample() is LogicValue.Z
+    # pylint: disable=protected-access
+    assert len(sim._state.component_nets) <= 4
+
+
+# ------------------------------------------------------------------------------
+# Change Collection Tests
+# ------------------------------------------------------------------------------
+
+# (propagation, backend) pairs covering every tick engine.
+ENGINES = (
+    ("event", "python"),
+    ("sweep", "python"),
+    ("sweep", "bytes"),
+    ("sweep", "numpy"),
+    ("ccc", "python"),
+)
+
+
+@pytest.mark.parametrize("propagation, backend", ENGINES)
+def test_tick_reports_exactly_the_changed_nodes(propagation: str, backend: str):
+    """tick(changes="nodes") must match a before/after diff of every Node."""
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    rng = random.Random(5)
+    sim = DeviceSimulator(propagation=propagation, backend=backend)
+    inputs = build_random_circuit(sim, 5)
+    sim.build_topology()
+    first = sim.tick(changes="nodes")
+    assert isinstance(first, array)
+    assert sorted(first) == list(range(len(sim.state.node_kinds)))
+    values = (LogicValue.ZERO, LogicValue.ONE, LogicValue.Z, LogicValue.X)
+    for _ in range(30):
+        for device in inputs:
+            device.set_value(rng.choice(values))
+        before = array("B", sim.state.node_resolved_values)
+        changed = sim.tick(changes="nodes")
+        after = sim.state.node_resolved_values
+        expected = [i for i, (a, b) in enumerate(zip(before, after)) if a != b]
+        assert sorted(changed) == expected
+        assert changed is first
+    assert len(sim.tick(changes="nodes")) == 0
+
+
+@pytest.mark.parametrize("propagation", PROPAGATION_MODES)
+def test_tick_reports_changed_probes_in_id_order(propagation: str):
+    """tick(changes="probes") must return only the Probes that changed."""
+    sim = DeviceSimulator(propagation=propagation)
+    inp, out = build_cmos_inverter(sim)
+    watch_in = sim.create_probe()
+    sim.connect(inp.node, watch_in.node)
+    other, still = build_cmos_inverter(sim)
+    sim.build_topology()
+    other.set_value(LogicValue.ONE)
+    inp.set_value(LogicValue.ONE)
+    assert sim.tick(changes="probes") == [out, watch_in, still]
+    inp.set_value(LogicValue.ZERO)
+    assert sim.tick(changes="probes") == [out, watch_in]
+    assert sim.tick(changes="probes") == []
+    assert sim.tick() is None
+    with pytest.raises(ValueError):
+        sim.tick(changes="nets")
+
+
+# ------------------------------------------------------------------------------
+# Batch Stimulus Tests
+# ------------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("propagation", PROPAGATION_MODES)
+def test_run_vectors_matches_per_vector_ticks(propagation: str):
+    """run_vectors must return the raw samples a set/tick/sample loop sees."""
+    rng = random.Random(0)
+    values = (LogicValue.ZERO, LogicValue.ONE, LogicValue.Z, LogicValue.X)
+    sims = [DeviceSimulator(propagation=propagation) for _ in range(2)]
+    inputs = [build_random_circuit(sim, 3) for sim in sims]
+    probes = []
+    for sim in sims:
+        probe = sim.create_probe()
+        last_port = [d for d in sim.state.devices if isinstance(d, Port)][-1]
+        sim.connect(last_port.node, probe.node)
+        probes.append([probe])
+        sim.build_topology()
+    vectors = bytes(rng.choice(values) for _ in range(len(inputs[0]) * 25))
+    batch = sims[0].run_vectors(inputs[0], probes[0], vectors)
+    assert isinstance(batch, bytearray) and len(batch) == 25
+    expected = bytearray()
+    width = len(inputs[1])
+    for row in range(0, len(vectors), width):
+        for device, value in zip(inputs[1], vectors[row : row + width]):
+            device.set_value(value)
+        sims[1].tick()
+        expected.append(probes[1][0].sample())
+    assert batch == expected
+
+
+def test_run_vectors_rejects_ragged_vectors():
+    """run_vectors must reject buffers that are not whole rows."""
+    sim = DeviceSimulator()
+    inp, probe = build_cmos_inverter(sim)
+    sim.build_topology()
+    assert sim.run_vectors([inp], [probe], array("B", [1, 2])) == bytearray([2, 1])
+    with pytest.raises(ValueError):
+        sim.run_vectors([inp, inp], [probe], b"\x01\x02\x01")
+
+
+# ------------------------------------------------------------------------------
+# Bulk Connection Tests
+# ------------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("edge_storage", EDGE_STORAGES)
+def test_connect_many_matches_repeated_connect(edge_storage: str):
+    """connect_many/disconnect_many must leave the storage connect() would."""
+    rng = random.Random(edge_storage)
+    pairs = [(rng.randrange(12), rng.randrange(12)) for _ in range(60)]
+    removed = pairs[::3] + [(20, 21)]
+    bulk = DeviceSimulator(edge_storage=edge_storage)
+    single = DeviceSimulator(edge_storage=edge_storage)
+    for sim in (bulk, single):
+        sim.create_ports(24)
+    bulk.connect_many(array("I", [a for a, _ in pairs]), [b for _, b in pairs])
+    bulk.disconnect_many(
+        memoryview(array("q", [a for a, _ in removed])), [b for _, b in removed]
+    )
+    nodes = single.state.nodes
+    for a, b in pairs:
+        single.connect(nodes[a], nodes[b])
+    for a, b in removed:
+        single.disconnect(nodes[a], nodes[b])
+    for name in (
+        "wire_edges",
+        "wire_edge_index",
+        "wire_edge_a",
+        "wire_edge_b",
+        "wire_edge_keys",
+        "wire_edge_key_index",
+    ):
+        assert getattr(bulk.state, name) == getattr(single.state, name)
+
+
+def test_connect_many_builds_working_netlist():
+    """A netlist wired through id ranges and connect_many must simulate."""
+    sim = DeviceSimulator()
+    vdd = sim.create_vdd()
+    gnd = sim.create_gnd()
+    inp = sim.create_input()
+    probe = sim.create_probe()
+    pmos = sim.create_pmos_batch(3)
+    nmos = sim.create_nmos_batch(3)
+    outs = list(pmos.drains)
+    ins = [inp.node.id_] + outs[:-1]
+    sim.connect_many(
+        ins + ins + [vdd.node.id_] * 3 + [gnd.node.id_] * 3 + outs + [outs[-1]],
+        list(pmos.gates)
+        + list(nmos.gates)
+        + list(pmos.sources)
+        + list(nmos.sources)
+        + list(nmos.drains)
+        + [probe.node.id_],
+    )
+    sim.build_topology()
+    inp.set_value(LogicValue.ONE)
+    sim.tick()
+    assert probe.sample() is LogicValue.ZERO
+
+
+def test_connect_many_rejects_bad_columns():
+    """connect_many must reject ragged columns and unknown node ids."""
+    sim = DeviceSimulator()
+    sim.create_ports(2)
+    with pytest.raises(ValueError):
+        sim.connect_many([0, 1], [1])
+    with pytest.raises(ValueError):
+        sim.connect_many([0], [2])
@@ -0,0 +1,98 @@
+"""Unit tests for Sharded Runner module."""
+
+import random
+import pytest
+from sirc.core import LogicValue, Port
+from sirc.simulator import DeviceSimulator, ShardedRunner
+from sirc.simulator.convergence import OscillationError
+from .test_convergence import build_ring_oscillator
+from .test_device_sim import build_cmos_inverter, build_random_circuit
+
+
+def build_probed_circuit(propagation: str = "event"):
+    """Build a random CMOS netlist with a Probe on its last cell output."""
+    sim = DeviceSimulator(propagation=propagation)
+    inputs = build_random_circuit(sim, 5, inputs=5, cells=30)
+    last_port = [d for d in sim.state.devices if isinstance(d, Port)][-1]
+    probe = sim.create_probe()
+    sim.connect(last_port.node, probe.node)
+    sim.build_topology()
+    return sim, inputs, [probe]
+
+
+@pytest.mark.parametrize("propagation", ("event", "sweep", "ccc"))
+def test_sharded_runner_matches_run_vectors(propagation: str):
+    """Sharded batches must merge to the sequential run_vectors result."""
+    rng = random.Random(1)
+    vectors = bytes(rng.choice((1, 2)) for _ in range(5 * 120))
+    sim, inputs, probes = build_probed_circuit(propagation)
+    with ShardedRunner(sim, inputs, probes, workers=2) as runner:
+        sharded = runner.run(vectors, batch_size=7)
+        assert runner.run(vectors) == sharded
+    ref, ref_inputs, ref_probes = build_probed_circuit(propagation)
+    assert sharded == ref.run_vectors(ref_inputs, ref_probes, vectors)
+
+
+@pytest.mark.parametrize("propagation", ("event", "sweep", "ccc"))
+def test_sharded_runner_resets_every_batch(propagation: str):
+    """Every batch on one worker must start from the compiled state."""
+    sim = DeviceSimulator(propagation=propagation)
+    inp, probe = build_cmos_inverter(sim)
+    vdd = sim.create_vdd()
+    tied = sim.create_probe()
+    sim.connect(vdd.node, tied.node)
+    sim.build_topology()
+    vectors = bytes([1, 2, 2, 1, 1])
+    with ShardedRunner(sim, [inp], [probe, tied]) as runner:
+        sharded = runner.run(vectors, batch_size=1)
+    assert sharded[0::2] == bytearray([2, 1, 1, 2, 2])
+    assert sharded[1::2] == bytearray([LogicValue.ONE] * 5)
+
+
+@pytest.mark.parametrize("propagation", ("event", "sweep", "ccc"))
+def test_sharded_runner_shares_unticked_input_values(propagation: str):
+    """Input values set without a tick must reach every worker."""
+    sim = DeviceSimulator(propagation=propagation)
+    held, driven = sim.create_input(), sim.create_input()
+    probe = sim.create_probe()
+    sim.connect(held.node, probe.node)
+    sim.connect(driven.node, probe.node)
+    sim.build_topology()
+    held.set_value(LogicValue.ONE)
+    vectors = bytes([LogicValue.Z, LogicValue.ZERO, LogicValue.Z])
+    with ShardedRunner(sim, [driven], [probe], workers=2) as runner:
+        sharded = runner.run(vectors, batch_size=1)
+    assert sharded == bytearray([2, 4, 2])
+    assert sim.run_vectors([driven], [probe], vectors) == sharded
+
+
+@pytest.mark.parametrize("propagation", ("event", "sweep", "ccc"))
+def test_sharded_runner_forwards_oscillation_options(propagation: str):
+    """Workers must detect a ring oscillator as the original simulator would."""
+    sim = DeviceSimulator(propagation=propagation, on_oscillation="x")
+    enable, probes = build_ring_oscillator(sim)
+    sim.build_topology()
+    with ShardedRunner(sim, [enable], probes[:1], workers=2) as runner:
+        assert runner.run(bytes([1, 2, 1]), batch_size=3) == bytearray([2, 4, 2])
+    sim = DeviceSimulator(propagation=propagation, max_iterations=1000)
+    enable, probes = build_ring_oscillator(sim)
+    sim.build_topology()
+    with ShardedRunner(sim, [enable], probes[:1], workers=1) as runner:
+        with pytest.raises(OscillationError) as info:
+            runner.run(bytes([1, 2]), batch_size=2)
+    assert info.value.oscillation.period > 0
+
+
+def test_sharded_runner_rejects_bad_arguments():
+    """ShardedRunner must reject uncompiled netlists, workers and vectors."""
+    sim = DeviceSimulator()
+    inp, probe = build_cmos_inverter(sim)
+    with pytest.raises(ValueError):
+        ShardedRunner(sim, [inp], [probe])
+    sim.build_topology()
+    with pytest.raises(ValueError):
+        ShardedRunner(sim, [inp], [probe], workers=0)
+    with ShardedRunner(sim, [inp], [probe]) as runner:
+        assert runner.run(b"\x01\x02") == bytearray([2, 1])
+        with pytest.raises(ValueError):
+            runner.run(b"\x01\x02", batch_size=0)
@@ -0,0 +1,217 @@
+"""Unit tests for Tick Statistics module."""
+
+import pytest
+from sirc.core import LogicValue
+from sirc.simulator import DeviceSimulator, LatencyHistogram, TickStats
+from sirc.simulator.tick_stats import (
+    TICK_PHASES,
+    TICK_STAT_FIELDS,
+    PhaseTimer,
+)
+from .test_device_sim import build_inverter_chain
+
+
+def test_new_stats_are_zero_and_reset_zeroes():
+    """A fresh TickStats is all zeros, and reset returns to that."""
+    stats = TickStats()
+    assert stats.as_dict() == dict.fromkeys(TICK_STAT_FIELDS, 0)
+    stats.ticks = 3
+    stats.nodes_changed = 7
+    snapshot = stats.copy()
+    stats.reset()
+    assert stats == TickStats()
+    assert snapshot.ticks == 3 and snapshot.nodes_changed == 7
+    assert "nodes_changed=7" in repr(snapshot)
+
+
+@pytest.mark.parametrize("propagation", ("sweep", "event"))
+def test_inverter_chain_counts(propagation: str):
+    """Toggles, iterations and builds must follow a 5-stage chain flipping."""
+    sim = DeviceSimulator(propagation=propagation)
+    inp, _ = build_inverter_chain(sim, 5)
+    sim.build_topology()
+    inp.set_value(LogicValue.ONE)
+    sim.tick()
+    first = sim.stats
+    assert first.ticks == 1
+    assert first.transistors_toggled == 5
+    assert first.iterations >= 5
+    assert first.component_builds >= 1
+    assert first.components_built >= first.component_builds
+    assert first.largest_component >= 2
+    assert first.nodes_changed > 0
+
+    sim.reset_stats()
+    inp.set_value(LogicValue.ZERO)
+    sim.tick()
+    assert sim.stats.transistors_toggled == 10
+
+    sim.reset_stats()
+    sim.tick()
+    quiet = sim.stats
+    assert quiet.ticks == 1
+    assert quiet.transistors_toggled == quiet.nodes_changed == 0
+
+
+def test_engines_agree_on_changes():
+    """Sweep and event engines must count the same toggles and Node changes."""
+    sims = [DeviceSimulator(propagation=mode) for mode in ("sweep", "event")]
+    inputs = [build_inverter_chain(sim, 9)[0] for sim in sims]
+    for sim in sims:
+        sim.build_topology()
+    for value in (LogicValue.ONE, LogicValue.ZERO, LogicValue.Z, LogicValue.ONE):
+        for sim, inp in zip(sims, inputs):
+            inp.set_value(value)
+            sim.tick()
+    sweep, event = (sim.stats for sim in sims)
+    assert sweep.transistors_toggled == event.transistors_toggled
+    assert sweep.nodes_changed == event.nodes_changed
+
+
+@pytest.mark.parametrize(
+    "propagation, backend",
+    (("sweep", "bytes"), ("sweep", "numpy"), ("event", "python"), ("ccc", "python")),
+)
+def test_every_engine_records_every_counter(propagation: str, backend: str):
+    """No engine may leave a counter at 0 after a chain flips back and forth."""
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    sim = DeviceSimulator(propagation=propagation, backend=backend)
+    inp, _ = build_inverter_chain(sim, 5)
+    sim.build_topology()
+    for value in (LogicValue.ONE, LogicValue.ZERO):
+        inp.set_value(value)
+        sim.tick()
+    stats = sim.stats
+    assert all(stats.as_dict().values()), stats
+    assert stats.transistors_toggled == 15
+
+
+@pytest.mark.parametrize("backend", ("bytes", "numpy"))
+def test_vectorized_sweeps_count_like_python_sweep(backend: str):
+    """Vectorized sweeps must match the python sweep's per-tick counters."""
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    sims = [
+        DeviceSimulator(propagation="sweep", backend=name)
+        for name in ("python", backend)
+    ]
+    inputs = [build_inverter_chain(sim, 9)[0] for sim in sims]
+    for sim in sims:
+        sim.build_topology()
+    for value in (LogicValue.ONE, LogicValue.ZERO, LogicValue.Z, LogicValue.ONE):
+        for sim, inp in zip(sims, inputs):
+            inp.set_value(value)
+            sim.tick()
+    python, vectorized = (sim.stats for sim in sims)
+    assert vectorized.iterations == python.iterations
+    assert vectorized.transistors_toggled == python.transistors_toggled
+    assert vectorized.nodes_changed == python.nodes_changed
+    assert vectorized.largest_component == python.largest_component
+    if backend == "numpy":
+        assert vectorized == python
+
+
+def test_snapshot_is_detached_from_simulator():
+    """sim.stats must not change when the simulator keeps ticking."""
+    sim = DeviceSimulator()
+    inp, _ = build_inverter_chain(sim, 3)
+    sim.build_topology()
+    snapshot = sim.stats
+    inp.set_value(LogicValue.ONE)
+    sim.tick()
+    assert snapshot == TickStats()
+    assert sim.stats.ticks == 1
+
+
+@pytest.mark.parametrize("propagation", ("event", "sweep", "ccc"))
+def test_run_vectors_counts_every_vector(propagation: str):
+    """run_vectors must count one tick per vector in every engine."""
+    sim = DeviceSimulator(propagation=propagation)
+    inp, probe = build_inverter_chain(sim, 4)
+    sim.build_topology()
+    sim.run_vectors([inp], [probe], bytes([1, 2, 1, 2, 2]))
+    stats = sim.stats
+    assert stats.ticks == 5
+    assert stats.iterations > 0
+    assert stats.nodes_changed > 0
+
+
+def test_histogram_percentiles_are_bucket_accurate():
+    """Percentiles must land within a quarter of the true sample."""
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) == 0
+    for ns in range(1, 1001):
+        histogram.record(ns * 1000)
+    assert histogram.count == 1000
+    assert histogram.total == sum(range(1, 1001)) * 1000
+    assert histogram.max == 1_000_000
+    assert 500_000 <= histogram.percentile(50) <= 625_000
+    assert 990_000 <= histogram.percentile(99) <= 1_000_000
+    assert histogram.percentile(100) == 1_000_000
+    with pytest.raises(ValueError):
+        histogram.percentile(0)
+    snapshot = histogram.copy()
+    histogram.reset()
+    assert histogram.count == histogram.max == 0 and not any(histogram.counts)
+    assert snapshot.count == 1000
+
+
+def test_timing_is_off_by_default():
+    """Without enable_timing there are no timings and no timed tick."""
+    sim = DeviceSimulator()
+    inp, _ = build_inverter_chain(sim, 3)
+    sim.build_topology()
+    inp.set_value(LogicValue.ONE)
+    sim.tick()
+    assert sim.timings is None
+    # pylint: disable=protected-access
+    assert sim._tick_function() == sim._tick_event
+    assert sim._phase_timer is None
+    # Timing installs the hook, not another tick loop.
+    sim.enable_timing()
+    assert sim._tick_function() == sim._tick_event
+    assert isinstance(sim._phase_timer, PhaseTimer)
+    sim.enable_timing(False)
+    assert sim._phase_timer is None
+
+
+@pytest.mark.parametrize("propagation", ("sweep", "event"))
+def test_phase_timings_cover_the_tick(propagation: str):
+    """Each timed tick adds one sample per phase, bounded by the whole tick."""
+    sim = DeviceSimulator(propagation=propagation)
+    sim.enable_timing()
+    inp, probe = build_inverter_chain(sim, 6)
+    sim.build_topology()
+    for value in (LogicValue.ONE, LogicValue.ZERO, LogicValue.ONE):
+        inp.set_value(value)
+        sim.tick()
+    assert probe.sample() is LogicValue.ONE
+    phases = sim.timings.phases
+    assert list(phases) == list(TICK_PHASES)
+    assert all(histogram.count == 3 for histogram in phases.values())
+    assert phases["tick"].total >= sum(
+        phases[phase].total for phase in TICK_PHASES[:-1]
+    )
+    assert phases["component_build"].total > 0
+    assert "resolution" in sim.timings.report()
+
+    sim.reset_stats()
+    assert all(histogram.count == 0 for histogram in sim.timings.phases.values())
+    sim.enable_timing(False)
+    assert sim.timings is None
+
+
+@pytest.mark.parametrize(
+    "propagation, backend", (("ccc", "python"), ("sweep", "bytes"))
+)
+def test_engines_without_phases_time_whole_ticks(propagation: str, backend: str):
+    """The ccc engine and vectorized sweeps only record the tick phase."""
+    sim = DeviceSimulator(propagation=propagation, backend=backend)
+    sim.enable_timing()
+    inp, probe = build_inverter_chain(sim, 4)
+    sim.build_topology()
+    sim.run_vectors([inp], [probe], bytes([1, 2, 1]))
+    phases = sim.timings.phases
+    assert phases["tick"].count == 3
+    assert all(phases[phase].count == 0 for phase in TICK_PHASES[:-1])
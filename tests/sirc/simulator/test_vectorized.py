@@ -0,0 +1,106 @@
+"""Unit tests for Vectorized Sweep module."""
+
+import random
+import pytest
+from sirc.core import LogicValue
+from sirc.core.logic_value import RESOLVE_TABLE
+from sirc.simulator import DeviceSimulator
+from sirc.simulator import vectorized
+from .test_device_sim import (
+    build_cmos_inverter,
+    build_inverter_chain,
+    build_random_circuit,
+    build_random_switch_network,
+)
+
+VALUES = (LogicValue.ZERO, LogicValue.ONE, LogicValue.Z, LogicValue.X)
+
+
+def assert_backend_matches_python(
+    builder, seed: int, backend: str, ticks: int = 12
+) -> None:
+    """Drive identical python and backend sweeps and compare every tick."""
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    rng = random.Random(seed)
+    sims = [
+        DeviceSimulator(propagation="sweep", backend=name)
+        for name in ("python", backend)
+    ]
+    inputs = [builder(sim, seed) for sim in sims]
+    for sim in sims:
+        sim.build_topology()
+    for _ in range(ticks):
+        stimulus = [rng.choice(VALUES) for _ in inputs[0]]
+        for sim, devices in zip(sims, inputs):
+            for device, value in zip(devices, stimulus):
+                device.set_value(value)
+            sim.tick()
+        python_state, backend_state = (sim.state for sim in sims)
+        for name in (
+            "node_resolved_values",
+            "net_resolved_values",
+            "transistor_conducting",
+        ):
+            assert getattr(python_state, name) == getattr(backend_state, name)
+
+
+def test_backend_validation_and_fallback(monkeypatch):
+    """Unknown backends raise; numpy falls back to python without NumPy."""
+    with pytest.raises(ValueError):
+        DeviceSimulator(backend="cuda")
+    assert DeviceSimulator().backend == "python"
+    # pylint: disable=import-outside-toplevel
+    from sirc.simulator import device_sim
+
+    monkeypatch.setattr(device_sim, "HAS_NUMPY", False)
+    sim = DeviceSimulator(propagation="sweep", backend="numpy")
+    assert sim.backend == "python"
+    inp, probe = build_cmos_inverter(sim)
+    sim.build_topology()
+    inp.set_value(LogicValue.ONE)
+    sim.tick()
+    assert probe.sample() is LogicValue.ZERO
+    monkeypatch.setattr(vectorized, "np", None)
+    with pytest.raises(RuntimeError):
+        vectorized.tick_sweep_numpy(sim.state, (2, 1))
+
+
+@pytest.mark.parametrize("backend", ("bytes", "numpy"))
+def test_backend_inverter_chain(backend: str):
+    """A vectorized sweep must settle an inverter chain and keep views in sync."""
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+        assert vectorized.HAS_NUMPY
+    sim = DeviceSimulator(propagation="sweep", backend=backend)
+    assert sim.backend == backend
+    inp, probe = build_inverter_chain(sim, 7)
+    sim.build_topology()
+    resolved = sim.resolved_view()
+    out = sim.state.device_nodes[probe.id_]
+    for value, expected in ((LogicValue.ZERO, LogicValue.ONE), (2, 1)):
+        inp.set_value(value)
+        sim.tick()
+        assert resolved[out] == expected
+    results = sim.run_vectors([inp], [probe], bytes([1, 2, 0]))
+    assert list(results) == [2, 1, 0]
+
+
+def test_resolve_bytes_matches_resolve_table():
+    """RESOLVE_BYTES must translate every driver mask like RESOLVE_TABLE."""
+    masks = bytes(range(8))
+    assert masks.translate(vectorized.RESOLVE_BYTES) == bytes(RESOLVE_TABLE)
+
+
+@pytest.mark.parametrize("backend", ("bytes", "numpy"))
+@pytest.mark.parametrize("seed", range(6))
+def test_backend_random_circuit_matches_python(backend: str, seed: int):
+    """Random CMOS netlists must settle identically on every backend."""
+    assert_backend_matches_python(build_random_circuit, seed, backend)
+
+
+@pytest.mark.parametrize("backend", ("bytes", "numpy"))
+@pytest.mark.parametrize("seed", range(6))
+def test_backend_switch_network_matches_python(backend: str, seed: int):
+    """Random pass-transistor networks must settle identically on every backend."""
+    assert_backend_matches_python(build_random_switch_network, seed, backend)